@@ -1,13 +1,28 @@
 import pygame as pg
-import sys, random, math, array
+import os, sys, time, random, math, array
+from vibe_text import TEXT
+from vibe_prof import PROF
+from brick_grid import BrickGrid
+from ballphys import Balls
+from brick_layer import BrickLayer
+from vibe_display import Display
+from vibe_capture import Capture
 
 # ----------------------- AUDIO CONFIG & SYNTH ------------------------
 SAMPLE_RATE   = 44100          # Hz
 pg.mixer.pre_init(SAMPLE_RATE, -16, 1)   # mono, 16‑bit signed
 pg.init()
 
+try:                                      # NumPy bulk synth + .npy cache
+    from chipsynth import SynthBank        # (set VIBE_SFX_CACHE=dir to persist)
+    SFX_BANK = SynthBank(SAMPLE_RATE, 1, os.environ.get("VIBE_SFX_CACHE"))
+except ImportError:
+    SFX_BANK = None
+
 def synth_tone(freq=440.0, ms=100, volume=0.5):
     """Generate a pygame Sound containing a simple sine‑wave beep."""
+    if SFX_BANK:
+        return SFX_BANK.sound("sine", freq, ms, volume)
     n_samples = int(SAMPLE_RATE * ms / 1000)
     buf = array.array("h")
     amplitude = int(volume * 32767)
@@ -39,46 +54,53 @@ BRICK_COLORS  = [(255, 77, 77), (255, 122, 66), (255, 205, 66),
                  (122, 255, 66), (66, 239, 255), (140, 122, 255)]
 FONT_COLOR    = (250, 250, 250)
 
-screen  = pg.display.set_mode((W, H))
+display = Display((W, H))        # VIBE_DISPLAY=2160p etc: see vibe_display.py
+screen  = display.surface
+capture = Capture.from_env(screen)   # VIBE_CAPTURE=out.vcap: see vibe_capture.py
+pg.display.set_caption("Breakout 4K")
 clock   = pg.time.Clock()
 font    = pg.font.SysFont("consolas", 24, bold=True)
 
 # ------------------------- BUILD BRICK GRID --------------------------
 BRICK_W = (W - BRICK_GAP * (BRICK_COLS + 1)) // BRICK_COLS
 BRICK_H = 25
-bricks  = []
 top_offset = 60
-for row in range(BRICK_ROWS):
-    for col in range(BRICK_COLS):
-        x = BRICK_GAP + col * (BRICK_W + BRICK_GAP)
-        y = top_offset + row * (BRICK_H + BRICK_GAP)
-        bricks.append((pg.Rect(x, y, BRICK_W, BRICK_H),
-                      BRICK_COLORS[row % len(BRICK_COLORS)]))
+bricks  = BrickGrid(BRICK_ROWS, BRICK_COLS, BRICK_W, BRICK_H, BRICK_GAP,
+                    top_offset, BRICK_COLORS)
 
 # --------------------- PADDLE, BALL & GAME STATE ---------------------
 paddle   = pg.Rect((W - PADDLE_W)//2, H - 60, PADDLE_W, PADDLE_H)
-ball_pos = pg.Vector2(paddle.centerx, paddle.top - BALL_R - 1)
-ball_vel = pg.Vector2(random.choice([-1, 1]), -1).normalize() * BALL_SPEED
+balls    = Balls(BALL_R)          # every live ball, stepped as one batch
 playing, won = True, False
 
+# cached render: persistent brick layer + dirty rects (F2 / --full-redraw)
+cached     = "--full-redraw" not in sys.argv
+layer      = BrickLayer(bricks, (W, H), BG_COLOR)
+prev_rects = []
+full_frame = True
+frame_no, frame_ms = 0, 0.0
+
+def serve():
+    vel = pg.Vector2(random.choice([-1, 1]), -1).normalize() * BALL_SPEED
+    balls.add(paddle.centerx, paddle.top - BALL_R - 1, vel.x, vel.y)
+
 def reset():
-    global ball_pos, ball_vel, bricks, playing, won
-    bricks.clear()
-    for row in range(BRICK_ROWS):
-        for col in range(BRICK_COLS):
-            x = BRICK_GAP + col * (BRICK_W + BRICK_GAP)
-            y = top_offset + row * (BRICK_H + BRICK_GAP)
-            bricks.append((pg.Rect(x, y, BRICK_W, BRICK_H),
-                           BRICK_COLORS[row % len(BRICK_COLORS)]))
+    global bricks, playing, won, full_frame
+    bricks.reset()
+    layer.rebuild()
+    full_frame = True
     paddle.centerx = W//2
-    ball_pos.update(paddle.centerx, paddle.top - BALL_R - 1)
-    ball_vel.update(random.choice([-1, 1]), -1)
-    ball_vel.scale_to_length(BALL_SPEED)
+    balls.clear()
+    serve()
     playing, won = True, False
 
-# ------------------------------ MAIN LOOP ----------------------------
-while True:
-    # ----- events -----
+serve()
+
+# ----------------------------- FRAME STEPS ---------------------------
+# One frame is handle_events() + move_paddle() + update() + render(); the
+# split lets bench_games.py drive the game headless with scripted keys.
+def handle_events():
+    global cached, full_frame
     for ev in pg.event.get():
         if ev.type == pg.QUIT: 
             pg.quit(); sys.exit()
@@ -86,77 +108,104 @@ while True:
             pg.quit(); sys.exit()
         if ev.type == pg.KEYDOWN and not playing and ev.key == pg.K_r:
             reset()
-
-    # ----- input -----
-    keys = pg.key.get_pressed()
+        if ev.type == pg.KEYDOWN and playing and ev.key == pg.K_m:
+            balls.split()                       # multi-ball power-up
+        if ev.type == pg.KEYDOWN and ev.key == pg.K_F2:
+            cached = not cached
+            layer.rebuild()
+            full_frame = True
+        if ev.type == pg.KEYDOWN and ev.key == pg.K_F3:
+            PROF.toggle()
+            full_frame = True
+
+def move_paddle(keys):
     if keys[pg.K_LEFT]:
         paddle.x -= 9
     if keys[pg.K_RIGHT]:
         paddle.x += 9
     paddle.clamp_ip(screen.get_rect())
 
-    # ----- update -----
-    if playing:
-        ball_pos += ball_vel
-        ball = pg.Rect(int(ball_pos.x) - BALL_R,
-                       int(ball_pos.y) - BALL_R,
-                       BALL_R*2, BALL_R*2)
-
-        # walls
-        if ball.left <= 0 or ball.right >= W:
-            ball_vel.x *= -1
-            ball_pos.x = max(ball_pos.x, BALL_R)
-            ball_pos.x = min(ball_pos.x, W - BALL_R)
-            SFX_WALL.play()
-        if ball.top <= 0:
-            ball_vel.y *= -1
-            ball_pos.y = BALL_R
-            SFX_WALL.play()
-
-        # paddle
-        if ball.colliderect(paddle) and ball_vel.y > 0:
-            overlap = (ball.centerx - paddle.centerx) / (PADDLE_W / 2)
-            angle   = overlap * 60
-            speed   = ball_vel.length()
-            ball_vel.from_polar((speed, -angle))
-            ball_pos.y = paddle.top - BALL_R - 1
-            SFX_PADDLE.play()
-
-        # bricks
-        for rect, color in bricks[:]:
-            if ball.colliderect(rect):
-                bricks.remove((rect, color))
-                if abs(ball.centerx - rect.left) < BALL_R or \
-                   abs(ball.centerx - rect.right) < BALL_R:
-                    ball_vel.x *= -1
-                else:
-                    ball_vel.y *= -1
-                SFX_BRICK.play()
-                break
+def update():
+    """Step the balls, play SFX, settle win/lose; returns destroyed bricks."""
+    global playing, won
+    if not playing:
+        return []
+    with PROF("update"):
+        hits = balls.step(paddle, bricks, (W, H))
+    with PROF("audio"):
+        if hits.walls:  SFX_WALL.play()
+        if hits.paddle: SFX_PADDLE.play()
+        if hits.bricks: SFX_BRICK.play()
 
         # lose / win
-        if ball.top >= H:
+        if not balls:
             playing = False
             SFX_LOSE.play()
         if not bricks and playing:
             playing = False
             won = True
             SFX_WIN.play()
+    return hits.bricks
+
+def render(destroyed):
+    global prev_rects, full_frame, frame_ms
+    t0 = time.perf_counter()
+    with PROF("render"):
+        if playing:
+            hud = f"Bricks left: {len(bricks)}" + (f"   Balls: {len(balls)}" if len(balls) > 1 else "")
+            txt = TEXT.render(font, hud, True, FONT_COLOR)
+            txt_pos = (10, 10)
+        else:
+            msg = "YOU WIN!  Press R to replay" if won else "GAME OVER  Press R to retry"
+            txt = TEXT.render(font, msg, True, FONT_COLOR)
+            txt_pos = txt.get_rect(center=(W//2, H//2))
+
+        if cached:
+            erased = [layer.erase(row, col) for row, col in destroyed]
+            if full_frame:
+                screen.blit(layer.surf, (0, 0))
+            else:
+                layer.restore(screen, prev_rects + erased)
+            cur = [pg.draw.rect(screen, PADDLE_COLOR, paddle, border_radius=6)]
+            cur += [pg.draw.circle(screen, BALL_COLOR, pos, BALL_R) for pos in balls.pos]
+            cur.append(screen.blit(txt, txt_pos))
+            overlay = PROF.draw(screen)
+            if overlay: cur.append(overlay)
+        else:
+            screen.fill(BG_COLOR)
+            for rect, color in bricks:
+                pg.draw.rect(screen, color, rect, border_radius=4)
+            pg.draw.rect(screen, PADDLE_COLOR, paddle, border_radius=6)
+            for pos in balls.pos:
+                pg.draw.circle(screen, BALL_COLOR, pos, BALL_R)
+            screen.blit(txt, txt_pos)
+            PROF.draw(screen)
+    with PROF("flip"):
+        if cached:
+            display.present(None if full_frame else prev_rects + erased + cur)
+            prev_rects, full_frame = cur, False
+        else:
+            display.present()
+    if capture:
+        with PROF("capture"):
+            capture.grab()
+    frame_ms = frame_ms*0.95 + (time.perf_counter() - t0)*1e3*0.05
 
-    # ----- render -----
-    screen.fill(BG_COLOR)
-    for rect, color in bricks:
-        pg.draw.rect(screen, color, rect, border_radius=4)
-    pg.draw.rect(screen, PADDLE_COLOR, paddle, border_radius=6)
-    pg.draw.circle(screen, BALL_COLOR, ball_pos, BALL_R)
-
-    if playing:
-        txt = font.render(f"Bricks left: {len(bricks)}", True, FONT_COLOR)
-        screen.blit(txt, (10, 10))
-    else:
-        msg = "YOU WIN!  Press R to replay" if won else "GAME OVER  Press R to retry"
-        txt = font.render(msg, True, FONT_COLOR)
-        screen.blit(txt, txt.get_rect(center=(W//2, H//2)))
-
-    pg.display.flip()
-    clock.tick(FPS)
+# ------------------------------ MAIN LOOP ----------------------------
+# timing scopes + F3 overlay + VIBE_PROF trace dump: see vibe_prof.py
+def main():
+    global frame_no
+    while True:
+        with PROF("input"):
+            handle_events()
+            move_paddle(pg.key.get_pressed())
+        render(update())
+        PROF.frame()
+        frame_no += 1
+        if frame_no % 30 == 0:
+            pg.display.set_caption(f"Breakout 4K [{'cached' if cached else 'full'} "
+                                   f"{frame_ms:.2f} ms, F2 toggles, F3 profiler]")
+        clock.tick(FPS)
+
+if __name__ == "__main__":
+    main()
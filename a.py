@@ -2,33 +2,40 @@
 """
 Grand Vibe Auto: o3-alpha – One Shott (Mac Safe)
 Zero-asset, 60 FPS, pure Pygame HUD, day/night, single file, VIBES MODE ON.
+Sim is split from render: City.step() is seeded + fixed-step, so it also runs
+headless (see gva_soak.py).
 """
 
-import pygame, sys, random, math, time
+import pygame, sys, random, math
+from gva_grid import SpatialGrid
+from vibe_text import TEXT
+from vibe_prof import PROF
+from vibe_display import Display
+from vibe_capture import Capture
+from gva_nav import FlowField
+
+WIDTH,HEIGHT,FPS=900,600,60
+DT=1/FPS;DAY_LEN=15.0;MAX_STEPS=5
+COL={'P':(48,200,255),'COP':(255,32,64),'CAR':(232,224,48),'ROAD':(80,80,80),'BG':(32,160,32)}
+NIGHT=(16,32,64,170);DAY=(255,220,144,24)
+DIRS=[(1,0),(-1,0),(0,1),(0,-1)]
+ROADS=[(0,y,WIDTH,48) for y in range(60,HEIGHT,120)]+[(x,0,48,HEIGHT) for x in range(60,WIDTH,120)]
 
 class E:
-    def __init__(s,x,y,w,h,c,sp=0,a=''):s.x,s.y,s.w,s.h,s.c,s.s,s.a,s.d,s.cd=x,y,w,h,c,sp,a,random.choice([(1,0),(-1,0),(0,1),(0,-1)]),0
+    def __init__(s,x,y,w,h,c,sp=0,a='',rng=random):s.x,s.y,s.w,s.h,s.c,s.s,s.a,s.d,s.cd=x,y,w,h,c,sp,a,rng.choice(DIRS),0;s.g=s.k=None
     def r(s): return pygame.Rect(s.x,s.y,s.w,s.h)
-    def m(s):
+    def m(s,p=None,nav=None):
         if s.a=='car':
             s.x+=s.d[0]*s.s;s.y+=s.d[1]*s.s
             if s.x<0 or s.x>860:s.d=(-s.d[0],s.d[1])
             if s.y<0 or s.y>560:s.d=(s.d[0],-s.d[1])
         elif s.a=='cop':
-            dx,dy=player.x-s.x,player.y-s.y;d=max(1,math.hypot(dx,dy))
-            s.x+=(dx/d)*s.s;s.y+=(dy/d)*s.s
-
-WIDTH,HEIGHT,FPS=900,600,60
-COL={'P':(48,200,255),'COP':(255,32,64),'CAR':(232,224,48),'ROAD':(80,80,80),'BG':(32,160,32)}
-NIGHT=(16,32,64,170);DAY=(255,220,144,24)
-pygame.init()
-screen=pygame.display.set_mode((WIDTH,HEIGHT))
-pygame.display.set_caption("Grand Vibe Auto o3α")
-font=pygame.font.SysFont("Consolas",25,1)
-clock=pygame.time.Clock()
-player=E(WIDTH//2,HEIGHT//2,32,24,COL['P'],6)
-cars=[E(random.randint(60,840),random.randint(60,540),32,24,COL['CAR'],2,'car')for _ in range(8)]
-cops=[];wanted=0;score=0;hp=100;lhit=0
+            f=nav and nav.dir(s.x+s.w/2,s.y+s.h/2)  # follow the roads until close, then ram
+            if f:s.x+=f[0]*s.s;s.y+=f[1]*s.s
+            else:
+                dx,dy=p.x-s.x,p.y-s.y;d=max(1,math.hypot(dx,dy))
+                s.x+=(dx/d)*s.s;s.y+=(dy/d)*s.s
+        if s.g:s.g.move(s)
 
 def vibe_light(t):
     if t<0.5:ra,rb=t*2,1-t*2
@@ -41,44 +48,150 @@ def vibe_light(t):
         g=int(DAY[1]*rb+NIGHT[1]*ra);b=int(DAY[2]*rb+NIGHT[2]*ra)
     return (r,g,b,a)
 
-def draw_hud():
-    txt=font.render(f"HP:{max(0,hp)}  Score:{score}  Wanted:{'★'*wanted}{' '*(3-wanted)}",1,(250,250,250))
-    screen.blit(txt,(18,8))
-    screen.blit(font.render("VIBES MODE: ON",1,(255,128,255)),(WIDTH-245,HEIGHT-38))
-    screen.blit(font.render("Grand Vibe Auto (o3-alpha)",1,(120,255,255)),(10,HEIGHT-42))
-    screen.blit(font.render("WASD/Arrows: Move  |  Esc: Quit",1,(220,220,180)),(10,HEIGHT-20))
+# --- SIM: no display, no wall clock. Same seed + same inputs = same session.
+class City:
+    def __init__(s,seed=None,n_cars=8,nav=True):
+        s.seed=seed;s.rng=random.Random(seed);s.t=0.0;s.frame=0
+        s.player=E(WIDTH//2,HEIGHT//2,32,24,COL['P'],6,rng=s.rng)
+        s.cars=[E(s.rng.randint(60,840),s.rng.randint(60,540),32,24,COL['CAR'],2,'car',s.rng)for _ in range(n_cars)]
+        s.grid=SpatialGrid();s.nav=FlowField(ROADS,WIDTH,HEIGHT) if nav else None
+        for c in s.cars:s.grid.insert(c)
+        s.cops=[];s.wanted=0;s.score=0;s.hp=100;s.lhit=-1.0
+        s.car_hits=s.cop_hits=s.spawned=s.peak_cops=s.peak_wanted=0
+
+    def daylight(s): return (s.t/DAY_LEN)%1.0
+
+    def step(s,inputs=(0,0)):
+        """Advance one DT tick. inputs=(ix,iy), each -1/0/1. Returns False once dead."""
+        p=s.player;ix,iy=inputs
+        for c in s.cars:c.m()
+        if s.nav:s.nav.update(p.x+p.w/2,p.y+p.h/2)
+        for cop in s.cops:cop.m(p,s.nav)
+        p.x=max(0,min(WIDTH-p.w,p.x+ix*p.s))
+        p.y=max(0,min(HEIGHT-p.h,p.y+iy*p.s))
+        s.frame+=1;s.t=s.frame*DT;now=s.t
+        hits=list(s.grid.query(p.x,p.y,p.w,p.h))
+        for c in hits:
+            if c.a=='car' and now-s.lhit>0.6:
+                s.hp-=8;s.score-=2;s.wanted=min(3,s.wanted+1);s.lhit=now;s.car_hits+=1
+                if len(s.cops)<s.wanted*2:
+                    for _ in range(s.wanted):s.spawn_cop()
+        for cop in hits:
+            if cop.a=='cop' and now-s.lhit>0.7:s.hp-=18;s.score-=5;s.lhit=now;s.cop_hits+=1
+        for c in s.cops:
+            if not(0<=c.x<WIDTH and 0<=c.y<HEIGHT):s.grid.remove(c)
+        s.cops=[c for c in s.cops if c.g]
+        s.peak_cops=max(s.peak_cops,len(s.cops));s.peak_wanted=max(s.peak_wanted,s.wanted)
+        return s.hp>0
+
+    def spawn_cop(s):
+        cop=E(s.rng.randint(20,WIDTH-60),s.rng.randint(20,HEIGHT-60),36,28,COL['COP'],2.7+0.5*s.wanted,'cop',s.rng)
+        s.cops.append(cop);s.grid.insert(cop);s.spawned+=1
 
-run=1
-while run:
-    dt=clock.tick(FPS)/1e3;t=(time.time()/15)%1.0
+    def boxes(s,kind): return [c.r() for c in (s.cars if kind=='car' else s.cops)]
+
+    def stats(s):
+        return {'seed':s.seed,'frames':s.frame,'sim_s':round(s.t,3),'hp':s.hp,'score':s.score,'wanted':s.wanted,
+                'peak_wanted':s.peak_wanted,'car_hits':s.car_hits,'cop_hits':s.cop_hits,'cops_spawned':s.spawned,
+                'peak_cops':s.peak_cops,'alive':s.hp>0}
+
+def read_inputs(k):
+    ix=iy=0
+    if k[pygame.K_w]or k[pygame.K_UP]:iy=-1
+    if k[pygame.K_s]or k[pygame.K_DOWN]:iy=1
+    if k[pygame.K_a]or k[pygame.K_LEFT]:ix=-1
+    if k[pygame.K_d]or k[pygame.K_RIGHT]:ix=1
+    return ix,iy
+
+# --- RENDER: reads City, never mutates it.
+def draw_hud(screen,font,w):
+    txt=TEXT.render(font,f"HP:{max(0,w.hp)}  Score:{w.score}  Wanted:{'★'*w.wanted}{' '*(3-w.wanted)}",1,(250,250,250))
+    return [screen.blit(txt,(18,8)),
+            screen.blit(TEXT.render(font,"VIBES MODE: ON",1,(255,128,255)),(WIDTH-245,HEIGHT-38)),
+            screen.blit(TEXT.render(font,"Grand Vibe Auto (o3-alpha)",1,(120,255,255)),(10,HEIGHT-42)),
+            screen.blit(TEXT.render(font,"WASD/Arrows: Move  |  Esc: Quit",1,(220,220,180)),(10,HEIGHT-20))]
+
+def render(screen,font,w):
     screen.fill(COL['BG'])
-    for y in range(60,HEIGHT,120):pygame.draw.rect(screen,COL['ROAD'],(0,y,WIDTH,48))
-    for x in range(60,WIDTH,120):pygame.draw.rect(screen,COL['ROAD'],(x,0,48,HEIGHT))
-    for c in cars:c.m();pygame.draw.rect(screen,c.c,c.r(),border_radius=6)
-    for cop in cops:cop.m();pygame.draw.rect(screen,cop.c,cop.r(),border_radius=8)
-    k=pygame.key.get_pressed();vx=vy=0
-    if k[pygame.K_w]or k[pygame.K_UP]:vy=-player.s
-    if k[pygame.K_s]or k[pygame.K_DOWN]:vy=player.s
-    if k[pygame.K_a]or k[pygame.K_LEFT]:vx=-player.s
-    if k[pygame.K_d]or k[pygame.K_RIGHT]:vx=player.s
-    player.x=max(0,min(WIDTH-player.w,player.x+vx))
-    player.y=max(0,min(HEIGHT-player.h,player.y+vy))
-    pygame.draw.rect(screen,player.c,player.r(),border_radius=10)
-    now=time.time()
-    for c in cars:
-        if player.r().colliderect(c.r()) and now-lhit>0.6:
-            hp-=8;score-=2;wanted=min(3,wanted+1);lhit=now
-            if len(cops)<wanted*2:
-                for _ in range(wanted):cops.append(E(random.randint(20,WIDTH-60),random.randint(20,HEIGHT-60),36,28,COL['COP'],2.7+0.5*wanted,'cop'))
-    for cop in cops:
-        if player.r().colliderect(cop.r()) and now-lhit>0.7:hp-=18;score-=5;lhit=now
-    cops=[c for c in cops if 0<=c.x<WIDTH and 0<=c.y<HEIGHT]
-    surf=pygame.Surface((WIDTH,HEIGHT),pygame.SRCALPHA);surf.fill(vibe_light(t));screen.blit(surf,(0,0))
-    draw_hud()
-    for e in pygame.event.get():
-        if e.type==pygame.QUIT or(e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE):run=0
-    if hp<=0:
-        screen.blit(font.render("GAME OVER! (Esc to Quit)",1,(255,64,64)),(WIDTH//2-170,HEIGHT//2-22))
-        pygame.display.flip();pygame.time.wait(1500);run=0;break
-    pygame.display.flip()
-pygame.quit();sys.exit()
+    for r in ROADS:pygame.draw.rect(screen,COL['ROAD'],r)
+    for r in w.boxes('car'):pygame.draw.rect(screen,COL['CAR'],r,border_radius=6)
+    for r in w.boxes('cop'):pygame.draw.rect(screen,COL['COP'],r,border_radius=8)
+    pygame.draw.rect(screen,w.player.c,w.player.r(),border_radius=10)
+    surf=pygame.Surface((WIDTH,HEIGHT),pygame.SRCALPHA);surf.fill(vibe_light(w.daylight()));screen.blit(surf,(0,0))
+    draw_hud(screen,font,w)
+
+def tint(c,ov):
+    a=ov[3]/255;return tuple(int(c[i]*(1-a)+ov[i]*a) for i in range(3))
+
+class RenderCache:
+    """Cached twin of render(): the road grid is drawn once, the day/night tint
+    comes from a LUT of `buckets` vibe_light steps and is baked into a lit copy
+    of the background plus pre-tinted entity colors, so the frame is opaque
+    blits only. With dirty=True only last/this frame's entity and HUD rects are
+    restored and returned for display.update(); None means flip everything."""
+    def __init__(s,screen,font,buckets=64,dirty=True):
+        s.screen,s.font,s.buckets,s.dirty=screen,font,buckets,dirty
+        s.bg=pygame.Surface((WIDTH,HEIGHT)).convert();s.bg.fill(COL['BG'])
+        for r in ROADS:pygame.draw.rect(s.bg,COL['ROAD'],r)
+        s.lut=[vibe_light((i+0.5)/buckets) for i in range(buckets)]
+        s.ov=pygame.Surface((WIDTH,HEIGHT),pygame.SRCALPHA);s.lit=s.bg.copy()
+        s.b=-1;s.prev=[];s.pal={}
+
+    def relight(s,b):
+        s.b=b;c=s.lut[b];s.ov.fill(c)
+        s.lit.blit(s.bg,(0,0));s.lit.blit(s.ov,(0,0))
+        s.pal={k:tint(COL[k],c) for k in ('CAR','COP','P')}
+
+    def draw(s,w):
+        sc,full=s.screen,not s.dirty;b=int(w.daylight()*s.buckets)%s.buckets
+        if b!=s.b:s.relight(b);full=True
+        if full:sc.blit(s.lit,(0,0))
+        else:
+            for r in s.prev:sc.blit(s.lit,r,r)
+        cur=[pygame.draw.rect(sc,s.pal['CAR'],r,border_radius=6) for r in w.boxes('car')]
+        cur+=[pygame.draw.rect(sc,s.pal['COP'],r,border_radius=8) for r in w.boxes('cop')]
+        cur.append(pygame.draw.rect(sc,s.pal['P'],w.player.r(),border_radius=10))
+        cur+=draw_hud(sc,s.font,w)
+        dirty=None if full else s.prev+cur
+        s.prev=cur
+        return dirty
+
+def main(seed=None,cached=True):
+    pygame.init()
+    disp=Display((WIDTH,HEIGHT));screen=disp.surface  # VIBE_DISPLAY=2160p etc: see vibe_display.py
+    cap=Capture.from_env(screen)  # VIBE_CAPTURE=out.vcap: see vibe_capture.py
+    pygame.display.set_caption("Grand Vibe Auto o3α")
+    font=pygame.font.SysFont("Consolas",25,1)
+    clock=pygame.time.Clock()
+    w=City(seed);acc=0.0;alive=run=1;rms=0.0
+    rc=RenderCache(screen,font) if cached else None
+    while run:
+        acc=min(acc+clock.tick(FPS)/1e3,MAX_STEPS*DT)
+        with PROF('input'):inputs=read_inputs(pygame.key.get_pressed())
+        with PROF('update'):
+            while acc>=DT and alive:alive=w.step(inputs);acc-=DT
+        t0=pygame.time.get_ticks()
+        with PROF('render'):
+            if rc:dirty=rc.draw(w)
+            else:render(screen,font,w);dirty=None
+            o=PROF.draw(screen)
+            if o and dirty is not None:dirty.append(o)
+        for e in pygame.event.get():
+            if e.type==pygame.QUIT or(e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE):run=0
+            elif e.type==pygame.KEYDOWN and e.key==pygame.K_F2:rc=None if rc else RenderCache(screen,font)
+            elif e.type==pygame.KEYDOWN and e.key==pygame.K_F3:
+                PROF.toggle()
+                if rc:rc.b=-1  # next draw relights = full repaint, wipes the old overlay
+        if not alive:
+            screen.blit(TEXT.render(font,"GAME OVER! (Esc to Quit)",1,(255,64,64)),(WIDTH//2-170,HEIGHT//2-22))
+            disp.present();pygame.time.wait(1500);run=0;break
+        with PROF('flip'):
+            disp.present(dirty)
+        if cap:
+            with PROF('capture'):cap.grab()
+        PROF.frame()
+        rms=rms*0.95+(pygame.time.get_ticks()-t0)*0.05
+        if w.frame%30==0:pygame.display.set_caption(f"Grand Vibe Auto o3α [{'cached' if rc else 'full'} {rms:.1f} ms, F2 toggles, F3 profiler]")
+    pygame.quit();sys.exit()
+
+if __name__=="__main__":main(cached='--full-redraw' not in sys.argv)
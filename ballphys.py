@@ -0,0 +1,201 @@
+"""
+Breakout multi-ball physics
+---------------------------
+All balls live in NumPy arrays (pos, vel) and are advanced together. Motion
+is solved with a swept circle-vs-AABB test (slab test on the
+radius-expanded box, rounded at the corners), re-swept after each bounce for
+the rest of the step; very fast balls are additionally split into substeps of
+at most `max_travel` px to keep the per-ball candidate set small. A fast ball
+therefore bounces off the first surface on its path instead of tunnelling
+through it. Brick candidates come straight from the BrickGrid lattice: each
+ball only tests the few cells its swept box covers.
+
+    balls = Balls(BALL_R); balls.add(x, y, vx, vy)
+    ev = balls.step(paddle, bricks, (W, H))     # ev.walls / paddle / bricks / lost
+"""
+import math
+import numpy as np
+
+PADDLE_ANGLE = 60       # degrees off vertical at the paddle's very edge
+
+class Events:
+    __slots__ = ("walls", "paddle", "bricks", "lost")
+    def __init__(self):
+        self.walls = self.paddle = self.lost = 0
+        self.bricks = []            # (row, col) destroyed this step
+
+def sweep(p, d, lo, hi, r):
+    """Circle at p (radius r) moving by d against boxes [lo, hi]; broadcasts
+    over leading dims. Returns (t, n): contact time in [0, 1] (inf = miss)
+    and unit normal. Only approaches count (d . n < 0), so a ball that was
+    just reflected, or is leaving an overlap, is not caught again."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _sweep(p, d, lo, hi, r)
+
+def _sweep(p, d, lo, hi, r):
+    elo, ehi = lo - r, hi + r
+    zero = d == 0
+    t1 = (elo - p) / d
+    t2 = (ehi - p) / d
+    inside = (p >= elo) & (p <= ehi)
+    t1 = np.where(zero, np.where(inside, -np.inf, np.inf), t1)
+    t2 = np.where(zero, np.inf, t2)
+    tn, tf = np.minimum(t1, t2), np.maximum(t1, t2)
+    tnear, tfar = tn.max(-1), tf.min(-1)
+    hit = (tnear <= tfar) & (tfar >= 0) & (tnear <= 1)
+    t = np.maximum(tnear, 0)
+
+    # face normal: the entry axis, pointing away from the box centre
+    c = p + d * t[..., None]
+    axis = tn.argmax(-1)
+    side = np.where(c < (lo + hi) / 2, -1.0, 1.0)
+    n = np.zeros(np.broadcast_shapes(c.shape, side.shape))
+    np.put_along_axis(n, axis[..., None], np.take_along_axis(side, axis[..., None], -1), -1)
+
+    # corner region: contact point is outside the real box on both axes,
+    # so redo the hit as a ray against the rounded corner (circle of radius r)
+    out_lo, out_hi = c < lo, c > hi
+    corner = hit & (out_lo | out_hi).all(-1)
+    if corner.any():
+        k = np.where(out_lo, lo, hi)
+        f = p - k
+        a = (d*d).sum(-1)
+        b = 2 * (f*d).sum(-1)
+        cc = (f*f).sum(-1) - r*r
+        disc = b*b - 4*a*cc
+        tc = (-b - np.sqrt(np.maximum(disc, 0))) / (2*a)
+        tc = np.where(cc <= 0, 0.0, tc)
+        ok = (disc >= 0) & (tc >= 0) & (tc <= 1) & (a > 0)
+        nc = p + d * tc[..., None] - k
+        ln = np.sqrt((nc*nc).sum(-1, keepdims=True))
+        nc = np.where(ln > 0, nc / ln, n)
+        t = np.where(corner, tc, t)
+        n = np.where(corner[..., None], nc, n)
+        hit &= np.where(corner, ok, True)
+
+    hit &= (d * n).sum(-1) < 0
+    return np.where(hit, t, np.inf), n
+
+# ---------------------------------------------------------------------------
+class Balls:
+    def __init__(self, radius, cap=16, max_travel=None):
+        self.r = radius
+        self.max_travel = max_travel or 4*radius
+        self.n = 0
+        self._pos = np.zeros((cap, 2))
+        self._vel = np.zeros((cap, 2))
+
+    @property
+    def pos(self): return self._pos[:self.n]
+    @property
+    def vel(self): return self._vel[:self.n]
+
+    def __len__(self): return self.n
+
+    def clear(self): self.n = 0
+
+    def add(self, x, y, vx, vy):
+        if self.n == len(self._pos):
+            self._pos = np.concatenate([self._pos, np.zeros_like(self._pos)])
+            self._vel = np.concatenate([self._vel, np.zeros_like(self._vel)])
+        self._pos[self.n] = x, y
+        self._vel[self.n] = vx, vy
+        self.n += 1
+
+    def split(self, spread=20.0, limit=4096):
+        """Multi-ball: every ball spawns two copies rotated by +-spread degrees."""
+        pos, vel = self.pos.copy(), self.vel.copy()     # the balls before the split only
+        for sgn in (1, -1):
+            a = math.radians(spread * sgn)
+            ca, sa = math.cos(a), math.sin(a)
+            for (x, y), (vx, vy) in zip(pos, vel):
+                if self.n >= limit: return
+                self.add(x, y, vx*ca - vy*sa, vx*sa + vy*ca)
+
+    # -- simulation ----------------------------------------------------------
+    def step(self, paddle, bricks, size, max_bounces=4):
+        ev = Events()
+        if not self.n: return ev
+        speed = np.sqrt((self.vel**2).sum(-1)).max()
+        sub = max(1, math.ceil(speed / self.max_travel))
+        for _ in range(sub):
+            self._substep(1.0/sub, paddle, bricks, size, ev, max_bounces)
+        lost = self.pos[:, 1] - self.r >= size[1]
+        if lost.any():
+            keep = ~lost
+            k = int(keep.sum())
+            self._pos[:k] = self.pos[keep]; self._vel[:k] = self.vel[keep]
+            ev.lost, self.n = self.n - k, k
+        return ev
+
+    def _substep(self, dt, paddle, bricks, size, ev, max_bounces):
+        pos, vel, r = self.pos, self.vel, self.r
+        rem = np.full(self.n, dt)
+        idx = np.arange(self.n)
+        pad_lo = np.array([paddle.left, paddle.top], float)
+        pad_hi = np.array([paddle.right, paddle.bottom], float)
+        for _ in range(max_bounces):
+            if not idx.size: break
+            p = pos[idx]; d = vel[idx] * rem[idx, None]
+            lo, hi, cell, live = self._candidates(p, d, bricks)
+            lo = np.concatenate([lo, np.broadcast_to(pad_lo, (len(idx), 1, 2))], 1)
+            hi = np.concatenate([hi, np.broadcast_to(pad_hi, (len(idx), 1, 2))], 1)
+            t, n = sweep(p[:, None], d[:, None], lo, hi, r)
+            t[:, :-1][~live] = np.inf
+            first = t.argmin(1)
+            rows = np.arange(len(idx))
+            th = t[rows, first]
+            hit = np.isfinite(th)
+            pos[idx[~hit]] += d[~hit]
+            if not hit.any(): break
+            hi_idx, th, k = idx[hit], th[hit], first[hit]
+            nh = n[rows[hit], k]
+            pos[hi_idx] += d[hit] * th[:, None]
+            rem[hi_idx] *= 1 - th
+            vel[hi_idx] -= 2 * (vel[hi_idx]*nh).sum(-1, keepdims=True) * nh
+            on_pad = k == cell.shape[1]
+            if on_pad.any():
+                ev.paddle += int(on_pad.sum())
+                top = on_pad & (nh[:, 1] < -0.5)
+                if top.any():
+                    b = hi_idx[top]
+                    off = np.clip((pos[b, 0] - paddle.centerx) / (paddle.width/2), -1, 1)
+                    ang = np.radians(off * PADDLE_ANGLE)
+                    spd = np.sqrt((vel[b]**2).sum(-1))
+                    vel[b, 0] = spd * np.sin(ang); vel[b, 1] = -spd * np.cos(ang)
+            br = ~on_pad
+            if br.any():
+                for c in np.unique(cell[rows[hit][br], k[br]]):
+                    row, col = divmod(int(c), bricks.cols)
+                    bricks.remove(row, col)
+                    ev.bricks.append((row, col))
+            idx = hi_idx
+        self._walls(size, ev)
+
+    def _walls(self, size, ev):
+        W, r = size[0], self.r
+        x, y, vx, vy = self.pos[:, 0], self.pos[:, 1], self.vel[:, 0], self.vel[:, 1]
+        left, right, top = x < r, x > W - r, y < r
+        x[left] = 2*r - x[left];           vx[left] = np.abs(vx[left])
+        x[right] = 2*(W - r) - x[right];   vx[right] = -np.abs(vx[right])
+        y[top] = 2*r - y[top];             vy[top] = np.abs(vy[top])
+        ev.walls += int(left.sum() + right.sum() + top.sum())
+
+    def _candidates(self, p, d, g):
+        """Bricks each ball's swept box can touch: (lo, hi, cell, live) shaped
+        (M, K, 2) / (M, K); `live` masks dead and out-of-range slots."""
+        r = self.r
+        ext = 2*r + np.abs(d).max()
+        kr, kc = int(ext // g.py) + 2, int(ext // g.px) + 2
+        smin = np.minimum(p, p + d) - r
+        r0 = np.floor((smin[:, 1] - g.top) / g.py).astype(np.int64)
+        c0 = np.floor((smin[:, 0] - g.gap) / g.px).astype(np.int64)
+        rows = r0[:, None, None] + np.arange(kr)[None, :, None]
+        cols = c0[:, None, None] + np.arange(kc)[None, None, :]
+        rows, cols = np.broadcast_arrays(rows, cols)
+        rows, cols = rows.reshape(len(p), -1), cols.reshape(len(p), -1)
+        inb = (rows >= 0) & (rows < g.rows) & (cols >= 0) & (cols < g.cols)
+        cell = np.where(inb, rows*g.cols + cols, 0)
+        alive = np.frombuffer(g.alive, np.uint8)[cell].astype(bool) & inb
+        lo = np.stack([g.gap + cols*g.px, g.top + rows*g.py], -1).astype(float)
+        return lo, lo + (g.bw, g.bh), cell, alive
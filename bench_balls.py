@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Breakout – multi-ball physics stress benchmark
+----------------------------------------------
+ms/frame for Balls.step() as the ball count and speed grow, on the game's
+6x10 field and a 50x100 level-pack field, with the paddle tracking the
+lowest ball. Also counts tunnelling: balls that end a frame overlapping a
+live brick (should stay 0 at any speed).
+
+  python bench_balls.py
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import random, time
+import numpy as np
+import pygame as pg
+from ballphys import Balls
+from brick_grid import BrickGrid
+
+W, H, BALL_R, FRAMES = 800, 600, 8, 120
+COLORS = [(255, 77, 77)]
+
+def field(rows, cols):
+    gap = 4 if cols <= 10 else 1
+    bw = (W - gap*(cols+1)) // cols
+    return BrickGrid(rows, cols, bw, 25 if rows <= 6 else 6, gap, 60, COLORS)
+
+def tunnelled(balls, g):
+    bad = 0
+    for x, y in balls.pos:
+        probe = pg.Rect(int(x) - BALL_R//2, int(y) - BALL_R//2, BALL_R, BALL_R)
+        bad += g.hit(probe) is not None
+    return bad
+
+def run(rows, cols, n, speed, seed=1):
+    rng = random.Random(seed)
+    g = field(rows, cols)
+    paddle = pg.Rect(W//2 - 55, H - 60, 110, 15)
+    balls = Balls(BALL_R)
+    for _ in range(n):
+        a = rng.uniform(-1.2, 1.2)
+        balls.add(rng.uniform(20, W-20), rng.uniform(H-170, H-80), speed*np.sin(a), -speed*np.cos(a))
+    bad, t = 0, 0.0
+    for _ in range(FRAMES):
+        if len(balls):
+            paddle.centerx = int(balls.pos[balls.pos[:, 1].argmax(), 0])
+        t0 = time.perf_counter()
+        balls.step(paddle, g, (W, H))
+        t += time.perf_counter() - t0
+        bad += tunnelled(balls, g)
+    return t * 1e3 / FRAMES, len(g), len(balls), bad
+
+def main():
+    print(f"{'field':>8}{'balls':>7}{'speed':>7}{'ms/frame':>10}{'us/ball':>9}{'bricks':>8}{'alive':>7}{'tunnel':>8}")
+    for rows, cols in ((6, 10), (50, 100)):
+        for n in (1, 10, 100, 500, 1000):
+            for speed in (5.0, 40.0):
+                ms, left, alive, bad = run(rows, cols, n, speed)
+                print(f"{rows}x{cols:<5}{n:>7}{speed:>7.0f}{ms:>10.3f}{ms*1e3/n:>9.1f}{left:>8}{alive:>7}{bad:>8}")
+
+if __name__ == "__main__":
+    main()
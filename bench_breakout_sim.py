@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Breakout – batched simulator throughput
+---------------------------------------
+Game-frames per second for BreakoutSim as the env count K grows (one
+process, scripted follow policy), then for a fixed K sharded over a process
+pool. One game at 60 FPS is 216k frames per hour; the target is millions.
+Those runs are too short for a game to end, so they report bricks cleared
+per env; a last pair of longer runs (64 envs, follow and random policy)
+plays whole games to count games finished and won.
+
+  python bench_breakout_sim.py [-k 4096] [-f 2000] [-j 1 2 4] [-e 20000]
+"""
+import argparse, os
+from breakout_sim import rollout, sharded
+
+def line(label, r):
+    sps = r["steps"] / r["wall_s"]
+    print(f"{label:>14}{sps:>14,.0f}{sps*3600/1e6:>14,.0f}M{r['bricks']/r['envs']:>12.1f}{r['games']:>8}{r['wins']:>8}")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("-k", "--envs", type=int, default=4096, help="envs for the sharded runs")
+    ap.add_argument("-f", "--frames", type=int, default=2000)
+    ap.add_argument("-j", "--jobs", type=int, nargs="+",
+                    default=sorted({1, 2, os.cpu_count() or 1}))
+    ap.add_argument("-e", "--episode-frames", type=int, default=20000, help="frames for the whole-game runs")
+    a = ap.parse_args()
+    print(f"{'':>14}{'frames/s':>14}{'frames/hour':>15}{'bricks/env':>12}{'games':>8}{'wins':>8}")
+    for k in (1, 16, 256, 4096, 16384):
+        line(f"K={k}", rollout((k, max(200, a.frames*1024//max(1024, k)), 1, "follow")))
+    print()
+    for j in a.jobs:
+        line(f"K={a.envs} j={j}", sharded(a.envs, a.frames, j))
+    print()
+    for policy in ("follow", "random"):
+        line(f"K=64 {policy}", rollout((64, a.episode_frames, 1, policy)))
+
+if __name__ == "__main__":
+    main()
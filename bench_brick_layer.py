@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Breakout – brick layer vs full redraw
+-------------------------------------
+Render + present cost per frame under SDL's dummy video driver for the full
+redraw (fill + every rounded brick + flip) and the cached BrickLayer with
+dirty-rect updates, on the game's 6x10 field and large level-pack fields.
+Both modes run the same seeded ball simulation; the last frames are compared
+pixel for pixel.
+
+  python bench_brick_layer.py
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import random, time
+import pygame as pg
+from ballphys import Balls
+from brick_grid import BrickGrid
+from brick_layer import BrickLayer
+from vibe_display import Display
+
+W, H, BALL_R, FRAMES = 800, 600, 8, 300
+BG, PADDLE, BALL = (20, 20, 30), (235, 235, 255), (255, 215, 0)
+COLORS = [(255, 77, 77), (255, 122, 66), (255, 205, 66), (122, 255, 66), (66, 239, 255), (140, 122, 255)]
+
+def field(rows, cols):
+    gap = 4 if cols <= 10 else 1
+    bw = (W - gap*(cols+1)) // cols
+    bh = 25 if rows <= 6 else max(3, 300 // rows - gap)
+    return BrickGrid(rows, cols, bw, bh, gap, 60, COLORS)
+
+def run(display, rows, cols, n_balls, cached):
+    screen = display.surface
+    rng = random.Random(7)
+    g = field(rows, cols)
+    balls = Balls(BALL_R)
+    for _ in range(n_balls):
+        balls.add(rng.uniform(20, W-20), rng.uniform(450, 520), rng.uniform(-4, 4), -5)
+    paddle = pg.Rect(W//2 - 55, H - 60, 110, 15)
+    layer = BrickLayer(g, (W, H), BG) if cached else None
+    prev, full, t = [], True, 0.0
+    for _ in range(FRAMES):
+        if len(balls): paddle.centerx = int(balls.pos[balls.pos[:, 1].argmax(), 0])
+        dead = balls.step(paddle, g, (W, H)).bricks
+        t0 = time.perf_counter()
+        if cached:
+            erased = [layer.erase(r, c) for r, c in dead]
+            if full: screen.blit(layer.surf, (0, 0))
+            else: layer.restore(screen, prev + erased)
+            cur = [pg.draw.rect(screen, PADDLE, paddle, border_radius=6)]
+            cur += [pg.draw.circle(screen, BALL, p, BALL_R) for p in balls.pos]
+            display.present(None if full else prev + erased + cur)
+            prev, full = cur, False
+        else:
+            screen.fill(BG)
+            for rect, color in g:
+                pg.draw.rect(screen, color, rect, border_radius=4)
+            pg.draw.rect(screen, PADDLE, paddle, border_radius=6)
+            for p in balls.pos: pg.draw.circle(screen, BALL, p, BALL_R)
+            display.present()
+        t += time.perf_counter() - t0
+    return t * 1e3 / FRAMES, pg.image.tobytes(screen, "RGB")
+
+def main():
+    pg.init()
+    display = Display((W, H), "")        # native window: the game's present path
+    print(f"{'field':>8}{'balls':>7}{'full ms':>10}{'cached ms':>11}{'speedup':>9}  same")
+    for rows, cols in ((6, 10), (20, 40), (50, 100)):
+        for n in (1, 50):
+            full, a = run(display, rows, cols, n, False)
+            fast, b = run(display, rows, cols, n, True)
+            print(f"{rows}x{cols:<5}{n:>7}{full:>10.3f}{fast:>11.3f}{full/fast:>8.1f}x  {a == b}")
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Breakout – brick broad-phase benchmark
+--------------------------------------
+Per-frame cost of ball-vs-brick checks for the old list scan
+(copy + colliderect + list.remove) and BrickGrid, over large brick fields and
+many balls. Balls wander the field and destroy what they hit, like the game.
+
+  python bench_bricks.py
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import random, time
+import pygame as pg
+from brick_grid import BrickGrid
+
+FRAMES, BALL_R = 60, 8
+COLORS = [(255, 77, 77), (66, 239, 255)]
+
+def field(rows, cols, bw=24, bh=10, gap=2, top=40):
+    grid = BrickGrid(rows, cols, bw, bh, gap, top, COLORS)
+    size = (gap + cols*(bw+gap), top + rows*(bh+gap) + 200)
+    return grid, size
+
+def balls(n, size, seed=1):
+    rng = random.Random(seed)
+    return [[rng.uniform(0, size[0]), rng.uniform(0, size[1]), rng.uniform(-6, 6), rng.uniform(-6, 6)]
+            for _ in range(n)]
+
+def advance(bs, size):
+    for b in bs:
+        b[0] = (b[0] + b[2]) % size[0]; b[1] = (b[1] + b[3]) % size[1]
+        yield pg.Rect(int(b[0])-BALL_R, int(b[1])-BALL_R, BALL_R*2, BALL_R*2)
+
+def run_list(rows, cols, n):
+    grid, size = field(rows, cols)
+    bricks = list(grid)
+    bs = balls(n, size)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        for ball in advance(bs, size):
+            for rect, color in bricks[:]:
+                if ball.colliderect(rect):
+                    bricks.remove((rect, color)); break
+    return (time.perf_counter() - t0) * 1e3 / FRAMES, len(bricks)
+
+def run_grid(rows, cols, n):
+    grid, size = field(rows, cols)
+    bs = balls(n, size)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        for ball in advance(bs, size):
+            hit = grid.hit(ball)
+            if hit: grid.remove(hit[0], hit[1])
+    return (time.perf_counter() - t0) * 1e3 / FRAMES, len(grid)
+
+def main():
+    print(f"{'field':>8}{'balls':>7}{'list ms':>10}{'grid ms':>10}{'speedup':>9}")
+    for rows, cols in ((6, 10), (20, 40), (50, 100)):
+        for n in (1, 10, 100, 1000):
+            if rows*cols*n > 2_000_000:
+                lst = None
+            else:
+                lst, left_l = run_list(rows, cols, n)
+            grd, left_g = run_grid(rows, cols, n)
+            if lst is not None: assert left_l == left_g, (left_l, left_g)
+            ls = f"{lst:>10.3f}" if lst is not None else f"{'-':>10}"
+            sp = f"{lst/grd:>8.0f}x" if lst is not None else f"{'-':>9}"
+            print(f"{rows}x{cols:<5}{n:>7}{ls}{grd:>10.3f}{sp}")
+
+if __name__ == "__main__":
+    main()
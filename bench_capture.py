@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Frame capture benchmark
+-----------------------
+Main-thread ms per captured frame for pygame.image.save() in the loop vs
+vibe_capture.Capture.grab(), at the games' native sizes and at 4K, with a
+loop running uncapped (so the worker is as far behind as it will ever be)
+and at a 60 FPS pace. Also reports what the worker kept up with: frames
+written, dropped, and the grab-to-disk latency.
+
+  python bench_capture.py [frames]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, tempfile, time
+import pygame as pg
+from vibe_capture import Capture
+
+SIZES = [(512, 448), (900, 600), (960, 720), (3840, 2160)]
+
+def scene(surf, i):
+    surf.fill((20, 20, 30))
+    w, h = surf.get_size()
+    for k in range(40):
+        pg.draw.rect(surf, (60 + k*4, 200 - k*3, 90), ((i*3 + k*97) % w, (k*53) % h, 40, 30))
+
+def run(size, frames, pace, tmp):
+    surf = pg.Surface(size).convert()
+    path = os.path.join(tmp, "bench.vcap")
+    t0 = time.perf_counter(); pg.image.save(surf, os.path.join(tmp, "x.png"))
+    save_ms = (time.perf_counter() - t0) * 1e3
+    cap = Capture(surf, path)
+    grab = 0.0
+    for i in range(frames):
+        t = time.perf_counter()
+        scene(surf, i)
+        g = time.perf_counter(); cap.grab(); grab += time.perf_counter() - g
+        if pace: time.sleep(max(0, 1/60 - (time.perf_counter() - t)))
+    cap.close()
+    r = cap.report()
+    return save_ms, grab*1e3/frames, r
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+    pg.display.init(); pg.display.set_mode((64, 64))
+    print(f"{'size':>11}{'loop':>9}{'save ms':>10}{'grab ms':>10}{'written':>9}{'dropped':>9}{'lat p50':>9}{'lat p95':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            for pace in (False, True):
+                save_ms, grab_ms, r = run(size, frames, pace, tmp)
+                print(f"{'%dx%d' % size:>11}{'60fps' if pace else 'uncap':>9}{save_ms:>10.2f}{grab_ms:>10.3f}"
+                      f"{r['written']:>9}{r['dropped']:>9}{r['latency_ms'][0]:>9.1f}{r['latency_ms'][1]:>9.1f}")
+
+if __name__ == "__main__":
+    main()
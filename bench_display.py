@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Display pipeline benchmark: native render + scale vs drawing at output size
+---------------------------------------------------------------------------
+ms/frame (draw + present) for a Grand Vibe Auto street scene shown at 1080p
+and 2160p four ways:
+
+  direct       render() redrawn at output size (geometry scaled up), flip
+  fit          render() at 900x600, nearest-scaled to fit, letterboxed
+  fit cached   RenderCache at 900x600, whole frame rescaled every frame
+  int dirty    RenderCache at 900x600, integer factor, only dirty rects rescaled
+
+Under SDL's dummy driver this is the CPU cost only; a real window adds the
+upload of whatever present() pushes, which the dirty path keeps small.
+
+  python bench_display.py [frames]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, time
+import pygame
+from a import City, RenderCache, COL, WIDTH, HEIGHT, ROADS, render, vibe_light
+from vibe_display import Display
+
+def draw_direct(screen, font, w, view, f):
+    """render() at output resolution: every primitive scaled by f."""
+    S = lambda r: pygame.Rect(view.x + r[0]*f, view.y + r[1]*f, r[2]*f, r[3]*f)
+    screen.fill(COL['BG'], view)
+    for r in ROADS: pygame.draw.rect(screen, COL['ROAD'], S(r))
+    for r in w.boxes('car'): pygame.draw.rect(screen, COL['CAR'], S(r), border_radius=int(6*f))
+    for r in w.boxes('cop'): pygame.draw.rect(screen, COL['COP'], S(r), border_radius=int(8*f))
+    pygame.draw.rect(screen, w.player.c, S(w.player.r()), border_radius=int(10*f))
+    ov = pygame.Surface(view.size, pygame.SRCALPHA); ov.fill(vibe_light(w.daylight())); screen.blit(ov, view)
+    txt = font.render(f"HP:{w.hp}  Score:{w.score}", 1, (250, 250, 250))
+    screen.blit(txt, (view.x + 18*f, view.y + 8*f))
+    pygame.display.flip()
+
+def run(name, out, frames):
+    spec = {"native": "", "direct": out, "fit": out, "fit cached": out, "int dirty": out + ",int"}[name]
+    disp = Display((WIDTH, HEIGHT), spec)
+    scale = disp.scale
+    font = pygame.font.SysFont("Consolas", int(25*(scale if name == "direct" else 1)), 1)
+    w = City(1, n_cars=64)
+    for _ in range(16): w.spawn_cop()
+    w.hp = float("inf")
+    rc = RenderCache(disp.surface, font) if name in ("native", "fit cached", "int dirty") else None
+    t0 = time.perf_counter()
+    for i in range(frames):
+        w.step((1 if i % 120 < 60 else -1, 0))
+        if name == "direct": draw_direct(disp.window, font, w, disp.view, scale)
+        elif rc: disp.present(rc.draw(w))
+        else: render(disp.surface, font, w); disp.present()
+    return (time.perf_counter() - t0) * 1e3 / frames, scale
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    pygame.init()
+    print(f"{'output':>8}{'mode':>12}{'scale':>8}{'ms/frame':>11}")
+    for out in ("1080p", "2160p"):
+        for name in ("direct", "fit", "fit cached", "int dirty"):
+            ms, scale = run(name, out, frames)
+            print(f"{out:>8}{name:>12}{scale:>8.2f}{ms:>11.2f}")
+    print(f"(plain 900x600 window, RenderCache + dirty update: {run('native', '', frames)[0]:.2f} ms/frame)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for the four games
+-------------------------------------------
+Runs every game under SDL's dummy video/audio drivers for a fixed number of
+frames with seeded RNG and scripted input, timing the update and render
+halves of each frame separately, across a ladder of entity counts:
+
+  gva       cars / cops                       (a.py: City + RenderCache)
+  breakout  bricks / balls                    (######pong4k.py frame steps)
+  mansion   ghosts per room / rooms per floor (mansion4k.py, GhostHorde)
+  mario     level screens (tiles) / actors    (o3aphamario4k.py Game)
+
+Each game runs in its own process (they all own the one SDL window). Results
+go to a JSON file; --baseline compares against an earlier one and exits 1
+if any case got slower than the tolerance allows.
+
+  python bench_games.py -f 600 -o bench.json
+  python bench_games.py -g mansion mario --baseline bench.json --tolerance 0.15
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import argparse, importlib.util, json, pathlib, platform, random, sys, time
+import multiprocessing as mp
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+CASES = {
+    "gva":      [dict(cars=8, cops=0), dict(cars=64, cops=16), dict(cars=512, cops=64), dict(cars=2048, cops=256)],
+    "breakout": [dict(rows=6, cols=10, balls=1), dict(rows=6, cols=10, balls=64),
+                 dict(rows=24, cols=40, balls=16), dict(rows=48, cols=80, balls=256)],
+    "mansion":  [dict(ghosts=0, rooms=8), dict(ghosts=10, rooms=8), dict(ghosts=100, rooms=64), dict(ghosts=1000, rooms=512)],
+    "mario":    [dict(screens=2, actors=0), dict(screens=2, actors=32), dict(screens=300, actors=256), dict(screens=300, actors=8192)],
+}
+
+class Keys:
+    """pg.key.get_pressed() stand-in holding a given set of keys down."""
+    def __init__(self, down=()): self.down = set(down)
+    def __getitem__(self, k): return k in self.down
+
+def summarize(ms):
+    from vibe_prof import percentile
+    s = sorted(ms)
+    return {"mean": round(sum(s)/len(s), 4), "p50": round(percentile(s, .5), 4),
+            "p95": round(percentile(s, .95), 4), "max": round(s[-1], 4)}
+
+def timed(frames, update, render):
+    up, rd = [], []
+    pc = time.perf_counter
+    for f in range(frames):
+        t0 = pc(); update(f)
+        t1 = pc(); render(f)
+        t2 = pc()
+        up.append((t1-t0)*1e3); rd.append((t2-t1)*1e3)
+    return {"update_ms": summarize(up), "render_ms": summarize(rd)}
+
+# ---------------------------------------------------------------------------
+# Per-game drivers: build the scaled scene, return (update, render) callables.
+def gva(case, seed):
+    import pygame
+    from a import City, RenderCache, WIDTH, HEIGHT
+    from gva_soak import Wanderer
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.SysFont("Consolas", 25, 1)
+    w = City(seed, n_cars=case["cars"])
+    for _ in range(case["cops"]): w.spawn_cop()
+    w.hp = float("inf")                         # keep the session alive
+    drive, rc = Wanderer(seed), RenderCache(screen, font)
+    def update(f): w.step(drive(w))
+    def render(f):
+        dirty = rc.draw(w)
+        if dirty is None: pygame.display.flip()
+        else: pygame.display.update(dirty)
+    return update, render
+
+def breakout(case, seed):
+    spec = importlib.util.spec_from_file_location("pong4k", HERE / "######pong4k.py")
+    g = importlib.util.module_from_spec(spec); spec.loader.exec_module(g)
+    from brick_grid import BrickGrid
+    from ballphys import Balls
+    from brick_layer import BrickLayer
+    rows, cols = case["rows"], case["cols"]
+    bw = (g.W - g.BRICK_GAP*(cols+1)) // cols
+    bh = min(g.BRICK_H, (g.H//2 - g.top_offset)//rows - g.BRICK_GAP)
+    g.bricks = BrickGrid(rows, cols, bw, bh, g.BRICK_GAP, g.top_offset, g.BRICK_COLORS)
+    g.layer = BrickLayer(g.bricks, (g.W, g.H), g.BG_COLOR)
+    g.balls = Balls(g.BALL_R)
+    rng = random.Random(seed)
+    def restart():
+        g.reset()
+        for _ in range(case["balls"]-1):
+            vx = rng.uniform(-1, 1)
+            g.balls.add(rng.uniform(50, g.W-50), rng.uniform(g.H//2, g.H-120), vx*g.BALL_SPEED, -g.BALL_SPEED)
+    restart()
+    state = {}
+    def update(f):
+        if not g.playing: restart()
+        pos = g.balls.pos
+        x = max(pos, key=lambda p: p[1])[0] if len(pos) else g.W//2   # follow the lowest ball
+        g.move_paddle(Keys([g.pg.K_LEFT] if x < g.paddle.centerx-8 else
+                           [g.pg.K_RIGHT] if x > g.paddle.centerx+8 else []))
+        state["destroyed"] = g.update()
+    def render(f): g.render(state["destroyed"])
+    return update, render
+
+def mansion(case, seed):
+    sys.argv = sys.argv[:1]
+    import pygame, mansion4k as m
+    m.FOG = m.Fog(m.W, m.H, seed=seed)
+    random.seed(seed)
+    house = m.Mansion(n_floors=4, seed=seed, rooms=(case["rooms"],)*2, horde=case["ghosts"])
+    luigi = m.Luigi()
+    rng = random.Random(seed)
+    keys = [k for k in m.KEYMAP if k != pygame.K_v]
+    def update(f):
+        if f % 4 == 0: m.apply_key(rng.choice(keys), house, luigi)
+        m.move_ghosts(house.luigi_room, luigi)
+        m.FOG.update()
+        m.ghost_collision(house.luigi_room, luigi)      # timed, but nobody dies here
+    def render(f):
+        m.draw_room(house.luigi_room, house.floor, f % 600 >= 300, luigi, f/m.FPS)
+        pygame.display.flip()
+    return update, render
+
+def mario(case, seed):
+    import pygame as pg, o3aphamario4k as m
+    random.seed(seed)
+    m.LEVEL_SCREENS = case["screens"]
+    g = m.Game()
+    lvl = g.level
+    for pool in lvl.pools: pool.cells.clear()
+    span = lvl.tiles.width - 4*m.TILE
+    for i in range(case["actors"]):
+        pool = lvl.koopas if i % 3 == 0 else lvl.goombas
+        pool.spawn(2*m.TILE + i*span//max(1, case["actors"]), m.HEIGHT-6*m.TILE)
+    g.rewind = m.Rewind(lvl, m.REWIND_S, m.SIM_HZ)     # history of the level as rebuilt here
+    right, left = Keys([pg.K_RIGHT, pg.K_z, pg.K_x]), Keys([pg.K_LEFT, pg.K_x])
+    def update(f):
+        g.step(right if f % 210 < 120 else left)        # drifts right, never reaches the exit
+        g.stream.ahead(g.level.tiles, g.level.scroll_x, m.WORLDS[g.world]["palette"])
+        g.stream.pump()
+    def render(f):
+        g.level.draw(g.screen)
+        pg.display.flip()
+    return update, render
+
+# ---------------------------------------------------------------------------
+def run_game(job):
+    game, frames, seed = job
+    out = []
+    for case in CASES[game]:
+        update, render = globals()[game](case, seed)
+        res = timed(frames, update, render)
+        out.append({"game": game, "case": case, "frames": frames, "seed": seed, **res})
+        print(f"{game:<9}{json.dumps(case):<40}update p50 {res['update_ms']['p50']:8.3f} ms"
+              f"   render p50 {res['render_ms']['p50']:8.3f} ms", flush=True)
+    import pygame; pygame.quit()
+    return out
+
+def compare(results, baseline, tol):
+    """Cases whose median update or render time grew by more than tol
+    (the median, not the mean, so one first-frame hitch is not a regression)."""
+    old = {(r["game"], json.dumps(r["case"], sort_keys=True)): r for r in baseline["results"]}
+    slow = []
+    for r in results:
+        b = old.get((r["game"], json.dumps(r["case"], sort_keys=True)))
+        if not b: continue
+        for part in ("update_ms", "render_ms"):
+            was, now = b[part]["p50"], r[part]["p50"]
+            if was > 0 and now > was*(1+tol):
+                slow.append(f"{r['game']} {json.dumps(r['case'])} {part}: {was:.3f} -> {now:.3f} ms")
+    return slow
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-g", "--games", nargs="+", choices=list(CASES), default=list(CASES))
+    ap.add_argument("-f", "--frames", type=int, default=600)
+    ap.add_argument("-s", "--seed", type=int, default=1)
+    ap.add_argument("-o", "--out", default="bench_games.json")
+    ap.add_argument("--baseline", help="earlier results to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown (0.15 = 15%%)")
+    a = ap.parse_args()
+
+    ctx = mp.get_context("spawn")               # fresh interpreter + SDL window per game
+    results = []
+    for game in a.games:
+        pool = ctx.Pool(1)
+        results += pool.apply(run_game, ((game, a.frames, a.seed),))
+        pool.close(); pool.join()               # not terminate(): SDL traps SIGTERM
+    import pygame
+    meta = {"python": platform.python_version(), "pygame": pygame.version.ver,
+            "machine": platform.machine(), "frames": a.frames, "seed": a.seed,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    with open(a.out, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=1)
+    print("wrote", a.out)
+    if a.baseline:
+        with open(a.baseline) as f:
+            slow = compare(results, json.load(f), a.tolerance)
+        for line in slow: print("SLOWER", line)
+        print(f"{len(slow)} regressions vs {a.baseline} (tolerance {a.tolerance:.0%})")
+        sys.exit(1 if slow else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Mansion ghost AI benchmark
+--------------------------
+Per-frame cost of the ghost logic (move + player hit test + a flashlight
+sweep) for the original list-of-lists path against GhostHorde, at crowd
+sizes from a normal room to a "--horde" stress room. Luigi stands out of
+reach so no frame ends early on a hit.
+
+  python bench_ghosts.py [frames]
+"""
+import random, sys, time
+import mansion_ghosts as ga
+from mansion_ghosts import GhostHorde
+
+def frame_ms(ghosts, frames):
+    lx, ly = 2000, 2000
+    t0 = time.perf_counter()
+    for f in range(frames):
+        ga.move(ghosts, lx, ly)
+        ga.collide(ghosts, lx, ly)
+        if f % 8 == 0: ga.flash(ghosts, 480, 360)
+    return (time.perf_counter() - t0) * 1e3 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    print(f"{'ghosts':>7}{'list ms':>10}{'horde ms':>10}{'speedup':>9}")
+    for n in (2, 10, 100, 1000, 10000):
+        random.seed(1)
+        horde = GhostHorde.spawn(n, 480, 360, seed=1)
+        lists = [[x, y, s] for x, y, s in horde]
+        lm = frame_ms(lists, frames)
+        hm = frame_ms(horde, frames)
+        print(f"{n:>7}{lm:>10.3f}{hm:>10.3f}{lm/hm:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
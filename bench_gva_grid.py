@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Grand Vibe Auto – collision broad-phase benchmark
+-------------------------------------------------
+Frame time vs entity count for the old per-frame Rect scan and the spatial
+grid, for player-vs-entity and entity-vs-entity (car-vs-car) checks.
+
+  python bench_gva_grid.py [counts...]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, time
+from a import City
+from gva_grid import overlap
+
+FRAMES   = 60
+BRUTE_N2 = 2000      # skip the O(N^2) pair scan above this
+
+def ms(fn, frames=FRAMES):
+    t0 = time.perf_counter()
+    for _ in range(frames): fn()
+    return (time.perf_counter() - t0) * 1e3 / frames
+
+def bench(n):
+    city = City(1, n_cars=n)
+    for _ in range(n//10): city.spawn_cop()
+    p, ents = city.player, city.cars + city.cops
+    pr = p.r()
+    row = {"n": len(ents)}
+    row["step"]         = ms(lambda: city.step((0, 0)))
+    ents = city.cars + city.cops
+    row["player_rect"]  = ms(lambda: [e for e in ents if pr.colliderect(e.r())])
+    row["player_grid"]  = ms(lambda: list(city.grid.query(p.x, p.y, p.w, p.h)))
+    row["pairs_grid"]   = ms(lambda: sum(1 for _ in city.grid.pairs()), 5)
+    if len(ents) <= BRUTE_N2:
+        row["pairs_brute"] = ms(lambda: sum(overlap(a, b) for i, a in enumerate(ents) for b in ents[i+1:]), 1)
+    return row
+
+def main(argv=None):
+    counts = [int(a) for a in (argv or sys.argv[1:])] or [100, 500, 1000, 2000, 5000, 10000]
+    cols = ["n", "step", "player_rect", "player_grid", "pairs_brute", "pairs_grid"]
+    print("ms/frame  " + "".join(f"{c:>13}" for c in cols))
+    for n in counts:
+        row = bench(n)
+        print("          " + "".join(f"{row[c]:>13}" if c == "n" else f"{row[c]:>13.3f}" if c in row
+                                      else f"{'-':>13}" for c in cols))
+
+if __name__ == "__main__":
+    main()
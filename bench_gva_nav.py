@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Grand Vibe Auto – cop pursuit benchmark
+---------------------------------------
+Cost of one FlowField rebuild (Dijkstra over the road grid, once per player
+cell change) and of a City.step() full of cops chasing the player, with the
+flow field vs the straight-line chase, on both entity backends. The player
+zig-zags across the map so the field is rebuilt every few frames, as in play.
+
+  python bench_gva_nav.py [cop counts...]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, time
+from a import City, ROADS, WIDTH, HEIGHT
+from gva_nav import FlowField
+from gva_soa import SoaCity
+from vibe_prof import percentile
+
+FRAMES = 120
+
+def rebuild_ms():
+    nav = FlowField(ROADS, WIDTH, HEIGHT)
+    ms = []
+    for i in range(nav.cols*nav.rows):
+        t0 = time.perf_counter()
+        nav.build(i)
+        ms.append((time.perf_counter() - t0) * 1e3)
+    return nav, sorted(ms)
+
+def step_ms(city, frames=FRAMES):
+    city.hp = float("inf")
+    t0 = time.perf_counter()
+    for i in range(frames): city.step((1 if i % 120 < 60 else -1, 1 if i % 80 < 40 else -1))
+    return (time.perf_counter() - t0) * 1e3 / frames
+
+def main(argv=None):
+    counts = [int(a) for a in (argv or sys.argv[1:])] or [100, 1000, 10000]
+    nav, ms = rebuild_ms()
+    road = sum(c == 1 for c in nav.cost)
+    print(f"flow field {nav.cols}x{nav.rows} cells ({road} road), rebuild "
+          f"p50 {percentile(ms, .5):.3f} ms  p95 {percentile(ms, .95):.3f} ms  max {ms[-1]:.3f} ms\n")
+    print(f"{'cops':>8}{'obj line':>12}{'obj flow':>12}{'soa line':>12}{'soa flow':>12}{'rebuilds':>10}")
+    for n in counts:
+        row = []
+        for cls in (City, SoaCity):
+            for flow in (False, True):
+                city = cls(1, n_cars=0, nav=flow)
+                for _ in range(n): city.spawn_cop()
+                row.append(step_ms(city))
+        print(f"{n:>8}" + "".join(f"{t:>10.3f}ms" for t in row) + f"{city.nav.rebuilds:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Grand Vibe Auto – render path A/B
+---------------------------------
+ms/frame (draw + present) for the full redraw, the cached renderer with full
+flips, and the cached renderer with dirty-rect updates, under SDL's dummy
+video driver. Same seeded City, same scripted input for every mode.
+
+  python bench_gva_render.py [cars...]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, time, pygame
+from a import City, RenderCache, render, WIDTH, HEIGHT
+
+FRAMES = 300
+
+def run(screen, font, n, mode):
+    city = City(3, n_cars=n)
+    rc = RenderCache(screen, font, dirty=(mode == "dirty")) if mode != "full" else None
+    t = 0.0
+    for i in range(FRAMES):
+        city.step((1 if i % 120 < 60 else -1, 0))
+        t0 = time.perf_counter()
+        if rc: dirty = rc.draw(city)
+        else: render(screen, font, city); dirty = None
+        if dirty is None: pygame.display.flip()
+        else: pygame.display.update(dirty)
+        t += time.perf_counter() - t0
+    return t * 1e3 / FRAMES
+
+def main(argv=None):
+    counts = [int(a) for a in (argv or sys.argv[1:])] or [8, 100, 1000]
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.SysFont("Consolas", 25, 1)
+    print(f"{'cars':>6}{'full ms':>10}{'cached ms':>11}{'dirty ms':>10}")
+    for n in counts:
+        full, cached, dirty = (run(screen, font, n, m) for m in ("full", "cached", "dirty"))
+        print(f"{n:>6}{full:>10.3f}{cached:>11.3f}{dirty:>10.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Grand Vibe Auto – entity backend benchmark
+------------------------------------------
+City.step() cost on E objects vs the NumPy EntityStore, with one cop per
+ten cars. The 60 FPS budget is 16.7 ms.
+
+  python bench_gva_soa.py [counts...]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sys, time
+from a import City
+from gva_soa import SoaCity
+
+FRAMES = 60
+
+def step_ms(city, frames=FRAMES):
+    t0 = time.perf_counter()
+    for i in range(frames): city.step((1 if i % 120 < 60 else -1, 0))
+    return (time.perf_counter() - t0) * 1e3 / frames
+
+def main(argv=None):
+    counts = [int(a) for a in (argv or sys.argv[1:])] or [100, 1000, 10000, 50000]
+    print(f"{'entities':>10}{'obj ms':>12}{'soa ms':>12}{'speedup':>10}")
+    for n in counts:
+        row = []
+        for cls in (City, SoaCity):
+            city = cls(1, n_cars=n)
+            city.wanted = 3
+            for _ in range(n//10): city.spawn_cop()
+            row.append(step_ms(city))
+        print(f"{n + n//10:>10}{row[0]:>12.3f}{row[1]:>12.3f}{row[0]/row[1]:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Mansion generation benchmark
+----------------------------
+Generation time and traced memory for the original eager generator (Room
+objects, list-of-Room doors, `b not in a.doors`) against LazyMansion, for
+large mansions. "open" is what the game pays at startup; "all" walks every
+floor; "hint" is one toward-stairs lookup.
+
+  python bench_mansion_gen.py
+"""
+import random, time, tracemalloc
+from mansion_gen import LazyMansion
+
+class OldRoom:
+    def __init__(s, i, x, y):
+        s.i, s.x, s.y = i, x, y
+        s.doors, s.ghosts = [], []
+        s.has_stairs = s.visited = False
+
+def old_mansion(n_floors, rooms):
+    floors = []
+    for fl in range(n_floors):
+        n = random.randint(*rooms)
+        rs = [OldRoom(i, random.randint(1, 8), random.randint(1, 5)) for i in range(n)]
+        for i in range(n-1):
+            rs[i].doors.append(rs[i+1]); rs[i+1].doors.append(rs[i])
+        for _ in range(n//2):
+            a, b = random.sample(rs, 2)
+            if b not in a.doors: a.doors.append(b); b.doors.append(a)
+        if fl < n_floors-1: rs[random.randint(1, n-2)].has_stairs = True
+        for r in rs:
+            if random.random() < .5: r.ghosts.append([r.x*96+48, r.y*96+48, 0])
+        floors.append(rs)
+    return floors
+
+def measure(fn):
+    """(result, ms, MiB): timed untraced, then re-run under tracemalloc."""
+    t0 = time.perf_counter()
+    out = fn()
+    dt = time.perf_counter() - t0
+    del out
+    tracemalloc.start()
+    out = fn()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return out, dt*1e3, mem/2**20
+
+def _walk(n_floors, rooms):
+    m = LazyMansion(n_floors, seed=1, rooms=rooms)
+    for i in range(n_floors): m.floors[i]
+    return m
+
+def main():
+    random.seed(1)
+    print(f"{'floors':>7}{'rooms/floor':>13}{'old ms':>10}{'old MiB':>9}"
+          f"{'lazy open ms':>14}{'lazy all ms':>13}{'lazy MiB':>10}{'hint us':>9}")
+    for n_floors, rooms in ((100, (6, 10)), (1000, (6, 10)), (100, (500, 1000)), (300, (1000, 3000))):
+        _, old_ms, old_mb = measure(lambda: old_mansion(n_floors, rooms))
+        m, open_ms, _ = measure(lambda: LazyMansion(n_floors, seed=1, rooms=rooms))
+        _, all_ms, lazy_mb = measure(lambda: _walk(n_floors, rooms))
+        f = m.floors[0]
+        t0 = time.perf_counter()
+        for r in f.rooms: f.toward_stairs(r)
+        hint_us = (time.perf_counter() - t0) * 1e6 / len(f)
+        print(f"{n_floors:>7}{'%d-%d' % rooms:>13}{old_ms:>10.1f}{old_mb:>9.1f}"
+              f"{open_ms:>14.2f}{all_ms:>13.1f}{lazy_mb:>10.1f}{hint_us:>9.2f}")
+
+if __name__ == "__main__":
+    main()
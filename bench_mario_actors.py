@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Mario actor benchmark
+---------------------
+Per-step update + draw cost of N walking enemies spread over a 300-screen
+level: the old way (one Sprite with its own SRCALPHA surface per enemy, the
+whole Group walked with an isinstance check, one blit each) against the
+typed pools in mario_actors.py (shared image, strip-bucketed records,
+activation window, one blits() call).
+
+  python bench_mario_actors.py [steps]
+"""
+import os, sys, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame as pg
+from mario_actors import Goombas, step_body
+from mario_stream import build_tiles, generate
+
+WIDTH, HEIGHT, TILE, GRAVITY = 512, 448, 32, 0.35
+SCREENS = 300
+
+class OldEnemy(pg.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = pg.Surface((TILE, TILE), pg.SRCALPHA)
+        self.image.fill((150, 90, 40))
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.vx, self.vy = -1, 0
+    def update(self, tiles):
+        self.vy, _, wall = step_body(self.rect, self.vx, self.vy, tiles, GRAVITY)
+        if wall: self.vx = -self.vx
+
+class _NoPlayer:                        # nothing to stomp on
+    rect, vy, JUMP = pg.Rect(-999, -999, 1, 1), 0, 0
+NO_PLAYER = _NoPlayer()
+
+def xs(n, tiles):
+    span = tiles.width - 4*TILE
+    return [2*TILE + i*span//n for i in range(n)]
+
+def run_old(screen, tiles, n, steps, scroll=WIDTH*10):
+    group = pg.sprite.Group(OldEnemy(x, TILE*4) for x in xs(n, tiles))
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        for e in group:
+            if isinstance(e, OldEnemy): e.update(tiles)
+        for e in group:
+            screen.blit(e.image, (e.rect.x - scroll, e.rect.y))
+    return (time.perf_counter() - t0)*1e3/steps
+
+def run_pool(screen, tiles, n, steps, scroll=WIDTH*10):
+    pool = Goombas(GRAVITY)
+    for x in xs(n, tiles): pool.spawn(x, TILE*4)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        pool.update(tiles, NO_PLAYER, scroll - WIDTH, scroll + 2*WIDTH)
+        pool.draw(screen, scroll)
+    return (time.perf_counter() - t0)*1e3/steps
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    pg.init()
+    screen = pg.display.set_mode((WIDTH, HEIGHT))
+    tiles = build_tiles(generate(0, 0, WIDTH*SCREENS//TILE), HEIGHT//TILE, TILE)
+    print(f"{'enemies':>8}{'sprites ms':>12}{'pools ms':>10}{'speedup':>9}")
+    for n in (32, 256, 2048, 8192):
+        old = run_old(screen, tiles, n, steps)
+        new = run_pool(screen, tiles, n, steps)
+        print(f"{n:>8}{old:>12.3f}{new:>10.3f}{old/new:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
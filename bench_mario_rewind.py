@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Mario rewind benchmark
+----------------------
+Cost of the per-step snapshot (Rewind.push, copy-forward + active window)
+against packing every actor each step (Rewind.save), of stepping back
+(pop) and loading a save-state, plus the memory held for 10 seconds of
+history at 60 steps/s, for a few level lengths and enemy densities and for
+a castle, whose records also carry the boss's RNG.
+
+  python bench_mario_rewind.py [steps]
+"""
+import os, sys, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import random
+import pygame as pg
+import o3aphamario4k as m
+
+CASES = [(2, 2, False), (40, 30, False), (300, 10, False), (2, 0, True)]   # (screens, enemies per screen, castle)
+
+class Keys:
+    def __init__(self, down): self.down = set(down)
+    def __getitem__(self, k): return k in self.down
+
+def us(fn, n):
+    t0 = time.perf_counter()
+    for _ in range(n): fn()
+    return (time.perf_counter() - t0)*1e6/n
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    print(f"{'screens':>8}{'castle':>7}{'enemies':>8}{'record B':>10}{'ring MB':>9}{'tiles B':>9}"
+          f"{'push us':>9}{'full us':>9}{'pop us':>9}{'load us':>9}")
+    for screens, per, castle in CASES:
+        m.LEVEL_SCREENS, m.ENEMIES = screens, per
+        random.seed(1)
+        g = m.Game()
+        if castle:
+            g.level = m.Level(0, m.LEVELS_PER_WORLD-1)
+            g.rewind = m.Rewind(g.level, m.REWIND_S, m.SIM_HZ)
+        run = Keys([pg.K_RIGHT, pg.K_x])
+        lv = g.level
+        rw, push = g.rewind, 0.0
+        for _ in range(steps):
+            lv.update(run)
+            t0 = time.perf_counter(); rw.push(); push += time.perf_counter() - t0
+        push_us = push*1e6/steps
+        full_us = us(rw.save, 200)
+        pop_us = us(rw.pop, min(200, len(rw) - 1))
+        state = rw.save()
+        load_us = us(lambda: rw.load(state), 50)
+        print(f"{screens:>8}{'yes' if castle else 'no':>7}{len(rw.bodies):>8}{rw.size:>10,}{len(rw.buf)/1e6:>9.2f}{len(rw.tiles):>9,}"
+              f"{push_us:>9.1f}{full_us:>9.1f}{pop_us:>9.1f}{load_us:>9.1f}")
+    pg.quit()
+
+if __name__ == "__main__":
+    main()
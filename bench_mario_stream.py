@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Mario level streaming benchmark
+-------------------------------
+Main-thread cost of a level transition: building the next Level (tiles +
+first chunk surfaces) synchronously, as next_level used to, against taking
+the one LevelStreamer prefetched on its worker thread while the previous
+level was being played.
+
+  python bench_mario_stream.py
+"""
+import os, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame as pg
+from mario_stream import LevelStreamer, build_tiles, describe
+
+WIDTH, HEIGHT, TILE = 512, 448, 32
+COLOR = (0, 168, 40)
+
+def sync_ms(world, idx, cols):
+    t0 = time.perf_counter()
+    m = build_tiles(describe(world, idx, cols), HEIGHT//TILE, TILE)
+    for c in range(2): m.chunk_surface(c, COLOR)
+    return (time.perf_counter() - t0)*1e3
+
+def streamed_ms(stream, world, idx, cols):
+    stream.prefetch(world, idx, cols, False, COLOR)
+    time.sleep(0.5)                         # "the current level is being played"
+    t0 = time.perf_counter()
+    m = stream.take(world, idx, cols, False, COLOR)
+    for c in range(2): m.chunk_surface(c, COLOR)
+    return (time.perf_counter() - t0)*1e3
+
+def main():
+    pg.init()
+    pg.display.set_mode((WIDTH, HEIGHT))
+    stream = LevelStreamer(HEIGHT//TILE, TILE, WIDTH)
+    print(f"{'screens':>8}{'sync ms':>10}{'streamed ms':>13}")
+    for i, screens in enumerate((2, 50, 300, 1000)):
+        cols = WIDTH*screens//TILE
+        print(f"{screens:>8}{sync_ms(0, i, cols):>10.3f}{streamed_ms(stream, 1, i, cols):>13.3f}")
+    print(stream.stats())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Mario tilemap benchmark
+-----------------------
+Per-frame cost of tile collision and tile drawing for the original flat
+list of ground rects (collidelistall against every tile, pg.draw.rect for
+every tile) against the chunked TileMap, for levels from the current two
+screens up to a few hundred, with a crowd of actors walking the ground.
+
+  python bench_mario_tiles.py [frames]
+"""
+import os, sys, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame as pg
+from mario_tiles import TileMap
+
+WIDTH, HEIGHT, TILE = 512, 448, 32
+COLOR = (0, 168, 40)
+
+def flat_tiles(screens):
+    return [pg.Rect(x, HEIGHT-TILE*2, TILE, TILE*2) for x in range(0, WIDTH*screens, TILE)]
+
+def tilemap(screens):
+    rows = HEIGHT//TILE
+    m = TileMap(WIDTH*screens//TILE, rows, TILE)
+    m.fill(0, m.cols, rows-2, rows)
+    return m
+
+def actors(n, screens):
+    span = WIDTH*screens - TILE
+    return [pg.Rect(i*span//max(1, n), HEIGHT-TILE*3+4, TILE, TILE) for i in range(n)]
+
+def run_flat(screen, tiles, rects, frames):
+    t0 = time.perf_counter()
+    for f in range(frames):
+        scroll = f*3 % (WIDTH*(len(tiles)*TILE//WIDTH - 1) or 1)
+        for r in rects:
+            r.y += 4
+            for t in r.collidelistall(tiles): r.bottom = tiles[t].top
+            r.collidelistall(tiles)
+        for t in tiles:
+            pg.draw.rect(screen, COLOR, t.move(-scroll, 0))
+    return (time.perf_counter() - t0)*1e3/frames
+
+def run_map(screen, m, rects, frames):
+    t0 = time.perf_counter()
+    for f in range(frames):
+        scroll = f*3 % (m.width - WIDTH or 1)
+        for r in rects:
+            r.y += 4
+            for t in m.around(r): r.bottom = t.top
+            m.around(r)
+        m.draw(screen, scroll, COLOR)
+    return (time.perf_counter() - t0)*1e3/frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pg.init()
+    screen = pg.display.set_mode((WIDTH, HEIGHT))
+    print(f"{'screens':>8}{'actors':>8}{'flat ms':>10}{'chunked ms':>12}{'speedup':>9}")
+    for screens, n in ((2, 4), (2, 64), (50, 64), (300, 64), (300, 512)):
+        flat = run_flat(screen, flat_tiles(screens), actors(n, screens), frames)
+        chunked = run_map(screen, tilemap(screens), actors(n, screens), frames)
+        print(f"{screens:>8}{n:>8}{flat:>10.3f}{chunked:>12.3f}{flat/chunked:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Batched headless breakout simulator
+-----------------------------------
+K independent breakout games held as NumPy arrays (brick alive masks,
+paddle x, ball position/velocity) and advanced together by one step(actions)
+call, with no pygame and no display, for bots and agent training. The field
+matches ######pong4k.py: 800x600, a 6x10 brick wall, a 110 px paddle
+moving 9 px per frame, and one ball at 5 px per frame that leaves the paddle
+at up to 60 degrees off vertical depending on where it lands.
+
+The ball is a point probe one radius ahead of it on each axis, moved x then
+y, so it takes at most one brick per axis per frame. At 5 px per frame
+against 25 px bricks that never tunnels, but it is simpler than the swept
+multi-ball solver in ballphys.py, so a run here will not match the game
+frame for frame.
+
+    sim = BreakoutSim(1024, seed=1)
+    obs = sim.obs()                                 # (K, 5) float32
+    obs, reward, done = sim.step(follow(obs))       # actions: 0 stay, 1 left, 2 right
+
+Finished games (ball lost or wall cleared) are reset inside step(); `done`
+flags them for that frame. rollout()/sharded() spread envs over processes.
+"""
+import math, time
+import numpy as np
+
+W, H          = 800, 600
+ROWS, COLS    = 6, 10
+GAP, TOP      = 4, 60
+BRICK_W       = (W - GAP*(COLS + 1)) // COLS
+BRICK_H       = 25
+PADDLE_W, PADDLE_H, PADDLE_Y, PADDLE_SPEED = 110, 15, H - 60, 9
+BALL_R        = 8
+BALL_SPEED    = 5.0
+PADDLE_ANGLE  = 60
+
+STAY, LEFT, RIGHT = 0, 1, 2
+MOVE = np.array([0, -PADDLE_SPEED, PADDLE_SPEED], np.float64)
+
+class BreakoutSim:
+    def __init__(self, k, seed=None, rows=ROWS, cols=COLS):
+        self.k, self.rows, self.cols = k, rows, cols
+        self.bw = (W - GAP*(cols + 1)) // cols
+        self.bh = min(BRICK_H, (H//2 - TOP)//rows - GAP)
+        self.px, self.py = self.bw + GAP, self.bh + GAP
+        self.rng = np.random.default_rng(seed)
+        self.alive = np.ones((k, rows*cols), bool)
+        self.left = np.full(k, rows*cols, np.int32)
+        self.paddle = np.empty(k)                       # paddle centre x
+        self.pos, self.vel = np.empty((k, 2)), np.empty((k, 2))
+        self.frames = np.zeros(k, np.int64)             # frames into the current game
+        self.steps = self.games = self.wins = self.bricks = 0
+        self.reset()
+
+    def reset(self, mask=None):
+        """Restart every game, or those where mask is True."""
+        i = np.arange(self.k) if mask is None else np.flatnonzero(mask)
+        if not i.size: return
+        self.alive[i] = True
+        self.left[i] = self.rows*self.cols
+        self.paddle[i] = W//2
+        self.frames[i] = 0
+        # serve(): from above the paddle, up and to a random side
+        side = self.rng.choice((-1.0, 1.0), i.size)
+        self.pos[i, 0] = W//2
+        self.pos[i, 1] = PADDLE_Y - BALL_R - 1
+        self.vel[i, 0] = side*BALL_SPEED/math.sqrt(2)
+        self.vel[i, 1] = -BALL_SPEED/math.sqrt(2)
+
+    def obs(self):
+        """(K, 5) float32: paddle x, ball x, ball y, ball vx, ball vy."""
+        return np.column_stack([self.paddle, self.pos, self.vel]).astype(np.float32)
+
+    # -- simulation ----------------------------------------------------------
+    def _brick(self, x, y):
+        """Cell index of the live brick under each point, or -1."""
+        cx, cy = x - GAP, y - TOP
+        col, row = np.floor_divide(cx, self.px).astype(np.intp), np.floor_divide(cy, self.py).astype(np.intp)
+        inside = ((row >= 0) & (row < self.rows) & (col >= 0) & (col < self.cols)
+                  & (cx - col*self.px < self.bw) & (cy - row*self.py < self.bh))
+        cell = np.where(inside, row*self.cols + col, 0)
+        hit = inside & self.alive[np.arange(self.k), cell]
+        return np.where(hit, cell, -1)
+
+    def _break(self, cell, reward):
+        hit = cell >= 0
+        i = np.flatnonzero(hit)
+        self.alive[i, cell[i]] = False
+        self.left -= hit
+        reward += hit
+        self.bricks += len(i)
+        return hit
+
+    def step(self, actions):
+        """Advance every game one frame. actions: (K,) ints in {0, 1, 2}.
+        Returns (obs, reward, done); reward is +1 per brick and -1 for a
+        lost ball, and done games are already reset in the returned obs."""
+        x, y, vx, vy = self.pos[:, 0], self.pos[:, 1], self.vel[:, 0], self.vel[:, 1]
+        reward = np.zeros(self.k, np.float32)
+        half = PADDLE_W/2
+        np.clip(self.paddle + MOVE[np.asarray(actions)], half, W - half, out=self.paddle)
+
+        # x move, then bricks ahead along x, then side walls
+        x += vx
+        hit = self._break(self._brick(x + np.sign(vx)*BALL_R, y), reward)
+        x[hit] -= vx[hit]; vx[hit] *= -1
+        lw, rw = x < BALL_R, x > W - BALL_R
+        x[lw] = 2*BALL_R - x[lw];             vx[lw] = np.abs(vx[lw])
+        x[rw] = 2*(W - BALL_R) - x[rw];       vx[rw] = -np.abs(vx[rw])
+
+        # y move, then bricks ahead along y, then the top wall
+        bottom0 = y + BALL_R
+        y += vy
+        hit = self._break(self._brick(x, y + np.sign(vy)*BALL_R), reward)
+        y[hit] -= vy[hit]; vy[hit] *= -1
+        tw = y < BALL_R
+        y[tw] = 2*BALL_R - y[tw];             vy[tw] = np.abs(vy[tw])
+
+        # paddle: bottom of the ball crossed its top edge this frame
+        off = (x - self.paddle)/half
+        pad = (vy > 0) & (bottom0 <= PADDLE_Y) & (y + BALL_R >= PADDLE_Y) & (np.abs(x - self.paddle) <= half + BALL_R)
+        if pad.any():
+            ang = np.radians(np.clip(off[pad], -1, 1)*PADDLE_ANGLE)
+            spd = np.hypot(vx[pad], vy[pad])
+            vx[pad] = spd*np.sin(ang); vy[pad] = -spd*np.cos(ang)
+            y[pad] = PADDLE_Y - BALL_R
+
+        lost = y - BALL_R >= H
+        won = self.left == 0
+        reward -= lost
+        done = lost | won
+        self.frames += 1
+        self.steps += self.k
+        n = int(done.sum())
+        if n:
+            self.games += n; self.wins += int(won.sum())
+            self.reset(done)
+        return self.obs(), reward, done
+
+# ---------------------------------------------------------------------------
+def follow(obs, dead_zone=8):
+    """Scripted policy: keep the paddle under the ball."""
+    d = obs[:, 1] - obs[:, 0]
+    return np.where(d < -dead_zone, LEFT, np.where(d > dead_zone, RIGHT, STAY))
+
+def rollout(job):
+    """Run one shard: (k, frames, seed, policy) with policy 'follow' or
+    'random'. Returns a dict of totals; top-level so a process pool can
+    pickle it."""
+    k, frames, seed, policy = job
+    sim = BreakoutSim(k, seed)
+    rng = np.random.default_rng(seed)
+    obs, total = sim.obs(), 0.0
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        act = follow(obs) if policy == "follow" else rng.integers(0, 3, k)
+        obs, reward, done = sim.step(act)
+        total += float(reward.sum())
+    return {"envs": k, "steps": sim.steps, "games": sim.games, "wins": sim.wins,
+            "bricks": sim.bricks, "reward": total, "wall_s": time.perf_counter() - t0}
+
+def sharded(k, frames, jobs, seed=0, policy="follow"):
+    """rollout() over `jobs` processes, K envs split between them; returns
+    the summed totals, wall_s being the wall time of the whole run."""
+    from multiprocessing import Pool
+    share = [k//jobs + (i < k % jobs) for i in range(jobs)]
+    t0 = time.perf_counter()
+    with Pool(jobs) as pool:
+        parts = pool.map(rollout, [(n, frames, seed + i, policy) for i, n in enumerate(share) if n])
+    out = {key: sum(p[key] for p in parts) for key in ("envs", "steps", "games", "wins", "bricks", "reward")}
+    out["wall_s"] = time.perf_counter() - t0
+    return out
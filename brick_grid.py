@@ -0,0 +1,76 @@
+"""
+Grid-indexed brick store for the breakout game
+----------------------------------------------
+Bricks sit on a regular rows x cols lattice, so a brick's cell *is* its
+index: a ball rect only tests the handful of cells it overlaps, removal just
+clears an alive flag, and the live count is kept alongside. Iterating yields
+(rect, color) in row-major order like the old list, and hit() returns the
+same first brick the old `for rect, color in bricks[:]` scan would have.
+"""
+import pygame as pg
+
+class BrickGrid:
+    def __init__(self, rows, cols, brick_w, brick_h, gap, top, colors):
+        self.rows, self.cols = rows, cols
+        self.bw, self.bh, self.gap, self.top = brick_w, brick_h, gap, top
+        self.px, self.py = brick_w + gap, brick_h + gap     # cell pitch
+        self.colors = colors
+        self.alive = bytearray(rows * cols)
+        self.left = 0
+        self.reset()
+
+    def reset(self, layout=None):
+        """Fill the grid; `layout` is an optional rows x cols iterable of truthy
+        cells (e.g. strings from a level pack, '#' = brick, '.' = empty)."""
+        if layout is None:
+            self.alive[:] = b"\x01" * len(self.alive)
+        else:
+            cells = [1 if ch not in ". 0" else 0 for line in layout for ch in line]
+            if len(cells) != len(self.alive):
+                raise ValueError(f"layout has {len(cells)} cells, grid has {len(self.alive)}")
+            self.alive[:] = bytes(cells)
+        self.left = sum(self.alive)
+
+    # -- geometry ------------------------------------------------------------
+    def rect(self, row, col):
+        return pg.Rect(self.gap + col*self.px, self.top + row*self.py, self.bw, self.bh)
+
+    def color(self, row):
+        return self.colors[row % len(self.colors)]
+
+    def span(self, rect):
+        """(r0, r1, c0, c1) inclusive cell range a rect can touch, clamped."""
+        c0 = max(0, (rect.left - self.gap) // self.px)
+        c1 = min(self.cols - 1, (rect.right - 1 - self.gap) // self.px)
+        r0 = max(0, (rect.top - self.top) // self.py)
+        r1 = min(self.rows - 1, (rect.bottom - 1 - self.top) // self.py)
+        return r0, r1, c0, c1
+
+    # -- queries -------------------------------------------------------------
+    def hit(self, rect):
+        """First live brick overlapping rect as (row, col, brick_rect), or None."""
+        if not self.left: return None
+        r0, r1, c0, c1 = self.span(rect)
+        alive, cols = self.alive, self.cols
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                if alive[row*cols + col]:
+                    b = self.rect(row, col)
+                    if rect.colliderect(b):
+                        return row, col, b
+        return None
+
+    def remove(self, row, col):
+        i = row*self.cols + col
+        if self.alive[i]:
+            self.alive[i] = 0
+            self.left -= 1
+
+    def __len__(self): return self.left
+
+    def __iter__(self):
+        alive, cols = self.alive, self.cols
+        for i in range(len(alive)):
+            if alive[i]:
+                row, col = divmod(i, cols)
+                yield self.rect(row, col), self.color(row)
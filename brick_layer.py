@@ -0,0 +1,32 @@
+"""
+Persistent brick layer for the breakout game
+--------------------------------------------
+Rounded-rect bricks are among pygame's slowest primitives, yet they only
+change when one is destroyed. BrickLayer draws the background plus every
+live brick once (at reset), erases single bricks in place when they die, and
+is blitted back over whatever moved: the whole frame on a full redraw, or
+just the dirty rects otherwise.
+"""
+import pygame as pg
+
+class BrickLayer:
+    def __init__(self, grid, size, bg, radius=4):
+        self.grid, self.bg, self.radius = grid, bg, radius
+        self.surf = pg.Surface(size)
+        if pg.display.get_surface(): self.surf = self.surf.convert()
+        self.rebuild()
+
+    def rebuild(self):
+        self.surf.fill(self.bg)
+        for rect, color in self.grid:
+            pg.draw.rect(self.surf, color, rect, border_radius=self.radius)
+
+    def erase(self, row, col):
+        """Clear one brick from the layer; returns the rect to refresh."""
+        rect = self.grid.rect(row, col)
+        self.surf.fill(self.bg, rect)
+        return rect
+
+    def restore(self, screen, rects):
+        for r in rects:
+            screen.blit(self.surf, r, r)
@@ -0,0 +1,122 @@
+"""
+Chiptune SFX synthesis
+----------------------
+Bulk NumPy waveform generation (sine, square, triangle, noise) with a simple
+linear ADSR envelope, memoized per (wave, freq, ms, volume, adsr) and
+optionally persisted as .npy files so a relaunch loads the SFX bank instead of
+recomputing it. VoicePool plays them through a fixed set of mixer channels
+with oldest-voice stealing.
+
+    bank = SynthBank(44100, channels=1, cache_dir=os.environ.get("VIBE_SFX_CACHE"))
+    SFX_BEEP = bank.sound("square", 880, 60, 0.4, adsr=(2, 10, 0.7, 20))
+"""
+import os, hashlib
+import numpy as np
+
+WAVES = ("sine", "square", "triangle", "noise")
+
+def envelope(n, rate, adsr):
+    """Per-sample gain for adsr=(attack_ms, decay_ms, sustain_level, release_ms)."""
+    a, d, s, r = adsr
+    a, d, r = (int(rate*v/1000) for v in (a, d, r))
+    a = min(a, n); d = min(d, n-a); r = min(r, n-a-d)
+    xs = [0, a, a+d, n-r, n]
+    ys = [0.0 if a else 1.0, 1.0, s, s, 0.0 if r else s]
+    return np.interp(np.arange(n), xs, ys)
+
+def waveform(wave="sine", freq=440.0, ms=100, volume=0.5, rate=44100, adsr=None, seed=0):
+    """Mono int16 samples. Sine matches the old per-sample synth_tone exactly."""
+    n = int(rate * ms / 1000)
+    t = np.arange(n) / rate
+    if wave == "sine":
+        y = np.sin(2*np.pi*freq*t)
+    elif wave == "square":
+        y = np.where((freq*t) % 1.0 < 0.5, 1.0, -1.0)
+    elif wave == "triangle":
+        y = 4*np.abs((freq*t) % 1.0 - 0.5) - 1
+    elif wave == "noise":
+        # sample-and-hold white noise, re-rolled `freq` times a second
+        steps = np.floor(freq*t).astype(np.int64)
+        vals = np.random.default_rng(seed).uniform(-1, 1, int(steps[-1])+1 if n else 0)
+        y = vals[steps]
+    else:
+        raise ValueError(f"unknown waveform {wave!r}; pick one of {WAVES}")
+    if adsr: y = y * envelope(n, rate, adsr)
+    return (int(volume*32767) * y).astype(np.int16)
+
+# ---------------------------------------------------------------------------
+class SynthBank:
+    def __init__(self, rate=44100, channels=1, cache_dir=None):
+        self.rate, self.channels = rate, channels
+        self.cache_dir = cache_dir
+        self._pcm, self._snd = {}, {}
+        self.hits = self.misses = self.disk_hits = 0
+        if cache_dir: os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        tag = hashlib.sha1(repr((key, self.rate)).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key[0]}-{tag}.npy")
+
+    def samples(self, wave="sine", freq=440.0, ms=100, volume=0.5, adsr=None):
+        key = (wave, float(freq), ms, float(volume), tuple(adsr) if adsr else None)
+        pcm = self._pcm.get(key)
+        if pcm is not None:
+            self.hits += 1
+            return pcm
+        self.misses += 1
+        path = self._path(key) if self.cache_dir else None
+        if path and os.path.exists(path):
+            pcm = np.load(path); self.disk_hits += 1
+        else:
+            pcm = waveform(wave, freq, ms, volume, self.rate, adsr)
+            if path:
+                np.save(path + ".tmp.npy", pcm); os.replace(path + ".tmp.npy", path)
+        self._pcm[key] = pcm
+        return pcm
+
+    def sound(self, wave="sine", freq=440.0, ms=100, volume=0.5, adsr=None):
+        """Memoized pygame Sound; one shared object per distinct tone."""
+        import pygame
+        key = (wave, float(freq), ms, float(volume), tuple(adsr) if adsr else None)
+        snd = self._snd.get(key)
+        if snd is not None:
+            self.hits += 1
+        else:
+            pcm = self.samples(wave, freq, ms, volume, adsr)
+            if self.channels > 1:
+                pcm = np.repeat(pcm[:, None], self.channels, axis=1)
+            snd = self._snd[key] = pygame.mixer.Sound(buffer=np.ascontiguousarray(pcm).tobytes())
+        return snd
+
+    def stats(self):
+        return {"tones": len(self._pcm), "hits": self.hits, "misses": self.misses,
+                "disk_hits": self.disk_hits}
+
+# ---------------------------------------------------------------------------
+class VoicePool:
+    """Fixed set of reserved mixer channels. play() takes a free channel or,
+    when all are busy, steals the one that started longest ago."""
+    def __init__(self, n=8):
+        import pygame
+        if pygame.mixer.get_num_channels() < n + 1:
+            pygame.mixer.set_num_channels(n + 1)
+        pygame.mixer.set_reserved(n)
+        self.chans   = [pygame.mixer.Channel(i) for i in range(n)]
+        self.started = [0] * n
+        self.clock   = 0
+        self.plays = self.dropped = 0
+
+    def play(self, snd):
+        self.clock += 1; self.plays += 1
+        busy = [c.get_busy() for c in self.chans]
+        if all(busy):
+            i = min(range(len(self.chans)), key=self.started.__getitem__)
+            self.chans[i].stop(); self.dropped += 1
+        else:
+            i = busy.index(False)
+        self.started[i] = self.clock
+        self.chans[i].play(snd)
+        return self.chans[i]
+
+    def stats(self):
+        return {"voices": len(self.chans), "plays": self.plays, "dropped": self.dropped}
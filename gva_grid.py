@@ -0,0 +1,92 @@
+"""
+Grand Vibe Auto – broad-phase spatial hash
+------------------------------------------
+Uniform grid over the city keyed to the 120 px road pitch. Anything with
+x, y, w, h attributes (E instances) can live in it; each entity remembers its
+cell in `k` so E.m() only touches the grid when the entity crosses a cell.
+Cells are insertion-ordered dicts, so query/pair order is deterministic.
+"""
+CELL = 120
+
+def overlap(a, b):
+    """Integer AABB test with pygame.Rect's truncation, minus the Rect."""
+    ax, ay, bx, by = int(a.x), int(a.y), int(b.x), int(b.y)
+    return ax < bx+b.w and bx < ax+a.w and ay < by+b.h and by < ay+a.h
+
+class SpatialGrid:
+    def __init__(self, cell=CELL):
+        self.cell  = cell
+        self.cells = {}     # (cx,cy) -> {entity: None}
+        self.pad   = 1      # neighbour rings needed to cover the biggest entity
+        self.n     = 0
+
+    def key(self, e):
+        return int(e.x)//self.cell, int(e.y)//self.cell
+
+    # -- maintenance ---------------------------------------------------------
+    def insert(self, e):
+        e.g, e.k = self, self.key(e)
+        self.cells.setdefault(e.k, {})[e] = None
+        self.pad = max(self.pad, -(-max(e.w, e.h)//self.cell))
+        self.n  += 1
+
+    def remove(self, e):
+        bucket = self.cells[e.k]
+        del bucket[e]
+        if not bucket: del self.cells[e.k]
+        e.g = e.k = None
+        self.n -= 1
+
+    def move(self, e):
+        k = self.key(e)
+        if k == e.k: return
+        bucket = self.cells[e.k]
+        del bucket[e]
+        if not bucket: del self.cells[e.k]
+        e.k = k
+        self.cells.setdefault(k, {})[e] = None
+
+    def clear(self):
+        for bucket in self.cells.values():
+            for e in bucket: e.g = e.k = None
+        self.cells.clear(); self.n = 0
+
+    def __len__(self): return self.n
+
+    # -- queries -------------------------------------------------------------
+    def query(self, x, y, w, h):
+        """Entities whose rect overlaps (x, y, w, h)."""
+        c, p, cells = self.cell, self.pad, self.cells
+        probe = _Box(x, y, w, h)
+        x0, y0 = int(x)//c - p, int(y)//c - p
+        x1, y1 = (int(x)+w)//c, (int(y)+h)//c
+        for cy in range(y0, y1+1):
+            for cx in range(x0, x1+1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for e in bucket:
+                        if overlap(probe, e): yield e
+
+    def near(self, e):
+        """Entities overlapping e, excluding e itself."""
+        return (o for o in self.query(e.x, e.y, e.w, e.h) if o is not e)
+
+    def pairs(self):
+        """Every overlapping entity pair exactly once (half-neighbourhood sweep)."""
+        cells, p = self.cells, self.pad
+        fwd = [(dx, dy) for dy in range(0, p+1) for dx in range(-p, p+1) if dy or dx > 0]
+        for (cx, cy), bucket in cells.items():
+            ents = list(bucket)
+            for i, a in enumerate(ents):
+                for b in ents[i+1:]:
+                    if overlap(a, b): yield a, b
+            for dx, dy in fwd:
+                other = cells.get((cx+dx, cy+dy))
+                if other:
+                    for a in ents:
+                        for b in other:
+                            if overlap(a, b): yield a, b
+
+class _Box:
+    __slots__ = ("x", "y", "w", "h")
+    def __init__(self, x, y, w, h): self.x, self.y, self.w, self.h = x, y, w, h
@@ -0,0 +1,148 @@
+"""
+Grand Vibe Auto – struct-of-arrays entity backend
+-------------------------------------------------
+Cars and cops as contiguous NumPy columns (x, y, vx, vy, dx, dy, speed, w, h,
+kind) advanced in one vectorized step: cars bounce on the 860/560 bounds,
+cops pursue the player along the road flow field (or the normalized offset
+once close), and off-screen cops are culled by compaction. SoaCity is a drop-in City for 10k+ entity scenes; the
+plain E/City path stays the default for small ones.
+"""
+import numpy as np
+from a import City, DIRS, DT, WIDTH, HEIGHT
+from gva_nav import NEAR
+
+CAR, COP = 0, 1
+MAX_X, MAX_Y = 860, 560
+SIZE = {CAR: (32, 24), COP: (36, 28)}
+
+class EntityStore:
+    COLS = (("x", np.float64), ("y", np.float64), ("vx", np.float64), ("vy", np.float64),
+            ("dx", np.float64), ("dy", np.float64), ("sp", np.float64),
+            ("w", np.int32), ("h", np.int32), ("kind", np.uint8))
+
+    def __init__(self, cap=256):
+        self.n = 0
+        self.cap = cap
+        for name, dt in self.COLS:
+            setattr(self, "_" + name, np.zeros(cap, dt))
+
+    def __len__(self): return self.n
+
+    def __getattr__(self, name):
+        # live views: store.x, store.kind, ... cover only the first n slots
+        if name in _COLNAMES:
+            return self.__dict__["_" + name][:self.n]
+        raise AttributeError(name)
+
+    def _grow(self, need):
+        cap = self.cap
+        while cap < need: cap *= 2
+        for name, _ in self.COLS:
+            old = getattr(self, "_" + name)
+            new = np.zeros(cap, old.dtype); new[:self.n] = old[:self.n]
+            setattr(self, "_" + name, new)
+        self.cap = cap
+
+    def add(self, kind, x, y, sp, dx=0, dy=0):
+        """Append one entity; columns may be scalars or equal-length arrays."""
+        k = len(np.atleast_1d(x))
+        if self.n + k > self.cap: self._grow(self.n + k)
+        i, j = self.n, self.n + k
+        w, h = SIZE[kind]
+        self._x[i:j], self._y[i:j], self._sp[i:j] = x, y, sp
+        self._dx[i:j], self._dy[i:j] = dx, dy
+        self._vx[i:j] = self._vy[i:j] = 0
+        self._w[i:j], self._h[i:j], self._kind[i:j] = w, h, kind
+        self.n = j
+        return slice(i, j)
+
+    def count(self, kind):
+        return int(np.count_nonzero(self.kind == kind))
+
+    # -- sim -----------------------------------------------------------------
+    def step(self, px, py, nav=None):
+        """Same motion as E.m() for every car and cop at once."""
+        x, y, vx, vy, dx, dy, sp = self.x, self.y, self.vx, self.vy, self.dx, self.dy, self.sp
+        car = self.kind == CAR
+        ox, oy = px - x, py - y
+        d = np.maximum(1, np.hypot(ox, oy))
+        cx, cy = ox/d, oy/d
+        if nav is not None:
+            c = nav.cell
+            i = (np.clip(np.floor_divide(y + self.h/2, c), 0, nav.rows-1).astype(np.intp)*nav.cols
+                 + np.clip(np.floor_divide(x + self.w/2, c), 0, nav.cols-1).astype(np.intp))
+            far = np.frombuffer(nav.dist, np.int32)[i] > NEAR
+            cx = np.where(far, np.frombuffer(nav.fx, np.int8)[i], cx)
+            cy = np.where(far, np.frombuffer(nav.fy, np.int8)[i], cy)
+        np.copyto(vx, np.where(car, dx*sp, cx*sp))
+        np.copyto(vy, np.where(car, dy*sp, cy*sp))
+        x += vx; y += vy
+        dx[car & ((x < 0) | (x > MAX_X))] *= -1
+        dy[car & ((y < 0) | (y > MAX_Y))] *= -1
+
+    def cull(self, w=WIDTH, h=HEIGHT):
+        """Drop cops that left the screen, keeping order; returns how many."""
+        x, y = self.x, self.y
+        keep = (self.kind != COP) | ((x >= 0) & (x < w) & (y >= 0) & (y < h))
+        k = int(np.count_nonzero(keep))
+        if k == self.n: return 0
+        for name, _ in self.COLS:
+            col = getattr(self, "_" + name)
+            col[:k] = col[:self.n][keep]
+        gone, self.n = self.n - k, k
+        return gone
+
+    def hits(self, x, y, w, h):
+        """Bool mask of entities overlapping the rect (pygame.Rect truncation)."""
+        ex, ey = self.x.astype(np.int64), self.y.astype(np.int64)
+        x, y = int(x), int(y)
+        return (ex < x+w) & (x < ex+self.w) & (ey < y+h) & (y < ey+self.h)
+
+    def boxes(self, kind):
+        m = self.kind == kind
+        return zip(self.x[m].astype(int).tolist(), self.y[m].astype(int).tolist(),
+                   self.w[m].tolist(), self.h[m].tolist())
+
+_COLNAMES = {name for name, _ in EntityStore.COLS}
+
+# ---------------------------------------------------------------------------
+class SoaCity(City):
+    """City on an EntityStore. Draws the RNG in the same order as City, so the
+    same seed and inputs give the same session on either backend. The inherited
+    cars/cops lists and grid stay empty; everything lives in `store`."""
+    def __init__(s, seed=None, n_cars=8, nav=True):
+        super().__init__(seed, n_cars=0, nav=nav)
+        s.store = EntityStore(max(256, n_cars*2))
+        for _ in range(n_cars):
+            x, y = s.rng.randint(60, 840), s.rng.randint(60, 540)
+            dx, dy = s.rng.choice(DIRS)
+            s.store.add(CAR, x, y, 2, dx, dy)
+
+    def step(s, inputs=(0, 0)):
+        p, st = s.player, s.store; ix, iy = inputs
+        if s.nav: s.nav.update(p.x+p.w/2, p.y+p.h/2)
+        st.step(p.x, p.y, s.nav)
+        p.x = max(0, min(WIDTH-p.w, p.x+ix*p.s))
+        p.y = max(0, min(HEIGHT-p.h, p.y+iy*p.s))
+        s.frame += 1; s.t = s.frame*DT; now = s.t
+        hit = st.hits(p.x, p.y, p.w, p.h)
+        car_hit = bool((hit & (st.kind == CAR)).any())
+        cop_hit = bool((hit & (st.kind == COP)).any())
+        if car_hit and now-s.lhit > 0.6:
+            s.hp -= 8; s.score -= 2; s.wanted = min(3, s.wanted+1); s.lhit = now; s.car_hits += 1
+            if st.count(COP) < s.wanted*2:
+                for _ in range(s.wanted): s.spawn_cop()
+        if cop_hit and now-s.lhit > 0.7:
+            s.hp -= 18; s.score -= 5; s.lhit = now; s.cop_hits += 1
+        st.cull()
+        s.peak_cops = max(s.peak_cops, st.count(COP)); s.peak_wanted = max(s.peak_wanted, s.wanted)
+        return s.hp > 0
+
+    def spawn_cop(s):
+        x, y = s.rng.randint(20, WIDTH-60), s.rng.randint(20, HEIGHT-60)
+        s.rng.choice(DIRS)      # E() draws a heading for cops too; keep the stream aligned
+        s.store.add(COP, x, y, 2.7+0.5*s.wanted)
+        s.spawned += 1
+
+    def boxes(s, kind):
+        return s.store.boxes(CAR if kind == 'car' else COP)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Grand Vibe Auto – headless soak runner
+--------------------------------------
+Runs N seeded City sessions back-to-back (or across a process pool) with no
+display and no frame cap, and writes one CSV row of stats per session.
+
+  python gva_soak.py -n 1000 -f 3600 -j 8 -o soak.csv
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import argparse, csv, random, sys, time
+from multiprocessing import Pool
+from a import City, FPS
+
+# ---------------------------------------------------------------------------
+# Scripted driver: holds a random heading for a while, then picks another.
+class Wanderer:
+    def __init__(self, seed, hold=(10, 90)):
+        self.rng  = random.Random(seed)
+        self.hold = hold
+        self.left = 0
+        self.cur  = (0, 0)
+    def __call__(self, city):
+        if self.left <= 0:
+            self.cur  = (self.rng.choice((-1, 0, 1)), self.rng.choice((-1, 0, 1)))
+            self.left = self.rng.randint(*self.hold)
+        self.left -= 1
+        return self.cur
+
+def make_city(backend, seed, n_cars):
+    if backend == "soa":
+        from gva_soa import SoaCity     # numpy only needed for this backend
+        return SoaCity(seed, n_cars=n_cars)
+    return City(seed, n_cars=n_cars)
+
+def run_session(job):
+    seed, frames, n_cars, backend = job
+    city  = make_city(backend, seed, n_cars)
+    drive = Wanderer(seed ^ 0x5EED)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        if not city.step(drive(city)):
+            break
+    row = city.stats()
+    row["wall_s"] = round(time.perf_counter() - t0, 4)
+    return row
+
+# ---------------------------------------------------------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("-n", "--sessions", type=int, default=100)
+    ap.add_argument("-f", "--frames", type=int, default=FPS*120, help="max frames per session")
+    ap.add_argument("-s", "--seed", type=int, default=0, help="seed of the first session")
+    ap.add_argument("-c", "--cars", type=int, default=8)
+    ap.add_argument("-b", "--backend", choices=("obj", "soa"), default="obj",
+                    help="entity store: E objects or NumPy arrays")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (1 = in-process)")
+    ap.add_argument("-o", "--out", default="soak.csv")
+    a = ap.parse_args(argv)
+
+    jobs = [(a.seed+i, a.frames, a.cars, a.backend) for i in range(a.sessions)]
+    t0 = time.perf_counter()
+    if a.jobs > 1:
+        with Pool(a.jobs) as pool:
+            rows = pool.map(run_session, jobs, chunksize=max(1, len(jobs)//(a.jobs*4)))
+    else:
+        rows = [run_session(j) for j in jobs]
+    wall = time.perf_counter() - t0
+
+    with open(a.out, "w", newline="") as f:
+        wr = csv.DictWriter(f, fieldnames=list(rows[0]))
+        wr.writeheader(); wr.writerows(rows)
+    sim = sum(r["sim_s"] for r in rows)
+    dead = sum(not r["alive"] for r in rows)
+    print(f"{len(rows)} sessions, {sum(r['frames'] for r in rows)} frames in {wall:.2f}s "
+          f"({sim/wall:.0f}x real time), {dead} died -> {a.out}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,34 +8,61 @@ Controls:
   Arrow keys ... Move
   SPACE ........ Flashlight stun (front only)
   ENTER ........ Vacuum stunned ghost (if touching)
+  TAB .......... Random door   H ... Door toward the stairs
   V ............ Toggle Vibes Mode (color/fog/rave)
+  F3 ........... Profiler overlay (VIBE_PROF=trace.csv dumps a trace)
   ESC .......... Quit
+Options: --endless  --horde N  --seed N  --record FILE
+         --replay FILE... [--headless] [--uncapped]  (see mansion_replay.py)
 """
 
-import pygame, sys, random, math, time, numpy as np
+import os, sys
+if "--headless" in sys.argv:        # before pygame.init: no window, no audio device
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame, random, time, zlib, argparse
+from itertools import count
+from vibe_text import TEXT
+from chipsynth import SynthBank, VoicePool
+from mansion_fog import Fog
+from mansion_gen import LazyMansion
+from mansion_replay import Recording
+from vibe_prof import PROF
+from vibe_display import Display
+from vibe_capture import Capture
+import mansion_ghosts as ghosts_ai
 
 # --- SYSTEM INIT
 pygame.init()
 pygame.mixer.init()
 W, H = 960, 720
-screen = pygame.display.set_mode((W, H))
+DISPLAY = Display((W, H))         # VIBE_DISPLAY=2160p etc: see vibe_display.py
+screen = DISPLAY.surface
+CAPTURE = Capture.from_env(screen)  # VIBE_CAPTURE=out.vcap: see vibe_capture.py
 clock = pygame.time.Clock()
 FONT = pygame.font.SysFont("consolas", 36)
 pygame.display.set_caption("Luigi's Mansion: ONE SHOT – Vibes Mode")
 FPS = 60
 BG = (24, 24, 36)
+FOG = Fog(W, H)
 
 # --- BEEPS & BOOPS (Famicom, actual sound)
+# Tones are synthesized once (memoized in SFX) and played through a fixed pool
+# of mixer voices; see SFX.stats() / VOICES.stats() for hits and stolen voices.
+FAMI_TONES = [392, 524, 660, 784, 988, 1174, 1318, 1568]
+FAMI_VOL = 0.26
+SFX = SynthBank(44100, channels=2)
+VOICES = VoicePool(8)
+
 def beep(freq=660, dur=80, vol=0.22):
-    fs = 44100
-    t = np.linspace(0, dur/1000, int(fs * (dur/1000)), False)
-    wave = (np.sin(freq * 2 * np.pi * t) * vol * 32767).astype(np.int16)
-    snd = pygame.sndarray.make_sound(np.repeat(wave[:, None], 2, axis=1))
-    snd.play()
+    VOICES.play(SFX.sound("sine", freq, dur, vol))
 
 def fami_beep(tone=0, dur=90):
-    tones = [392, 524, 660, 784, 988, 1174, 1318, 1568]
-    beep(freq=tones[tone%len(tones)], dur=dur, vol=0.26)
+    beep(freq=FAMI_TONES[tone%len(FAMI_TONES)], dur=dur, vol=FAMI_VOL)
+
+# pre-bake every (tone, duration) the game uses: success, fail, stun, steps, stairs
+for _tone, _dur in [(2,120), (6,220), (3,40), (0,30), (1,30), (2,30), (3,30), (7,250)]:
+    SFX.sound("sine", FAMI_TONES[_tone], _dur, FAMI_VOL)
 
 def fami_boopsuccess(): fami_beep(2, 120)
 def fami_boopfail(): fami_beep(6, 220)
@@ -45,60 +72,21 @@ def fami_stairs(): fami_beep(7, 250)
 
 # --- VIBES MODE COLORS
 VIBES = [(200,64,255), (64,255,192), (64,224,255), (255,224,64), (40,255,40)]
-def get_vibe_color():
-    t = time.time()*3
+def get_vibe_color(t=None):
+    t = (time.time() if t is None else t)*3
     i = int(t) % len(VIBES)
     j = (i+1)%len(VIBES)
     f = t-int(t)
     return tuple(int(VIBES[i][k]*(1-f)+VIBES[j][k]*f) for k in range(3))
 
-# --- FLOOR/ROOM STRUCTURE ---
-class Room:
-    def __init__(s, i, x, y):
-        s.i, s.x, s.y = i, x, y
-        s.doors = []
-        s.ghosts = []
-        s.has_stairs = False
-        s.visited = False
-
-class Mansion:
-    def __init__(s, n_floors=4):
-        s.floors = []
-        for fl in range(n_floors):
-            n = random.randint(6,10)
-            rooms = []
-            for i in range(n):
-                rx, ry = random.randint(1,8), random.randint(1,5)
-                rooms.append(Room(i, rx, ry))
-            # connect rooms linearly then randomly
-            for i in range(n-1):
-                rooms[i].doors.append(rooms[i+1])
-                rooms[i+1].doors.append(rooms[i])
-            for _ in range(n//2):
-                a,b = random.sample(rooms,2)
-                if b not in a.doors: a.doors.append(b); b.doors.append(a)
-            # Add stairs to one room (except final floor)
-            if fl < n_floors-1:
-                rooms[random.randint(1, n-2)].has_stairs = True
-            # Add ghosts to random rooms
-            for r in rooms:
-                if random.random()<.5: r.ghosts.append([r.x*96+48, r.y*96+48, 0])
-            s.floors.append(rooms)
-        s.cur_floor, s.cur_room = 0, 0
-        s.luigi_room = s.floors[0][0]
-        s.luigi_room.visited = True
-
+# --- FLOOR/ROOM STRUCTURE --- (lazy floors + stairs BFS in mansion_gen.py)
+class Mansion(LazyMansion):
     def goto_room(s, room):
-        s.luigi_room = room
-        room.visited = True
+        super().goto_room(room)
         fami_step()
 
     def up_stairs(s):
-        if s.cur_floor < len(s.floors)-1:
-            s.cur_floor += 1
-            s.cur_room = 0
-            s.luigi_room = s.floors[s.cur_floor][0]
-            s.luigi_room.visited = True
+        if super().up_stairs():
             fami_stairs()
             return True
         return False
@@ -128,62 +116,47 @@ class Luigi:
         s.flash_cool = 40
         fami_stun()
         fx, fy = s.facing
-        hit = None
-        for g in ghosts:
-            gx,gy,_ = g
-            if abs(s.x+fx*50-gx)<60 and abs(s.y+fy*50-gy)<60:
-                g[2]=30
-                hit = g
-        if hit: s.stun_ghost = hit
+        hit = ghosts_ai.flash(ghosts, s.x+fx*50, s.y+fy*50)
+        if hit is not None: s.stun_ghost = hit
 
     def vacuum(s, ghosts):
-        if s.vacuum_cool > 0 or not s.stun_ghost: return
-        gx,gy,stun = s.stun_ghost
-        if abs(s.x-gx)<64 and abs(s.y-gy)<64 and stun>0:
-            ghosts.remove(s.stun_ghost)
+        if s.vacuum_cool > 0 or s.stun_ghost is None: return
+        if ghosts_ai.vacuum(ghosts, s.stun_ghost, s.x, s.y):
             s.stun_ghost = None
             s.vacuum_cool = 35
             fami_boopsuccess()
         else:
             fami_boopfail()
 
-# --- GHOSTS ---
+# --- GHOSTS --- (list-of-lists or a NumPy GhostHorde, see mansion_ghosts.py)
 def move_ghosts(room, luigi):
-    for g in room.ghosts:
-        gx,gy,stun = g
-        if stun>0: g[2]-=1; continue
-        angle = math.atan2(luigi.y-gy, luigi.x-gx)
-        g[0] += math.cos(angle)*2
-        g[1] += math.sin(angle)*2
-        g[0] += random.uniform(-0.8,0.8)
-        g[1] += random.uniform(-0.8,0.8)
+    ghosts_ai.move(room.ghosts, luigi.x, luigi.y)
 
 def ghost_collision(room, luigi):
-    for g in room.ghosts:
-        gx,gy,stun = g
-        if stun==0 and abs(luigi.x-gx)<40 and abs(luigi.y-gy)<40:
-            fami_boopfail()
-            return True
+    if ghosts_ai.collide(room.ghosts, luigi.x, luigi.y):
+        fami_boopfail()
+        return True
     return False
 
 # --- DRAW ---
-def draw_room(room, floor, vibes, luigi):
-    bg = get_vibe_color() if vibes else BG
-    screen.fill(bg)
-    # Draw "fog"
-    for i in range(12):
-        color = get_vibe_color() + (80,) if vibes else (32,32,32,88)
-        s = pygame.Surface((120,120), pygame.SRCALPHA)
-        pygame.draw.circle(s, color, (60,60), random.randint(40,90))
-        screen.blit(s, (random.randint(0,W-120),random.randint(0,H-120)))
+def draw_room(room, floor, vibes, luigi, t=None):
+    vibe = get_vibe_color(t) if vibes else None
+    screen.fill(vibe or BG)
+    # Draw "fog" (drifting puffs from a sprite atlas, see mansion_fog.py)
+    FOG.draw(screen, vibe + (80,) if vibes else (32,32,32,88))
     # Draw rooms as rectangles
     for r in floor:
         col = (80,60,100) if not r.visited else (128,120,160)
         pygame.draw.rect(screen, col, (r.x*96, r.y*96, 88, 88), 3)
         if r.has_stairs: pygame.draw.rect(screen, (255,240,80), (r.x*96+36, r.y*96+36, 16,32))
-    # Doors
+    # Doors (the one on the shortest way to the stairs glows yellow)
+    hint = room.floor.toward_stairs(room)
     for dr in room.doors:
-        pygame.draw.line(screen, (128,255,128), (room.x*96+44,room.y*96+44), (dr.x*96+44,dr.y*96+44), 8)
+        if dr is not hint:
+            pygame.draw.line(screen, (128,255,128), (room.x*96+44,room.y*96+44), (dr.x*96+44,dr.y*96+44), 8)
+    if hint:
+        pygame.draw.line(screen, (255,240,80), (room.x*96+44,room.y*96+44), (hint.x*96+44,hint.y*96+44), 8)
+        pygame.draw.circle(screen, (255,240,80), (hint.x*96+44,hint.y*96+44), 10)
     # Ghosts
     for g in room.ghosts:
         gx,gy,stun = g
@@ -203,61 +176,149 @@ def draw_room(room, floor, vibes, luigi):
              (130+fy*30, 70-fx*40)])
         screen.blit(s, (int(luigi.x), int(luigi.y)))
     # HUD
-    msg = "FLOOR: %d  ROOMS: %d  GHOSTS: %d  [VIBES: %s]" % (mansion.cur_floor+1, len(floor), len(room.ghosts), "ON" if vibes else "OFF")
-    txt = FONT.render(msg, 1, (255,255,255))
+    msg = "FLOOR: %d  ROOMS: %d  GHOSTS: %d  [VIBES: %s]" % (floor.idx+1, len(floor), len(room.ghosts), "ON" if vibes else "OFF")
+    txt = TEXT.render(FONT, msg, 1, (255,255,255))
     screen.blit(txt, (24,8))
 
-def draw_gameover():
+def draw_gameover(wait=True):
     screen.fill((0,0,0))
-    txt = FONT.render("ONE SHOT... GAME OVER!", 1, (255,40,64))
+    txt = TEXT.render(FONT, "ONE SHOT... GAME OVER!", 1, (255,40,64))
     screen.blit(txt, (W//2-260,H//2-40))
-    pygame.display.flip()
-    pygame.time.wait(2400)
+    DISPLAY.present()
+    if wait: pygame.time.wait(2400)
 
 # --- MAIN LOOP ---
-mansion = Mansion(n_floors=random.randint(3,5))
-luigi = Luigi()
-vibes = False
-
-while True:
-    for ev in pygame.event.get():
-        if ev.type==pygame.QUIT: sys.exit()
-        if ev.type==pygame.KEYDOWN:
-            if ev.key==pygame.K_ESCAPE: sys.exit()
-            elif ev.key==pygame.K_v: vibes=not vibes
-            elif ev.key in [pygame.K_LEFT, pygame.K_a]: luigi.move(-1,0,mansion)
-            elif ev.key in [pygame.K_RIGHT, pygame.K_d]: luigi.move(1,0,mansion)
-            elif ev.key in [pygame.K_UP, pygame.K_w]: luigi.move(0,-1,mansion)
-            elif ev.key in [pygame.K_DOWN, pygame.K_s]: luigi.move(0,1,mansion)
-            elif ev.key==pygame.K_SPACE: luigi.flash(mansion.luigi_room.ghosts)
-            elif ev.key==pygame.K_RETURN: luigi.vacuum(mansion.luigi_room.ghosts)
-            elif ev.key==pygame.K_TAB:
-                # Move to random connected room
-                if mansion.luigi_room.doors:
-                    mansion.goto_room(random.choice(mansion.luigi_room.doors))
-
-    # Move ghosts
-    move_ghosts(mansion.luigi_room, luigi)
-
-    # Check stairs
-    if mansion.luigi_room.has_stairs and abs(luigi.x-(mansion.luigi_room.x*96+48))<44 and abs(luigi.y-(mansion.luigi_room.y*96+48))<44:
-        if mansion.up_stairs():
-            luigi.x, luigi.y = 144, 144
-            fami_stairs()
-            continue
+# Keys the game reacts to; a recording stores the index into this table.
+KEYMAP = [pygame.K_v, pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_UP, pygame.K_w,
+          pygame.K_DOWN, pygame.K_s, pygame.K_SPACE, pygame.K_RETURN, pygame.K_h, pygame.K_TAB]
+KEYCODE = {k: i for i, k in enumerate(KEYMAP)}
+
+def state_digest(mansion, luigi):
+    """CRC of everything gameplay depends on; equal digests = same outcome."""
+    room = mansion.luigi_room
+    return zlib.crc32(repr((mansion.cur_floor, room.i, luigi.x, luigi.y,
+                            luigi.flash_cool, luigi.vacuum_cool, list(room.ghosts))).encode())
+
+def apply_key(key, mansion, luigi):
+    """Gameplay effect of one key press (everything but V / ESC / F3)."""
+    if key in [pygame.K_LEFT, pygame.K_a]: luigi.move(-1,0,mansion)
+    elif key in [pygame.K_RIGHT, pygame.K_d]: luigi.move(1,0,mansion)
+    elif key in [pygame.K_UP, pygame.K_w]: luigi.move(0,-1,mansion)
+    elif key in [pygame.K_DOWN, pygame.K_s]: luigi.move(0,1,mansion)
+    elif key==pygame.K_SPACE: luigi.flash(mansion.luigi_room.ghosts)
+    elif key==pygame.K_RETURN: luigi.vacuum(mansion.luigi_room.ghosts)
+    elif key==pygame.K_h: mansion.step_toward_stairs()
+    elif key==pygame.K_TAB:
+        # Move to random connected room
+        if mansion.luigi_room.doors:
+            mansion.goto_room(random.choice(mansion.luigi_room.doors))
+
+def run(seed=None, endless=False, horde=0, record=None, replay=None, headless=False, uncapped=False):
+    """Play (or replay) one session; returns (frames, died, digest).
+    record: a Recording to log key presses into. replay: a loaded Recording
+    whose presses are fed back instead of the keyboard."""
+    global FOG
+    if replay is not None: seed, endless, horde = replay.seed, replay.endless, replay.horde
+    if seed is None: seed = random.getrandbits(64)
+    random.seed(seed)
+    FOG = Fog(W, H, seed=seed)
+    mansion = Mansion(n_floors=None if endless else random.randint(3,5), horde=horde)
+    luigi = Luigi()
+    vibes = False
+    script = replay.by_frame() if replay is not None else None
+    died = False
+
+    for frame in count():
+        if replay is not None and frame >= replay.frames: break
+        keys = script.get(frame, []) if replay is not None else []
+        quit = False
+        with PROF("input"):
+            for ev in pygame.event.get():
+                if ev.type==pygame.QUIT: quit = True
+                if ev.type==pygame.KEYDOWN:
+                    if ev.key==pygame.K_ESCAPE: quit = True
+                    elif ev.key==pygame.K_F3: PROF.toggle()
+                    elif replay is None and ev.key in KEYCODE: keys.append(KEYCODE[ev.key])
+            if quit: break
+            for code in keys:
+                if record is not None: record.key(frame, code)
+                key = KEYMAP[code]
+                if key==pygame.K_v: vibes=not vibes
+                else: apply_key(key, mansion, luigi)
+
+        # Move ghosts, drift fog
+        with PROF("update"):
+            move_ghosts(mansion.luigi_room, luigi)
+            FOG.update()
+
+        # Check stairs
+        if mansion.luigi_room.has_stairs and abs(luigi.x-(mansion.luigi_room.x*96+48))<44 and abs(luigi.y-(mansion.luigi_room.y*96+48))<44:
+            if mansion.up_stairs():
+                luigi.x, luigi.y = 144, 144
+                fami_stairs()
+                continue
+
+        # Timers
+        if luigi.flash_cool>0: luigi.flash_cool-=1
+        if luigi.vacuum_cool>0: luigi.vacuum_cool-=1
+
+        # Death
+        with PROF("collision"):
+            dead = ghost_collision(mansion.luigi_room, luigi)
+        if dead:
+            if not headless: draw_gameover(wait=replay is None)
+            died = True
+            frame += 1
+            break
+
+        # Draw everything
+        if not headless:
+            with PROF("render"):
+                draw_room(mansion.luigi_room, mansion.floors[mansion.cur_floor], vibes, luigi, frame/FPS)
+                PROF.draw(screen, pos=(24, 56))
+            with PROF("flip"):
+                DISPLAY.present()
+            if CAPTURE:
+                with PROF("capture"):
+                    CAPTURE.grab()
+        PROF.frame()
+        if not uncapped: clock.tick(FPS)  # <-- THE ACTUAL WORKING LINE!
 
-    # Timers
-    if luigi.flash_cool>0: luigi.flash_cool-=1
-    if luigi.vacuum_cool>0: luigi.vacuum_cool-=1
+    digest = state_digest(mansion, luigi)
+    if record is not None: record.finish(frame, digest, died)
+    return frame, died, digest
 
-    # Death
-    if ghost_collision(mansion.luigi_room, luigi):
-        draw_gameover()
-        break
+def main():
+    ap = argparse.ArgumentParser(description="Luigi's Mansion: ONE SHOT")
+    ap.add_argument("--endless", action="store_true", help="floors never run out")
+    ap.add_argument("--horde", type=int, default=0, metavar="N", help="N batched ghosts per room")
+    ap.add_argument("--seed", type=int, help="session seed (random if omitted)")
+    ap.add_argument("--record", metavar="FILE", help="save seed + key presses to FILE")
+    ap.add_argument("--replay", nargs="+", metavar="FILE", help="play recordings back and check their end state")
+    ap.add_argument("--headless", action="store_true", help="no drawing (dummy SDL video/audio)")
+    ap.add_argument("--uncapped", action="store_true", help="do not wait for the %d fps clock" % FPS)
+    a = ap.parse_args()
+    if a.replay:
+        bad = 0
+        t0 = time.perf_counter()
+        for path in a.replay:
+            rec = Recording.load(path)
+            frames, died, digest = run(replay=rec, headless=a.headless, uncapped=a.uncapped)
+            ok = (frames, died, digest) == (rec.frames, rec.died, rec.digest)
+            bad += not ok
+            print("%s  %s  %d frames  %d keys%s" % ("ok  " if ok else "DIFF", path, frames, len(rec), "  died" if died else ""))
+        dt = time.perf_counter() - t0
+        print("%d replays, %d diverged, %.2fs" % (len(a.replay), bad, dt))
+        sys.exit(1 if bad else 0)
+    if a.seed is not None and abs(a.seed) >> 64: ap.error("--seed must fit in 64 bits")
+    seed = a.seed if a.seed is not None else random.getrandbits(64)
+    rec = Recording(seed, a.endless, a.horde) if a.record else None
+    run(seed, a.endless, a.horde, rec, headless=a.headless, uncapped=a.uncapped)
+    if rec is not None:
+        rec.save(a.record)
+        print("recorded %d frames, %d keys -> %s" % (rec.frames, len(rec), a.record))
 
-    # Draw everything
-    draw_room(mansion.luigi_room, mansion.floors[mansion.cur_floor], vibes, luigi)
-    pygame.display.flip()
-    clock.tick(FPS)  # <-- THE ACTUAL WORKING LINE!
+if __name__ == "__main__":
+    main()
 
 # No more haunted typo zone, just pure vibes.
@@ -0,0 +1,60 @@
+"""
+Mansion fog
+-----------
+A fixed set of fog puffs that drift across the room and wrap at the edges,
+drawn from an atlas of pre-rendered 120x120 puff sprites keyed by radius
+bucket and quantized color. draw_room used to build and throw away twelve
+SRCALPHA surfaces per frame; now a sprite is only rendered the first time its
+(radius, color step) comes up, and the atlas is LRU-capped so a long vibes
+session cannot grow it without bound.
+"""
+import random
+from collections import OrderedDict
+import pygame
+
+PUFF   = 120
+RADII  = (40, 50, 60, 70, 80, 90)       # radius buckets (old code: randint(40, 90))
+QSTEP  = 24                             # color quantization per channel
+
+class Fog:
+    def __init__(self, w, h, n=12, seed=None, max_sprites=96):
+        self.w, self.h = w, h
+        self.rng = random.Random(seed)
+        self.max_sprites = max_sprites
+        self.atlas = OrderedDict()
+        self.hits = self.misses = 0
+        r = self.rng
+        # x, y, vx, vy, radius
+        self.parts = [[r.uniform(-PUFF, w), r.uniform(-PUFF, h),
+                       r.uniform(-0.6, 0.6), r.uniform(-0.4, 0.4), r.choice(RADII)]
+                      for _ in range(n)]
+
+    def sprite(self, radius, color):
+        color = tuple(min(255, c//QSTEP*QSTEP + QSTEP//2) for c in color[:3]) + tuple(color[3:])
+        key = (radius, color)
+        s = self.atlas.get(key)
+        if s is not None:
+            self.hits += 1
+            self.atlas.move_to_end(key)
+            return s
+        self.misses += 1
+        s = pygame.Surface((PUFF, PUFF), pygame.SRCALPHA)
+        pygame.draw.circle(s, color, (PUFF//2, PUFF//2), radius)
+        self.atlas[key] = s
+        if len(self.atlas) > self.max_sprites:
+            self.atlas.popitem(last=False)
+        return s
+
+    def update(self):
+        w, h = self.w, self.h
+        for p in self.parts:
+            p[0] += p[2]; p[1] += p[3]
+            if p[0] < -PUFF: p[0] += w + PUFF
+            elif p[0] > w:   p[0] -= w + PUFF
+            if p[1] < -PUFF: p[1] += h + PUFF
+            elif p[1] > h:   p[1] -= h + PUFF
+
+    def draw(self, screen, color):
+        """color: RGBA shared by every puff this frame."""
+        for x, y, _, _, radius in self.parts:
+            screen.blit(self.sprite(radius, color), (int(x), int(y)))
@@ -0,0 +1,145 @@
+"""
+Mansion generation: lazy floors, index adjacency, stairs distance tables
+-----------------------------------------------------------------------
+Same layout rules as the original eager Mansion (6-10 rooms per floor on the
+8x5 plan, linear corridor plus n//2 random extra doors, stairs in one inner
+room of every floor but the last, a ghost in about half the rooms), but:
+
+  * a floor is only generated when first entered, from its own seeded RNG,
+    so the layout does not depend on visit order and n_floors can be huge
+    (or None for endless mode);
+  * doors are stored per floor as compact CSR index arrays, not lists of
+    Room objects (Room.doors is a view over them);
+  * each floor carries a BFS distance table and next-hop table towards its
+    stairs room, so "which door leads up" is an O(1) lookup.
+
+horde=N swaps every room's ghosts for a GhostHorde of N (mansion_ghosts.py).
+"""
+import random
+from array import array
+from collections import deque
+
+GRID_W, GRID_H = 8, 5
+
+class Room:
+    __slots__ = ("i", "x", "y", "floor", "ghosts", "has_stairs", "visited")
+    def __init__(s, i, x, y, floor=None):
+        s.i, s.x, s.y = i, x, y
+        s.floor = floor
+        s.ghosts = []
+        s.has_stairs = False
+        s.visited = False
+
+    @property
+    def doors(s):
+        f = s.floor
+        return [f.rooms[j] for j in f.nbr[f.off[s.i]:f.off[s.i+1]]]
+
+class Floor:
+    def __init__(s, idx, rooms, adj, stairs):
+        s.idx, s.rooms, s.stairs = idx, rooms, stairs
+        for r in rooms: r.floor = s
+        # CSR adjacency: neighbours of room i are nbr[off[i]:off[i+1]]
+        flat, off = [], [0]
+        for a in adj:
+            flat += sorted(a); off.append(len(flat))
+        s.off, s.nbr = array("i", off), array("i", flat)
+        s.dist, s.hop = s._bfs()
+
+    def _bfs(s):
+        """Distance to the stairs room and the neighbour one step closer
+        (-1 where there are no stairs / no path)."""
+        n = len(s.rooms)
+        dist, hop = array("i", [-1])*n, array("i", [-1])*n
+        if s.stairs < 0: return dist, hop
+        dist[s.stairs] = 0
+        q, off, nbr = deque([s.stairs]), s.off, s.nbr
+        while q:
+            a = q.popleft()
+            for b in nbr[off[a]:off[a+1]]:
+                if dist[b] < 0:
+                    dist[b], hop[b] = dist[a] + 1, a
+                    q.append(b)
+        return dist, hop
+
+    def toward_stairs(s, room):
+        """Next room on a shortest path to the stairs, or None."""
+        j = s.hop[room.i]
+        return s.rooms[j] if j >= 0 else None
+
+    def __len__(s): return len(s.rooms)
+    def __iter__(s): return iter(s.rooms)
+    def __getitem__(s, i): return s.rooms[i]
+
+def build_floor(rng, fl, last, rooms=(6, 10), ghost_p=.5, horde=0):
+    n = rng.randint(*rooms)
+    rr = rng.randrange
+    rs = [Room(i, rr(1, GRID_W+1), rr(1, GRID_H+1)) for i in range(n)]
+    # connect rooms linearly then randomly
+    adj = [{i-1, i+1} for i in range(n)]
+    adj[0].discard(-1); adj[-1].discard(n)
+    for _ in range(n//2):
+        a = rr(n); b = rr(n-1)
+        if b >= a: b += 1               # two distinct rooms, like random.sample
+        adj[a].add(b); adj[b].add(a)
+    stairs = -1
+    if not last:
+        stairs = rng.randint(1, n-2)
+        rs[stairs].has_stairs = True
+    rnd = rng.random
+    for r in rs:
+        if rnd() < ghost_p: r.ghosts.append([r.x*96+48, r.y*96+48, 0])
+    if horde:       # "haunted horde": every room gets a batched crowd
+        from mansion_ghosts import GhostHorde
+        for r in rs:
+            r.ghosts = GhostHorde.spawn(horde, r.x*96+48, r.y*96+48, seed=rng.getrandbits(32))
+    return Floor(fl, rs, adj, stairs)
+
+class Floors:
+    """Sequence of floors that materializes each one on first access."""
+    def __init__(s, n, seed, rooms, horde=0):
+        s.n, s.seed, s.rooms, s.horde = n, seed, rooms, horde
+        s.built = {}
+
+    def __len__(s):
+        return s.n if s.n is not None else max(s.built, default=0) + 2
+
+    def __getitem__(s, fl):
+        if fl < 0 or (s.n is not None and fl >= s.n): raise IndexError(fl)
+        f = s.built.get(fl)
+        if f is None:
+            rng = random.Random(f"{s.seed}:{fl}")
+            last = s.n is not None and fl == s.n-1
+            f = s.built[fl] = build_floor(rng, fl, last, s.rooms, horde=s.horde)
+        return f
+
+class LazyMansion:
+    def __init__(s, n_floors=4, seed=None, rooms=(6, 10), horde=0):
+        s.seed = random.getrandbits(64) if seed is None else seed
+        s.floors = Floors(n_floors, s.seed, rooms, horde)
+        s.cur_floor, s.cur_room = 0, 0
+        s.luigi_room = s.floors[0][0]
+        s.luigi_room.visited = True
+
+    @property
+    def floor(s): return s.floors[s.cur_floor]
+
+    def goto_room(s, room):
+        s.luigi_room = room
+        room.visited = True
+
+    def step_toward_stairs(s):
+        """Walk one door along the shortest path to the stairs; False if none."""
+        nxt = s.floor.toward_stairs(s.luigi_room)
+        if nxt is None: return False
+        s.goto_room(nxt)
+        return True
+
+    def up_stairs(s):
+        if s.floors.n is None or s.cur_floor < s.floors.n-1:
+            s.cur_floor += 1
+            s.cur_room = 0
+            s.luigi_room = s.floors[s.cur_floor][0]
+            s.luigi_room.visited = True
+            return True
+        return False
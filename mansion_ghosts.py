@@ -0,0 +1,122 @@
+"""
+Mansion ghost AI: list-of-lists for small rooms, NumPy horde for crowds
+-----------------------------------------------------------------------
+A room's ghosts are either the original list of [x, y, stun] lists or a
+GhostHorde holding x, y and stun timers as arrays. move / collide / flash /
+vacuum dispatch on which one a room has, so the game code does not care.
+The horde does chase, jitter, stun decay, the flashlight box test and the
+player hit test as batched array ops. The list path keeps the original
+per-ghost loop, which is cheaper for the usual zero-to-two ghosts.
+"""
+import math, random
+import numpy as np
+
+CHASE, JITTER, STUN = 2, 0.8, 30
+HIT, FLASH_REACH, VACUUM_REACH = 40, 60, 64
+
+# --- list-of-lists path (original behaviour) --------------------------------
+def move_list(ghosts, lx, ly):
+    for g in ghosts:
+        gx,gy,stun = g
+        if stun>0: g[2]-=1; continue
+        angle = math.atan2(ly-gy, lx-gx)
+        g[0] += math.cos(angle)*CHASE
+        g[1] += math.sin(angle)*CHASE
+        g[0] += random.uniform(-JITTER,JITTER)
+        g[1] += random.uniform(-JITTER,JITTER)
+
+def collide_list(ghosts, lx, ly):
+    for gx,gy,stun in ghosts:
+        if stun==0 and abs(lx-gx)<HIT and abs(ly-gy)<HIT: return True
+    return False
+
+def flash_list(ghosts, cx, cy):
+    """Stun every ghost in the beam box around (cx, cy); returns the last one."""
+    hit = None
+    for g in ghosts:
+        if abs(cx-g[0])<FLASH_REACH and abs(cy-g[1])<FLASH_REACH:
+            g[2] = STUN
+            hit = g
+    return hit
+
+def vacuum_list(ghosts, g, lx, ly):
+    gx,gy,stun = g
+    if abs(lx-gx)<VACUUM_REACH and abs(ly-gy)<VACUUM_REACH and stun>0 and g in ghosts:
+        ghosts.remove(g)
+        return True
+    return False
+
+# --- batched path --------------------------------------------------------------
+class GhostHorde:
+    """Ghosts of one room as arrays. Ghosts are referred to by stable ids
+    (flash returns one, vacuum takes one) since indices shift on removal."""
+    def __init__(s, xs, ys, stun=None, seed=None):
+        s.x = np.array(xs, float)
+        s.y = np.array(ys, float)
+        s.stun = np.zeros(len(s.x), np.int32) if stun is None else np.array(stun, np.int32)
+        s.ids = np.arange(len(s.x))
+        s.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_lists(cls, ghosts, seed=None):
+        g = np.array(ghosts, float).reshape(-1, 3)
+        return cls(g[:, 0], g[:, 1], g[:, 2], seed)
+
+    @classmethod
+    def spawn(cls, n, cx, cy, spread=240, seed=None):
+        rng = np.random.default_rng(seed)
+        return cls(cx + rng.uniform(-spread, spread, n), cy + rng.uniform(-spread, spread, n),
+                   seed=rng.integers(1 << 32))
+
+    def __len__(s): return len(s.x)
+
+    def __iter__(s):
+        return zip(s.x.tolist(), s.y.tolist(), s.stun.tolist())
+
+    def move(s, lx, ly):
+        stunned = s.stun > 0
+        s.stun[stunned] -= 1
+        free = ~stunned
+        k = int(free.sum())
+        if not k: return
+        x, y = s.x[free], s.y[free]
+        angle = np.arctan2(ly-y, lx-x)
+        jit = s.rng.uniform(-JITTER, JITTER, (2, k))
+        s.x[free] = x + np.cos(angle)*CHASE + jit[0]
+        s.y[free] = y + np.sin(angle)*CHASE + jit[1]
+
+    def collide(s, lx, ly):
+        return bool(((s.stun == 0) & (np.abs(lx-s.x) < HIT) & (np.abs(ly-s.y) < HIT)).any())
+
+    def flash(s, cx, cy):
+        hit = (np.abs(cx-s.x) < FLASH_REACH) & (np.abs(cy-s.y) < FLASH_REACH)
+        if not hit.any(): return None
+        s.stun[hit] = STUN
+        return int(s.ids[np.flatnonzero(hit)[-1]])
+
+    def vacuum(s, gid, lx, ly):
+        i = np.flatnonzero(s.ids == gid)
+        if not i.size: return False
+        i = i[0]
+        if abs(lx-s.x[i])<VACUUM_REACH and abs(ly-s.y[i])<VACUUM_REACH and s.stun[i]>0:
+            keep = np.ones(len(s.x), bool); keep[i] = False
+            s.x, s.y, s.stun, s.ids = s.x[keep], s.y[keep], s.stun[keep], s.ids[keep]
+            return True
+        return False
+
+# --- dispatch --------------------------------------------------------------------
+def move(ghosts, lx, ly):
+    if isinstance(ghosts, GhostHorde): ghosts.move(lx, ly)
+    else: move_list(ghosts, lx, ly)
+
+def collide(ghosts, lx, ly):
+    if isinstance(ghosts, GhostHorde): return ghosts.collide(lx, ly)
+    return collide_list(ghosts, lx, ly)
+
+def flash(ghosts, cx, cy):
+    if isinstance(ghosts, GhostHorde): return ghosts.flash(cx, cy)
+    return flash_list(ghosts, cx, cy)
+
+def vacuum(ghosts, g, lx, ly):
+    if isinstance(ghosts, GhostHorde): return ghosts.vacuum(g, lx, ly)
+    return vacuum_list(ghosts, g, lx, ly)
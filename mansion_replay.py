@@ -0,0 +1,67 @@
+"""
+Mansion input recording and replay
+----------------------------------
+A session is fully determined by its seed, the mode flags (endless, horde
+size) and which game key was pressed on which frame, so that is all a
+recording holds: a fixed header followed by one 5-byte (frame, key code)
+record per key press. The header also carries the frame count and a digest
+of the final game state, which lets a replay check that it ended up exactly
+where the original session did.
+
+Layout (little-endian):
+  header  4s magic, B version, B flags, Q seed, I horde, I frames,
+          I digest, I n_events
+  events  n_events x I frame, then n_events x B key code
+"""
+import struct
+from array import array
+
+MAGIC, VERSION = b"MNRP", 1
+HEADER = struct.Struct("<4sBBQIIII")
+ENDLESS, DIED = 1, 2
+
+class Recording:
+    def __init__(s, seed, endless=False, horde=0):
+        seed = abs(seed)                # random.seed(n) seeds on abs(n): same session
+        if seed >> 64: raise ValueError(f"seed {seed} does not fit in 64 bits")
+        s.seed, s.endless, s.horde = seed, endless, horde
+        s.frames, s.digest, s.died = 0, 0, False
+        s.at, s.codes = array("I"), bytearray()
+
+    def key(s, frame, code):
+        s.at.append(frame)
+        s.codes.append(code)
+
+    def finish(s, frames, digest, died):
+        s.frames, s.digest, s.died = frames, digest, died
+
+    def __len__(s): return len(s.codes)
+
+    def by_frame(s):
+        """{frame: [codes...]} for playback."""
+        out = {}
+        for f, c in zip(s.at, s.codes):
+            out.setdefault(f, []).append(c)
+        return out
+
+    def save(s, path):
+        flags = ENDLESS*s.endless | DIED*s.died
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, flags, s.seed, s.horde,
+                                s.frames, s.digest, len(s.codes)))
+            f.write(struct.pack(f"<{len(s.at)}I", *s.at))
+            f.write(s.codes)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, ver, flags, seed, horde, frames, digest, n = HEADER.unpack_from(data)
+        if magic != MAGIC or ver != VERSION:
+            raise ValueError(f"{path}: not a mansion recording (v{VERSION})")
+        r = cls(seed, bool(flags & ENDLESS), horde)
+        r.finish(frames, digest, bool(flags & DIED))
+        o = HEADER.size
+        r.at = array("I", struct.unpack_from(f"<{n}I", data, o))
+        r.codes = bytearray(data[o+4*n:o+5*n])
+        return r
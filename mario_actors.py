@@ -0,0 +1,158 @@
+"""
+Typed actor pools for the Mario level engine
+--------------------------------------------
+Enemies and projectiles come in hundreds, so they are not Sprites: each is a
+__slots__ record (rect, velocity, previous position, alive flag) kept in a
+pool for its type. A pool owns the one shared image for its type, steps its
+records with that type's own logic (no per-entity isinstance checks), keeps
+them in screen-wide x strips so only those near the camera are simulated or
+looked at, and draws them with a single Surface.blits() call.
+
+  Goombas    walk, turn at walls
+  Koopas     walk faster, also turn at ledges
+  Fireballs  fly straight, die on walls or on the first enemy they touch
+"""
+import pygame as pg
+
+IMAGES = {}                 # (w, h, color) -> Surface, shared by every pool
+
+def shared_image(w, h, color):
+    key = (w, h, color)
+    img = IMAGES.get(key)
+    if img is None:
+        img = IMAGES[key] = pg.Surface((w, h))
+        img.fill(color)
+        if pg.display.get_surface(): img = IMAGES[key] = img.convert()
+    return img
+
+def step_body(rect, vx, vy, tiles, gravity):
+    """Move rect by (vx, vy + gravity) against the TileMap, resolving the
+    horizontal then vertical overlap. Returns (vy, on_ground, hit_wall)."""
+    rect.x += vx
+    hit_wall = False
+    for t in tiles.around(rect):
+        if vx>0: rect.right = t.left
+        if vx<0: rect.left  = t.right
+        hit_wall = True
+    vy += gravity
+    rect.y += vy
+    on_ground = False
+    for t in tiles.around(rect):
+        if vy>0:
+            rect.bottom = t.top
+            vy = 0
+            on_ground = True
+        elif vy<0:
+            rect.top = t.bottom
+            vy = 0
+    return vy, on_ground, hit_wall
+
+class Body:
+    __slots__ = ("rect", "vx", "vy", "px", "py", "alive", "t")
+    def __init__(self, x, y, w, h, vx=0, vy=0):
+        self.rect = pg.Rect(x, y, w, h)
+        self.vx, self.vy = vx, vy
+        self.px, self.py = x, y
+        self.alive = True
+        self.t = 0                              # per-type timer
+
+class Pool:
+    """Records bucketed by CELL-wide x strips, so stepping, hit tests and
+    drawing only ever walk the strips near the camera."""
+    SIZE, COLOR, SPEED = (32, 32), (200, 200, 200), 1
+    CELL = 512
+
+    def __init__(self, gravity):
+        self.gravity = gravity
+        self.cells = {}                         # x // CELL -> [Body]
+        self.image = shared_image(*self.SIZE, self.COLOR)
+
+    def __len__(self): return sum(map(len, self.cells.values()))
+
+    @property
+    def items(self): return [b for bucket in self.cells.values() for b in bucket if b.alive]
+
+    def spawn(self, x, y, direction=-1):
+        b = Body(x, y, *self.SIZE, vx=direction*self.SPEED)
+        self.cells.setdefault(x//self.CELL, []).append(b)
+        return b
+
+    def update(self, tiles, player, lo, hi):
+        """Step the live records in the strips covering [lo, hi) (the
+        activation window around the camera); everything else stays frozen."""
+        cells, step, C, moved = self.cells, self.step, self.CELL, []
+        for c in range(lo//C, (hi-1)//C + 1):
+            bucket = cells.get(c)
+            if not bucket: continue
+            for b in bucket:
+                if b.alive:
+                    b.px, b.py = b.rect.x, b.rect.y
+                    step(b, tiles, player)
+            keep = []
+            for b in bucket:
+                if b.alive: (keep if b.rect.x//C == c else moved).append(b)
+            cells[c] = keep
+        for b in moved:
+            cells.setdefault(b.rect.x//C, []).append(b)
+
+    def kill(self, b):
+        b.alive = False                         # dropped at the next update
+
+    def hit(self, rect):
+        """Kill and return the first live record touching rect, or None."""
+        C = self.CELL
+        for c in range(rect.left//C - 1, rect.right//C + 1):
+            for b in self.cells.get(c, ()):
+                if b.alive and b.rect.colliderect(rect):
+                    self.kill(b)
+                    return b
+        return None
+
+    def step(self, b, tiles, player):
+        raise NotImplementedError
+
+    def draw(self, surf, scroll, alpha=1.0):
+        C, img, seq = self.CELL, self.image, []
+        for c in range(scroll//C - 1, (scroll + surf.get_width())//C + 1):
+            seq += [(img, (round(b.px + (b.rect.x-b.px)*alpha) - scroll,
+                           round(b.py + (b.rect.y-b.py)*alpha)))
+                    for b in self.cells.get(c, ()) if b.alive]
+        surf.blits(seq, False)
+
+class Goombas(Pool):
+    COLOR, SPEED = (150, 90, 40), 1
+
+    def step(self, b, tiles, player):
+        b.vy, grounded, wall = step_body(b.rect, b.vx, b.vy, tiles, self.gravity)
+        if wall or self.turn(b, tiles, grounded): b.vx = -b.vx
+        if b.rect.top > tiles.rows*tiles.tile: self.kill(b)     # fell out
+        elif b.rect.colliderect(player.rect) and player.vy>0 and player.rect.bottom < b.rect.centery:
+            self.kill(b)                                        # stomped
+            player.vy = player.JUMP/2
+
+    def turn(self, b, tiles, grounded):
+        return False
+
+class Koopas(Goombas):
+    SIZE, COLOR, SPEED = (32, 40), (60, 200, 60), 2
+
+    def turn(self, b, tiles, grounded):
+        # walk back rather than off a ledge
+        if not grounded: return False
+        t = tiles.tile
+        ahead = b.rect.right if b.vx > 0 else b.rect.left - 1
+        return not tiles.get(ahead//t, b.rect.bottom//t)
+
+class Fireballs(Pool):
+    SIZE, COLOR, SPEED = (12, 12), (255, 200, 40), 6
+    LIFE = 90                                   # steps before it fizzles
+
+    def spawn(self, x, y, direction=1):
+        b = super().spawn(x, y, direction)
+        b.t = self.LIFE
+        return b
+
+    def step(self, b, tiles, player):
+        b.rect.x += b.vx
+        b.t -= 1
+        if b.t <= 0 or tiles.around(b.rect): self.kill(b)
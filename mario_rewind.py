@@ -0,0 +1,213 @@
+"""
+Rewind and save-states for the Mario level engine
+-------------------------------------------------
+Every physics step of a Level packs into one fixed-size binary record:
+  * the camera
+  * the player and boss (rect, previous position, velocity, ground flag,
+    facing, reload, hp, phase)
+  * the boss's RNG (castle levels only; nothing else draws one in play)
+  * every fireball
+  * every enemy in the level
+
+Records go into a ring preallocated for `seconds` of history. The tilemap
+never changes during play, so it is kept once per level rather than per
+record. restore() puts a record back in place of the live state. A record
+is 312 bytes plus 29 per enemy (370 on the default two-screen level); a
+castle adds the boss's 2,508-byte RNG state.
+
+Enemies are numbered when the level is first seen. A record starts as a
+memmove of the previous record's enemy block. Only enemies in the strips
+the pools just stepped (Level.window, plus one strip for fireball hits) and
+those written last step are then re-packed, so a step costs the same on a
+300-screen level as on a two-screen one. The game never spawns enemies
+mid-level, but a caller may: an enemy not seen before gets the next slot,
+and the ring is re-laid out once at the wider record size, the new slots
+zeroed (not alive) in the older records. Fireballs get FIRE_SLOTS. Stepping
+back compares the two records' enemy blocks BLOCK enemies at a time and
+only touches the enemies that differ.
+
+    rw = Rewind(level)                  # history starts now
+    level.update(keys); rw.push()       # once per step
+    rw.pop()                            # one step back (hold R)
+    state = rw.save(); rw.load(state)   # save-states (F5 / F9)
+"""
+import math, struct
+
+HEAD = struct.Struct("<ii"                  # scroll_x, prev_scroll
+                     "iiiiddBbH"            # player x, y, prev x, prev y, vx, vy, on_ground, facing, reload
+                     "BiiiiddbbB")          # boss present, x, y, prev x, prev y, vx, vy, hp, phase; fireballs
+RNG  = struct.Struct("<625Id")              # boss Mersenne Twister words + gauss_next (NaN = None)
+BODY = struct.Struct("<iiiihdhB")           # x, y, px, py, vx, vy, t, alive
+FIRE_SLOTS = 8                              # Player.RELOAD 20 x Fireballs.LIFE 90 -> at most 5 live
+BLOCK = 32                                  # enemies compared per memcmp when stepping back
+
+class Rewind:
+    def __init__(self, level, seconds=10, hz=60):
+        self.level = level
+        self.bodies = [(pool, b) for pool in level.enemies for bucket in pool.cells.values() for b in bucket]
+        self.slot = {id(b): i for i, (_, b) in enumerate(self.bodies)}
+        self.fire_at  = HEAD.size + (RNG.size if level.boss else 0)
+        self.enemy_at = self.fire_at + FIRE_SLOTS*BODY.size
+        self.size = self.enemy_at + len(self.bodies)*BODY.size
+        self.cap = max(1, int(seconds*hz))
+        self.buf = bytearray(self.cap*self.size)
+        self.view = memoryview(self.buf)
+        self.top = self.count = 0                   # next record to write, records held
+        self.tiles, self.version = bytes(level.tiles.cells), level.tiles.version
+        self.last = ()                              # enemy slots packed by the previous push
+
+    def __len__(self): return self.count
+
+    @property
+    def nbytes(self): return len(self.buf) + len(self.tiles)
+
+    # -- snapshot ------------------------------------------------------------
+    def push(self):
+        """Record the level as it is now (call right after Level.update)."""
+        if self.count:
+            slots = self._active()                      # may widen the record
+            off, size = self.top*self.size, self.size
+            prev = ((self.top - 1) % self.cap)*size
+            self.view[off+self.enemy_at:off+size] = self.view[prev+self.enemy_at:prev+size]
+            todo, self.last = set(slots).union(self.last), slots
+        else:
+            self._scan()
+            off, todo = self.top*self.size, range(len(self.bodies))
+        self._pack(self.buf, off, todo)
+        self.top = (self.top + 1) % self.cap
+        self.count = min(self.count + 1, self.cap)
+
+    def _active(self):
+        lv, slot = self.level, self.slot
+        lo, hi = getattr(lv, "window", (0, 0))
+        out = []
+        for pool in lv.enemies:
+            C, cells = pool.CELL, pool.cells
+            for c in range(lo//C - 1, (hi-1)//C + 2):
+                for b in cells.get(c, ()):
+                    i = slot.get(id(b))
+                    out.append(self._add(pool, b) if i is None else i)
+        self._grow()
+        return out
+
+    def _scan(self):
+        """Number every enemy in the level not seen yet (full pass)."""
+        slot = self.slot
+        for pool in self.level.enemies:
+            for bucket in pool.cells.values():
+                for b in bucket:
+                    if id(b) not in slot: self._add(pool, b)
+        self._grow()
+
+    def _add(self, pool, b):
+        i = self.slot[id(b)] = len(self.bodies)
+        self.bodies.append((pool, b))
+        return i
+
+    def _grow(self):
+        """Widen every record in the ring to the current slot count."""
+        old, size = self.size, self.enemy_at + len(self.bodies)*BODY.size
+        if size == old: return
+        buf = bytearray(self.cap*size)
+        for r in range(self.cap):
+            buf[r*size:r*size+old] = self.view[r*old:(r+1)*old]
+        self.buf, self.view, self.size = buf, memoryview(buf), size
+
+    def _pack(self, buf, off, slots):
+        lv = self.level
+        p, boss = lv.player, lv.boss
+        fires = lv.fireballs.items[:FIRE_SLOTS]
+        b = boss or _NO_BOSS
+        HEAD.pack_into(buf, off, lv.scroll_x, lv.prev_scroll,
+                       p.rect.x, p.rect.y, *p.prev, p.vx, p.vy, p.on_ground, p.facing, p.reload,
+                       boss is not None, b.rect.x, b.rect.y, *b.prev, b.vx, b.vy, b.hp, b.phase, len(fires))
+        if boss is not None:
+            _, words, gauss = boss.rng.getstate()
+            RNG.pack_into(buf, off + HEAD.size, *words, math.nan if gauss is None else gauss)
+        at = off + self.fire_at
+        for f in fires:
+            BODY.pack_into(buf, at, f.rect.x, f.rect.y, f.px, f.py, f.vx, f.vy, f.t, f.alive)
+            at += BODY.size
+        buf[at:off+self.enemy_at] = bytes(off + self.enemy_at - at)     # unused fireball slots
+        at, n = off + self.enemy_at, BODY.size
+        for i in slots:
+            e = self.bodies[i][1]
+            BODY.pack_into(buf, at + i*n, e.rect.x, e.rect.y, e.px, e.py, e.vx, e.vy, e.t, e.alive)
+
+    # -- restore -------------------------------------------------------------
+    def restore(self, record, current=None):
+        """Put a record (bytes-like, self.size long) back into the level.
+        With `current`, the record of the live state, only the enemies whose
+        bytes differ are unpacked and re-bucketed."""
+        lv = self.level
+        (lv.scroll_x, lv.prev_scroll, x, y, px, py, vx, vy, ground, facing, reload,
+         has_boss, bx, by, bpx, bpy, bvx, bvy, hp, phase, nfire) = HEAD.unpack_from(record)
+        p = lv.player
+        p.rect.topleft, p.prev, p.vx, p.vy = (x, y), (px, py), vx, vy
+        p.on_ground, p.facing, p.reload, p.shoot = bool(ground), facing, reload, False
+        if has_boss and lv.boss:
+            b = lv.boss
+            b.rect.topleft, b.prev, b.vx, b.vy, b.hp, b.phase = (bx, by), (bpx, bpy), bvx, bvy, hp, phase
+            *words, gauss = RNG.unpack_from(record, HEAD.size)
+            b.rng.setstate((3, tuple(words), None if math.isnan(gauss) else gauss))
+        fb = lv.fireballs
+        fb.cells.clear()
+        for k in range(nfire):
+            x, y, px, py, vx, vy, t, alive = BODY.unpack_from(record, self.fire_at + k*BODY.size)
+            f = fb.spawn(x, y, 1)
+            f.px, f.py, f.vx, f.vy, f.t, f.alive = px, py, vx, vy, t, bool(alive)
+        if current is None:
+            for pool in lv.enemies: pool.cells.clear()
+            held = (len(record) - self.enemy_at)//BODY.size      # a save-state may predate later spawns
+            for (pool, e), (x, y, px, py, vx, vy, t, alive) in zip(
+                    self.bodies, BODY.iter_unpack(record[self.enemy_at:self.enemy_at + held*BODY.size])):
+                e.rect.topleft, e.px, e.py, e.vx, e.vy, e.t, e.alive = (x, y), px, py, vx, vy, t, bool(alive)
+                if alive: pool.cells.setdefault(x//pool.CELL, []).append(e)
+            for _, e in self.bodies[held:]: e.alive = False
+        else:
+            n, at = BODY.size, self.enemy_at
+            step = BLOCK*n
+            for blk in range(at, self.size, step):
+                end = min(blk + step, self.size)
+                if record[blk:end] == current[blk:end]: continue
+                for off in range(blk, end, n):
+                    if record[off:off+n] == current[off:off+n]: continue
+                    pool, e = self.bodies[(off - at)//n]
+                    bucket = pool.cells.get(e.rect.x//pool.CELL)
+                    if bucket and e in bucket: bucket.remove(e)
+                    x, y, px, py, vx, vy, t, alive = BODY.unpack_from(record, off)
+                    e.rect.topleft, e.px, e.py, e.vx, e.vy, e.t, e.alive = (x, y), px, py, vx, vy, t, bool(alive)
+                    if alive: pool.cells.setdefault(x//pool.CELL, []).append(e)
+        self.last = range(len(self.bodies))         # everything may differ from the ring's top now
+        if lv.tiles.version != self.version:        # tiles are static in play; guard anyway
+            lv.tiles.cells[:] = self.tiles
+            lv.tiles.chunks.clear()
+            self.version = lv.tiles.version = lv.tiles.version + 1
+
+    def pop(self):
+        """Step back: drop the newest record (the current state) and restore
+        the one before it. False once history is used up."""
+        if self.count < 2: return False
+        cur = self.top = (self.top - 1) % self.cap
+        self.count -= 1
+        off, cur = ((cur - 1) % self.cap)*self.size, cur*self.size
+        self.restore(self.view[off:off+self.size], self.view[cur:cur+self.size])
+        return True
+
+    def save(self):
+        """The current level state as bytes (a save-state for this level)."""
+        self._scan()
+        buf = bytearray(self.size)
+        self._pack(buf, 0, range(len(self.bodies)))
+        return bytes(buf)
+
+    def load(self, state):
+        """Restore a save() state. History restarts from it: older records
+        are not steps away from it any more."""
+        self.restore(memoryview(state))
+        self.count = 0
+
+class _NoBoss:
+    class rect: x = y = 0
+    prev, vx, vy, hp, phase = (0, 0), 0, 0, 0, 0
+_NO_BOSS = _NoBoss()
@@ -0,0 +1,151 @@
+"""
+Streaming level loader for the Mario game
+-----------------------------------------
+A level is one byte per tile column: ground height in the low nibble and an
+optional floating platform row in the high nibble (0 = none). That is what
+gets generated (seeded by world/level index, so a level is always the same),
+what a .lvl file holds, and what a worker thread expands into a TileMap.
+
+LevelStreamer runs that worker. While a level is being played it:
+  * builds the next level's TileMap and its first chunk surfaces
+    (prefetch / take), so crossing the exit is a dictionary lookup;
+  * renders chunk surfaces a few chunks ahead of the camera (ahead), which
+    the main loop picks up from a queue once per frame (pump).
+Anything not ready in time falls back to being built on the main thread, so
+the game never waits on the worker.
+"""
+import pathlib, queue, random, struct, threading
+from mario_tiles import TileMap, CHUNK
+
+MAGIC  = b"MLV1"
+HEADER = struct.Struct("<4sHB")         # magic, columns, rows
+LEVEL_DIR = pathlib.Path(__file__).with_name("levels")
+
+# -- compact level description ------------------------------------------------
+def generate(world, idx, cols, castle=False):
+    """Column bytes for level idx of world; flat ground for the first screen
+    and for castles (the boss arena)."""
+    rng = random.Random(f"mario:{world}:{idx}")
+    out, h = bytearray(), 2
+    for c in range(cols):
+        if castle or c < CHUNK or c >= cols - 4:
+            h = 2
+        elif rng.random() < 0.08:               # one-tile step up or down
+            h = max(2, min(4, h + rng.choice((-1, 1))))
+        out.append(h)
+    if not castle:
+        c = CHUNK + rng.randrange(4)
+        while c < cols - 8:                     # floating platforms, 3-5 wide
+            row, w = rng.randrange(6, 9), rng.randrange(3, 6)
+            for k in range(c, c+w): out[k] |= row << 4
+            c += w + rng.randrange(6, 16)
+    return bytes(out)
+
+def encode(cols_bytes, rows):
+    return HEADER.pack(MAGIC, len(cols_bytes), rows) + cols_bytes
+
+def decode(data):
+    magic, cols, rows = HEADER.unpack_from(data)
+    if magic != MAGIC: raise ValueError("not a Mario level file")
+    return data[HEADER.size:HEADER.size+cols], rows
+
+def level_path(world, idx): return LEVEL_DIR / f"w{world+1}-{idx+1}.lvl"
+
+def describe(world, idx, cols, castle=False):
+    """Column bytes from levels/wW-L.lvl if present, else generated."""
+    p = level_path(world, idx)
+    if p.exists():
+        return decode(p.read_bytes())[0]
+    return generate(world, idx, cols, castle)
+
+def build_tiles(desc, rows, tile):
+    m = TileMap(len(desc), rows, tile)
+    for c, b in enumerate(desc):
+        ground, plat = b & 15, b >> 4
+        base = c*rows
+        m.cells[base+rows-ground:base+rows] = b"\1"*ground
+        if plat: m.cells[base+plat] = 1
+    return m
+
+# -- worker ---------------------------------------------------------------------
+class LevelStreamer:
+    LOOKAHEAD = 2       # chunks rendered ahead of the camera's right edge
+
+    def __init__(self, rows, tile, view_w):
+        self.rows, self.tile, self.view_w = rows, tile, view_w
+        self.jobs, self.done = queue.Queue(), queue.Queue()
+        self.levels = {}                # (world, idx) -> TileMap, filled by pump
+        self.wanted = set()             # (world, idx) prefetched and not yet taken
+        self.pending = set()            # (id(tilemap), chunk) already queued
+        self.built = self.chunks = self.fallbacks = self.late = 0
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job[0] == "level":
+                _, key, cols, castle, color = job
+                m = build_tiles(describe(key[0], key[1], cols, castle), self.rows, self.tile)
+                surfs = [(c, m.render_chunk(c, color)) for c in range(min(2, m.nchunks))]
+                self.done.put(("level", key, m, color, surfs))
+            else:
+                _, m, c, color, version = job
+                self.done.put(("chunk", m, c, color, version, m.render_chunk(c, color)))
+
+    # -- main thread side -----------------------------------------------------
+    def prefetch(self, world, idx, cols, castle, color):
+        self.wanted.add((world, idx))
+        self.jobs.put(("level", (world, idx), cols, castle, color))
+
+    def take(self, world, idx, cols, castle, color):
+        """The prefetched TileMap for (world, idx), or one built right now."""
+        self.pump()
+        self.wanted.discard((world, idx))       # a prefetch still running is dropped by pump
+        m = self.levels.pop((world, idx), None)
+        if m is None:
+            self.fallbacks += 1
+            m = build_tiles(describe(world, idx, cols, castle), self.rows, self.tile)
+        return m
+
+    def ahead(self, m, scroll_x, color):
+        """Queue chunk renders for the window plus LOOKAHEAD chunks to the right."""
+        w = CHUNK*self.tile
+        first = scroll_x // w
+        last = min(m.nchunks-1, (scroll_x + self.view_w - 1)//w + self.LOOKAHEAD)
+        for c in range(first, last+1):
+            if (c, color) not in m.chunks and (id(m), c) not in self.pending:
+                self.pending.add((id(m), c))
+                self.jobs.put(("chunk", m, c, color, m.version))
+
+    def pump(self):
+        """Move finished work from the worker into place (main thread only)."""
+        while True:
+            try: job = self.done.get_nowait()
+            except queue.Empty: return
+            if job[0] == "level":
+                _, key, m, color, surfs = job
+                if key not in self.wanted:      # take() already built it on the main thread
+                    self.late += 1
+                    continue
+                for c, s in surfs: m.put_chunk(c, color, s, m.version)
+                self.levels[key] = m
+                self.built += 1
+            else:
+                _, m, c, color, version, s = job
+                self.pending.discard((id(m), c))
+                m.put_chunk(c, color, s, version)
+                self.chunks += 1
+
+    def stats(self):
+        return {"levels": self.built, "chunks": self.chunks, "fallbacks": self.fallbacks, "late": self.late}
+
+if __name__ == "__main__":
+    # write the generated levels out as editable .lvl files:
+    #   python mario_stream.py WORLDS LEVELS_PER_WORLD SCREENS
+    import sys
+    n_worlds, per_world, screens = (int(a) for a in (sys.argv[1:] or (5, 3, 2)))
+    LEVEL_DIR.mkdir(exist_ok=True)
+    for w in range(n_worlds):
+        for i in range(per_world):
+            level_path(w, i).write_bytes(encode(generate(w, i, 512*screens//32, i == per_world-1), 448//32))
+    print("wrote", n_worlds*per_world, "levels to", LEVEL_DIR)
@@ -0,0 +1,109 @@
+"""
+Chunked tilemap for the Mario level engine
+------------------------------------------
+Tiles live in one bytearray, column-major, so a fixed-width column chunk is
+a contiguous slice and "is (col, row) solid" is a single index. Collision
+asks only for the handful of tiles under an actor's rect instead of testing
+the whole level, and drawing blits one pre-rendered surface per chunk that
+intersects the camera window. Chunk surfaces are rendered on first sight
+and kept in a small LRU, so a level hundreds of screens long costs the same
+per frame as a two-screen one.
+"""
+from collections import OrderedDict
+import pygame as pg
+
+CHUNK    = 16               # tile columns per chunk (one screen at 512 px)
+EMPTY, SOLID = 0, 1
+KEY      = (255, 0, 255)    # colorkey for the transparent part of a chunk
+
+class TileMap:
+    def __init__(self, cols, rows, tile, max_chunks=8):
+        self.cols, self.rows, self.tile = cols, rows, tile
+        self.cells = bytearray(cols*rows)       # cells[col*rows + row]
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()             # (chunk, color) -> Surface
+        self.version = 0                        # bumped on every edit
+        self.hits = self.misses = 0
+
+    @property
+    def width(self): return self.cols*self.tile
+
+    @property
+    def nchunks(self): return -(-self.cols // CHUNK)
+
+    # -- cells ---------------------------------------------------------------
+    def get(self, col, row):
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[col*self.rows + row]
+        return EMPTY
+
+    def set(self, col, row, v=SOLID):
+        self.cells[col*self.rows + row] = v
+        self.version += 1
+        c = col // CHUNK
+        for k in [k for k in self.chunks if k[0] == c]:
+            del self.chunks[k]
+
+    def fill(self, col0, col1, row0, row1, v=SOLID):
+        """Set the block [col0, col1) x [row0, row1)."""
+        for c in range(max(0, col0), min(self.cols, col1)):
+            base = c*self.rows
+            self.cells[base+row0:base+row1] = bytes([v])*(row1-row0)
+        self.version += 1
+        self.chunks.clear()
+
+    def around(self, rect):
+        """Rects of the solid tiles overlapping rect (a few, whatever the level size)."""
+        t, rows, cells = self.tile, self.rows, self.cells
+        c0, c1 = max(0, rect.left//t), min(self.cols-1, (rect.right-1)//t)
+        r0, r1 = max(0, rect.top//t), min(rows-1, (rect.bottom-1)//t)
+        return [pg.Rect(c*t, r*t, t, t)
+                for c in range(c0, c1+1) for r in range(r0, r1+1)
+                if cells[c*rows + r]]
+
+    def __len__(self):
+        return self.cols*self.rows - self.cells.count(EMPTY)
+
+    # -- drawing -------------------------------------------------------------
+    def render_chunk(self, c, color):
+        """Draw chunk c into a new surface; touches no cache, so it is safe to
+        call from a loader thread (see mario_stream.py)."""
+        t, rows = self.tile, self.rows
+        s = pg.Surface((CHUNK*t, rows*t))
+        s.fill(KEY); s.set_colorkey(KEY)
+        for col in range(c*CHUNK, min(self.cols, (c+1)*CHUNK)):
+            base = col*rows
+            for row in range(rows):
+                if self.cells[base+row]:
+                    s.fill(color, ((col - c*CHUNK)*t, row*t, t, t))
+        return s
+
+    def put_chunk(self, c, color, s, version=None):
+        """Cache a rendered chunk, unless the map was edited since (version)."""
+        if version is not None and version != self.version: return None
+        if pg.display.get_surface(): s = s.convert()
+        self.chunks[(c, color)] = s
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return s
+
+    def chunk_surface(self, c, color):
+        key = (c, color)
+        s = self.chunks.get(key)
+        if s is not None:
+            self.hits += 1
+            self.chunks.move_to_end(key)
+            return s
+        self.misses += 1
+        return self.put_chunk(c, color, self.render_chunk(c, color))
+
+    def draw(self, surf, scroll_x, color):
+        """Blit the chunks intersecting [scroll_x, scroll_x + screen width)."""
+        w = CHUNK*self.tile
+        first = max(0, scroll_x // w)
+        last = min(self.nchunks-1, (scroll_x + surf.get_width() - 1) // w)
+        for c in range(first, last+1):
+            surf.blit(self.chunk_surface(c, color), (c*w - scroll_x, 0))
+
+    def stats(self):
+        return {"chunks": len(self.chunks), "hits": self.hits, "misses": self.misses}
@@ -4,16 +4,34 @@ Mario Forever – zero‑shot vertical slice
 ---------------------------------------
 5 worlds × 3 levels, castle + BoomBoom boss at the end of each world,
 geared for 60 FPS on an M1 Mac.  Built on plain Pygame 2.x.
+Physics runs at a fixed 60 Hz whatever the render rate.
+
+Z jumps, X throws a fireball. Hold R to rewind; F5/F9 save/load a state.
+Options: --screens N (level length)  --enemies N (per screen)  --fps N (render cap)
+         --headless --autoplay --steps N (uncapped playtest, prints steps/s)
+F3 toggles the profiler overlay; VIBE_PROF=trace.csv dumps a frame trace.
 
 Author: (c) 2025 CatSama • Licence: MIT
 """
-import sys, math, random, pathlib, pygame as pg
+import sys, math, random, time, pathlib, pygame as pg
+from mario_stream import LevelStreamer, build_tiles, describe
+from vibe_prof import PROF
+from vibe_display import Display
+from vibe_capture import Capture
+from mario_actors import Goombas, Koopas, Fireballs, step_body
+from mario_rewind import Rewind
 WIDTH, HEIGHT = 512, 448   # 16×14 tiles @32 px – NES aspect
-FPS            = 60
+FPS            = 60     # render cap
+SIM_HZ         = 60     # physics rate: GRAVITY, SPEED, JUMP are per step
+DT             = 1/SIM_HZ
+MAX_STEPS      = 5      # catch-up steps per frame before we drop time
 GRAVITY        = 0.35
 TILE           = 32
 VIBES          = True   # global “vibe mode” toggle
 BOOM_HP        = 3
+LEVEL_SCREENS  = 2      # level length in screens (try --screens 300)
+ENEMIES        = 2      # goombas/koopas per screen (try --enemies 100)
+REWIND_S       = 10     # seconds of history R can rewind through
 
 # ---------------------------------------------------------------------------
 # World / level catalogue ----------------------------------------------------
@@ -42,26 +60,12 @@ class Actor(pg.sprite.Sprite):
         super().__init__()
         self.image  = pg.Surface((w,h), pg.SRCALPHA)
         self.rect   = self.image.get_rect(topleft=(x,y))
+        self.prev   = self.rect.topleft     # position one step ago (for lerp)
         self.vx     = self.vy = 0
 
     def update(self, tiles):
-        # Horizontal
-        self.rect.x += self.vx
-        for t in self.rect.collidelistall(tiles):
-            if self.vx>0: self.rect.right  = tiles[t].left
-            if self.vx<0: self.rect.left   = tiles[t].right
-        # Vertical
-        self.vy += GRAVITY
-        self.rect.y += self.vy
-        on_ground = False
-        for t in self.rect.collidelistall(tiles):
-            if self.vy>0:
-                self.rect.bottom = tiles[t].top
-                self.vy = 0
-                on_ground = True
-            elif self.vy<0:
-                self.rect.top = tiles[t].bottom
-                self.vy = 0
+        # tiles is a TileMap: only the solid tiles under the rect are tested
+        self.vy, on_ground, _ = step_body(self.rect, self.vx, self.vy, tiles, GRAVITY)
         return on_ground
 
 # ---------------------------------------------------------------------------
@@ -69,31 +73,40 @@ class Actor(pg.sprite.Sprite):
 class Player(Actor):
     SPEED  = 2.4
     JUMP   = -7.6
+    RELOAD = 20             # steps between fireballs (X)
     def __init__(self, x, y):
         super().__init__(x, y)
         self.image.fill((255,64,64))
         self.on_ground = False
+        self.facing    = 1
+        self.reload    = 0
+        self.shoot     = False
     def update(self, tiles, keys):
         self.vx = (keys[pg.K_RIGHT] - keys[pg.K_LEFT]) * self.SPEED
+        if self.vx: self.facing = sign(self.vx)
         if keys[pg.K_z] and self.on_ground:
             self.vy = self.JUMP
+        self.reload = max(0, self.reload-1)
+        self.shoot  = bool(keys[pg.K_x]) and not self.reload
+        if self.shoot: self.reload = self.RELOAD
         self.on_ground = super().update(tiles)
 
 # ---------------------------------------------------------------------------
 # BoomBoom boss --------------------------------------------------------------
 class BoomBoom(Actor):
     SPEED = 1.8
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng):
         super().__init__(x, y)
         self.image.fill((255,128,0))
         self.hp      = BOOM_HP
         self.phase   = 0
+        self.rng     = rng          # own RNG: only castle levels carry its state in a rewind record
     def update(self, tiles, player):
         # simple hop‑and‑charge pattern
         if self.phase==0:      # run toward player
             self.vx = self.SPEED * sign(player.rect.centerx - self.rect.centerx)
             grounded = super().update(tiles)
-            if grounded and random.random()<0.015:
+            if grounded and self.rng.random()<0.015:
                 self.vy = -8
         elif self.phase==1:    # defeated death‑spin
             self.vx = 0
@@ -112,63 +125,102 @@ class BoomBoom(Actor):
 # ---------------------------------------------------------------------------
 # Level object ---------------------------------------------------------------
 class Level:
-    def __init__(self, world_idx, idx):
+    def __init__(self, world_idx, idx, screens=None, tiles=None):
         self.world_idx = world_idx
         self.idx       = idx
+        self.screens   = screens or LEVEL_SCREENS
         self.is_castle = (idx == LEVELS_PER_WORLD-1)
-        self.tiles     = self._make_tiles()
+        self.tiles     = self._make_tiles() if tiles is None else tiles
         player_start_x = TILE*2
         player_start_y = HEIGHT - TILE*3
         self.player    = Player(player_start_x, player_start_y)
-        self.entities  = pg.sprite.Group(self.player)
+        self.entities  = pg.sprite.Group(self.player)     # full Sprites
+        self.boss      = None
         if self.is_castle:
-            boss = BoomBoom(WIDTH-5*TILE, HEIGHT - 4*TILE)
+            boss = BoomBoom(WIDTH-5*TILE, HEIGHT - 4*TILE, random.Random(f"boss:{world_idx}:{idx}"))
             self.entities.add(boss)
             self.boss = boss
-        self.scroll_x  = 0
+        # everything numerous lives in typed pools (see mario_actors.py)
+        self.goombas, self.koopas = Goombas(GRAVITY), Koopas(GRAVITY)
+        self.fireballs = Fireballs(GRAVITY)
+        self.enemies   = (self.goombas, self.koopas)
+        self.pools     = self.enemies + (self.fireballs,)
+        if not self.is_castle: self._spawn_enemies()
+        self.scroll_x  = self.prev_scroll = 0
     # -- tile generation -----------------------------------------------------
     def _make_tiles(self):
-        tiles = []
-        ground_y = HEIGHT - TILE*2
-        for x in range(0, WIDTH*2, TILE):
-            rect = pg.Rect(x, ground_y, TILE, TILE*2)
-            tiles.append(rect)
-        return tiles
+        # column bytes from levels/wW-L.lvl or generated (see mario_stream.py)
+        desc = describe(self.world_idx, self.idx, WIDTH*self.screens//TILE, self.is_castle)
+        return build_tiles(desc, HEIGHT//TILE, TILE)
+    def _spawn_enemies(self):
+        rng = random.Random(f"enemies:{self.world_idx}:{self.idx}")
+        for _ in range(ENEMIES*(self.screens-1)):
+            x = rng.randrange(WIDTH, self.tiles.width - TILE)           # not on screen one
+            pool = self.koopas if rng.random() < 0.3 else self.goombas
+            pool.spawn(x, TILE*4, rng.choice((-1, 1)))
     # -- update & draw -------------------------------------------------------
     def update(self, keys):
-        self.player.update(self.tiles, keys)
-        for e in self.entities:
-            if isinstance(e, BoomBoom):
-                e.update(self.tiles, self.player)
-        # camera
-        self.scroll_x = max(0, self.player.rect.centerx - WIDTH//3)
-    def draw(self, surf):
+        for e in self.entities: e.prev = e.rect.topleft
+        self.prev_scroll = self.scroll_x
+        p = self.player
+        p.update(self.tiles, keys)
+        if self.boss: self.boss.update(self.tiles, p)
+        # pools only simulate within a screen either side of the camera
+        lo, hi = self.window = self.scroll_x - WIDTH, self.scroll_x + 2*WIDTH
+        if p.shoot:
+            self.fireballs.spawn(p.rect.centerx, p.rect.centery-6, p.facing)
+        for pool in self.pools: pool.update(self.tiles, p, lo, hi)
+        for f in self.fireballs.items:
+            if any(e.hit(f.rect) for e in self.enemies):
+                self.fireballs.kill(f)
+        # camera (clamped to the level so the right edge can be reached)
+        self.scroll_x = max(0, min(self.tiles.width - WIDTH,
+                                   self.player.rect.centerx - WIDTH//3))
+    def draw(self, surf, alpha=1.0):
+        """alpha: how far between the last two physics steps to draw (0..1)."""
+        lerp = lambda a, b: round(a + (b-a)*alpha)
+        scroll = lerp(self.prev_scroll, self.scroll_x)
         surf.fill(WORLDS[self.world_idx]["bg"])
         # vibes overlay
         if VIBES:
             t = pg.time.get_ticks()/1000
             wobble = math.sin(t*2)*4
             surf.scroll(int(wobble),0)
-        # tiles
-        for r in self.tiles:
-            pg.draw.rect(surf, WORLDS[self.world_idx]["palette"],
-                         r.move(-self.scroll_x,0))
+        # tiles: cached chunk surfaces, only those inside the camera window
+        self.tiles.draw(surf, scroll, WORLDS[self.world_idx]["palette"])
         # entities
+        for pool in self.pools: pool.draw(surf, scroll, alpha)
         for e in self.entities:
-            surf.blit(e.image, (e.rect.x - self.scroll_x, e.rect.y))
+            surf.blit(e.image, (lerp(e.prev[0], e.rect.x) - scroll, lerp(e.prev[1], e.rect.y)))
 
 # ---------------------------------------------------------------------------
 # Game coordinator -----------------------------------------------------------
 class Game:
     def __init__(self):
         pg.init()
-        self.screen   = pg.display.set_mode((WIDTH,HEIGHT))
+        self.display  = Display((WIDTH,HEIGHT))   # VIBE_DISPLAY=2160p etc: see vibe_display.py
+        self.screen   = self.display.surface
+        self.capture  = Capture.from_env(self.screen)   # VIBE_CAPTURE=out.vcap: see vibe_capture.py
         pg.display.set_caption("Mario Forever • 5 Worlds demo")
         self.clock    = pg.time.Clock()
         self.world    = 0
         self.level_no = 0
+        self.steps, self.t0 = 0, time.perf_counter()
+        self.stream   = LevelStreamer(HEIGHT//TILE, TILE, WIDTH)
         self.level    = Level(self.world, self.level_no)
+        self.rewind   = Rewind(self.level, REWIND_S, SIM_HZ)
+        self.state    = None                # F5 save-state: (world, level, bytes)
+        self.prefetch()
     # -- level progression ---------------------------------------------------
+    def spec(self, world, idx):
+        """(columns, is_castle, tile color) the streamer needs for a level."""
+        return (WIDTH*LEVEL_SCREENS//TILE, idx == LEVELS_PER_WORLD-1,
+                WORLDS[world]["palette"])
+    def prefetch(self):
+        # build the following level on the loader thread while this one plays
+        w, i = self.world, self.level_no + 1
+        if i >= LEVELS_PER_WORLD: w, i = w+1, 0
+        if w < len(WORLDS): self.stream.prefetch(w, i, *self.spec(w, i))
     def next_level(self):
         self.level_no += 1
         if self.level_no >= LEVELS_PER_WORLD:
@@ -176,24 +228,90 @@ class Game:
             self.world   += 1
             if self.world >= len(WORLDS):
                 print("You beat the game!")
-                pg.quit(); sys.exit(0)
-        self.level = Level(self.world, self.level_no)
+                self.quit()
+        tiles = self.stream.take(self.world, self.level_no, *self.spec(self.world, self.level_no))
+        self.level = Level(self.world, self.level_no, tiles=tiles)
+        self.rewind = Rewind(self.level, REWIND_S, SIM_HZ)
+        self.prefetch()
     # -- main loop -----------------------------------------------------------
-    def run(self):
-        while True:
-            keys = pg.key.get_pressed()
-            for ev in pg.event.get():
-                if ev.type==pg.QUIT or (ev.type==pg.KEYDOWN and ev.key==pg.K_ESCAPE):
-                    pg.quit(); sys.exit(0)
-            self.level.update(keys)
-            # win condition: reach far right or boss defeated
-            if self.level.player.rect.right - self.level.scroll_x >= WIDTH-32:
-                if not self.level.is_castle or self.level.boss.phase==1:
-                    self.next_level()
-            self.level.draw(self.screen)
-            pg.display.flip()
+    def step(self, keys):
+        """One fixed DT physics step (or one step back while R is held)."""
+        self.steps += 1
+        if keys[pg.K_r]:
+            self.rewind.pop()
+            return
+        self.level.update(keys)
+        self.rewind.push()
+        # win condition: reach far right or boss defeated
+        if self.level.player.rect.right - self.level.scroll_x >= WIDTH-32:
+            if not self.level.is_castle or self.level.boss.phase==1:
+                self.next_level()
+    def quit(self):
+        dt = time.perf_counter() - self.t0
+        print(f"{self.steps} steps in {dt:.2f}s = {self.steps/dt:.0f} steps/s")
+        pg.quit(); sys.exit(0)
+    def run(self, headless=False, autoplay=False, max_steps=None):
+        """Fixed-timestep loop: physics advances in DT steps off an accumulator,
+        drawing happens once per frame interpolated between the last two steps.
+        headless: no drawing and no frame cap, one step per pass, as fast as
+        the CPU allows (pair with autoplay / max_steps for playtesting)."""
+        self.steps, self.t0 = 0, time.perf_counter()
+        acc, last, rate_t, rate_n = 0.0, self.t0, self.t0, 0
+        while max_steps is None or self.steps < max_steps:
+            with PROF("input"):
+                keys = AUTOPLAY if autoplay else pg.key.get_pressed()
+                for ev in pg.event.get():
+                    if ev.type==pg.QUIT or (ev.type==pg.KEYDOWN and ev.key==pg.K_ESCAPE):
+                        self.quit()
+                    if ev.type==pg.KEYDOWN and ev.key==pg.K_F3: PROF.toggle()
+                    if ev.type==pg.KEYDOWN and ev.key==pg.K_F5:
+                        self.state = (self.world, self.level_no, self.rewind.save())
+                    if ev.type==pg.KEYDOWN and ev.key==pg.K_F9 and self.state \
+                            and self.state[:2] == (self.world, self.level_no):
+                        self.rewind.load(self.state[2])
+            if headless:
+                with PROF("update"):
+                    self.step(keys)
+                    self.stream.pump()
+                PROF.frame()
+                continue
+            now = time.perf_counter()
+            acc = min(acc + now - last, MAX_STEPS*DT); last = now
+            with PROF("update"):
+                while acc >= DT:
+                    self.step(keys); acc -= DT
+                self.stream.ahead(self.level.tiles, self.level.scroll_x,
+                                  WORLDS[self.world]["palette"])
+                self.stream.pump()
+            with PROF("render"):
+                self.level.draw(self.screen, acc/DT)
+                PROF.draw(self.screen)
+            with PROF("flip"):
+                self.display.present()
+            if self.capture:
+                with PROF("capture"):
+                    self.capture.grab()
+            PROF.frame()
             self.clock.tick(FPS)
+            if now - rate_t >= 1:           # instrumentation: sim vs render rate
+                pg.display.set_caption(f"Mario Forever • {(self.steps-rate_n)/(now-rate_t):.0f} steps/s "
+                                       f"{self.clock.get_fps():.0f} fps")
+                rate_t, rate_n = now, self.steps
+        self.quit()
+
+class _Autoplay:
+    """Held keys for headless playtesting: run right, keep jumping."""
+    def __getitem__(self, k): return k in (pg.K_RIGHT, pg.K_z)
+AUTOPLAY = _Autoplay()
 
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
-    Game().run()
+    arg = lambda name, d=None: type(d or 0)(sys.argv[sys.argv.index(name)+1]) if name in sys.argv else d
+    LEVEL_SCREENS = arg("--screens", LEVEL_SCREENS)
+    ENEMIES       = arg("--enemies", ENEMIES)
+    FPS           = arg("--fps", FPS)
+    # --headless: dummy video driver, uncapped steps (use with --autoplay/--steps N)
+    if "--headless" in sys.argv:
+        import os; os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    Game().run(headless="--headless" in sys.argv, autoplay="--autoplay" in sys.argv,
+               max_steps=arg("--steps"))
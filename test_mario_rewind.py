@@ -0,0 +1,45 @@
+"""
+Mario rewind with enemies spawned after the Rewind was built
+------------------------------------------------------------
+The game never spawns enemies mid-level, but drivers (bench_games.py) do.
+Steps a Game with a freshly spawned goomba in view, then rewinds past the
+spawn and checks save-states taken before and after it still load.
+
+    python -m pytest -q test_mario_rewind.py
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import random
+import pygame as pg
+import o3aphamario4k as m
+
+class Keys:
+    def __init__(self, down): self.down = set(down)
+    def __getitem__(self, k): return k in self.down
+
+IDLE, BACK = Keys([]), Keys([pg.K_r])
+
+def live(level):
+    return {id(b) for pool in level.enemies for bucket in pool.cells.values() for b in bucket if b.alive}
+
+def test_step_after_spawn():
+    random.seed(3)
+    g = m.Game()
+    for _ in range(30): g.step(IDLE)
+    before, slots = g.rewind.save(), len(g.rewind.bodies)
+    p = g.level.player.rect
+    goomba = g.level.goombas.spawn(p.x + 6*m.TILE, p.y - 2*m.TILE)
+    for _ in range(30): g.step(IDLE)                # registers the goomba, no KeyError
+    assert len(g.rewind.bodies) == slots + 1
+    assert id(goomba) in live(g.level)
+    after = g.rewind.save()
+    assert len(after) == g.rewind.size
+    for _ in range(40): g.step(BACK)                # back past the spawn
+    assert id(goomba) not in live(g.level)
+    g.rewind.load(after)
+    assert g.rewind.save() == after and id(goomba) in live(g.level)
+    g.rewind.load(before)                           # saved before the spawn
+    assert id(goomba) not in live(g.level)
+    for _ in range(10): g.step(IDLE)
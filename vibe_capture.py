@@ -0,0 +1,129 @@
+"""
+Background frame capture
+------------------------
+pygame.image.save() inside the loop costs 35-45 ms a frame. Here the main
+thread only copies the frame's pixels out of the surface (a raw view of the
+surface memory, no per-pixel conversion) into a free buffer from a fixed
+pool, about half a millisecond. A worker thread then zlib-compresses the
+copy and appends it to a .vcap stream. When every buffer is still waiting
+on the worker, the frame is dropped and counted rather than waiting, so
+capture can fall behind but never stalls the game.
+
+    cap = Capture.from_env(display.surface)     # VIBE_CAPTURE=qa.vcap[,every]
+    ...
+    display.present(rects)
+    if cap: cap.grab()
+
+from_env() returns None when VIBE_CAPTURE is unset and otherwise closes the
+file at exit, printing frames written / dropped and the snapshot and
+capture-to-disk latency. `every` keeps one frame in n (2 = 30 fps). To get
+PNGs back out:
+
+    python vibe_capture.py qa.vcap frames/
+"""
+import atexit, os, queue, struct, sys, threading, time, zlib
+from array import array
+from vibe_prof import percentile
+
+MAGIC  = b"VCP1"
+HEADER = struct.Struct("<4sIIIBBB")     # magic, width, height, pitch, R/G/B byte offsets
+FRAME  = struct.Struct("<IdI")          # frame no, seconds since start, compressed size
+
+class Capture:
+    def __init__(self, surface, path, every=1, slots=8, level=1):
+        if surface.get_bytesize() != 4: raise ValueError("capture needs a 32-bit surface")
+        self.surface, self.path, self.every, self.level = surface, path, max(1, every), level
+        w, h = surface.get_size()
+        masks = surface.get_masks()[:3]
+        offs = [m.bit_length()//8 - 1 for m in masks]   # little-endian byte of each channel
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, w, h, surface.get_pitch(), *offs))
+        size = surface.get_pitch()*h
+        self.free = queue.Queue()
+        for _ in range(slots): self.free.put(bytearray(size))
+        self.jobs = queue.Queue()
+        self.calls = self.grabbed = self.dropped = self.written = self.bytes = 0
+        self.snap_ms, self.lat_ms = array("f"), array("f")
+        self.t0 = time.perf_counter()
+        self.worker = threading.Thread(target=self._work, daemon=True)
+        self.worker.start()
+
+    @classmethod
+    def from_env(cls, surface):
+        spec = os.environ.get("VIBE_CAPTURE")
+        if not spec: return None
+        path, _, every = spec.partition(",")
+        cap = cls(surface, path, int(every or 1))
+        atexit.register(cap.close)
+        return cap
+
+    # -- main thread ---------------------------------------------------------
+    def grab(self):
+        """Snapshot the surface as it is now; never blocks."""
+        self.calls += 1
+        if (self.calls - 1) % self.every: return
+        t = time.perf_counter()
+        try: buf = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1                   # worker is behind: skip, don't wait
+            return
+        buf[:] = memoryview(self.surface.get_view("0")).cast("B")
+        self.jobs.put((buf, self.calls - 1, t))
+        self.grabbed += 1
+        self.snap_ms.append((time.perf_counter() - t)*1e3)
+
+    def close(self):
+        if self.file.closed: return
+        self.jobs.put(None)
+        self.worker.join()
+        self.file.close()
+        r = self.report()
+        print(f"capture {self.path}: {r['written']} frames, {r['dropped']} dropped, "
+              f"{r['bytes']/1e6:.1f} MB, snapshot p50 {r['snapshot_ms'][0]:.2f} ms, "
+              f"latency p50 {r['latency_ms'][0]:.1f} / p95 {r['latency_ms'][1]:.1f} ms", file=sys.stderr)
+
+    def report(self):
+        snap, lat = sorted(self.snap_ms), sorted(self.lat_ms)
+        return {"grabbed": self.grabbed, "written": self.written, "dropped": self.dropped, "bytes": self.bytes,
+                "snapshot_ms": tuple(percentile(snap, q) for q in (.5, .95, 1)),
+                "latency_ms": tuple(percentile(lat, q) for q in (.5, .95, 1))}
+
+    # -- worker --------------------------------------------------------------
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None: return
+            buf, frame, t = job
+            data = zlib.compress(buf, self.level)       # releases the GIL
+            self.free.put(buf)
+            self.file.write(FRAME.pack(frame, t - self.t0, len(data)))
+            self.file.write(data)
+            self.written += 1
+            self.bytes += FRAME.size + len(data)
+            self.lat_ms.append((time.perf_counter() - t)*1e3)
+
+# ---------------------------------------------------------------------------
+def read(path):
+    """Yield (frame no, seconds, width, height, RGB bytes) from a .vcap file."""
+    with open(path, "rb") as f:
+        magic, w, h, pitch, ro, go, bo = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC: raise ValueError("not a capture file")
+        while True:
+            head = f.read(FRAME.size)
+            if len(head) < FRAME.size: return
+            frame, t, n = FRAME.unpack(head)
+            raw = zlib.decompress(f.read(n))
+            if pitch != w*4: raw = b"".join(raw[y*pitch:y*pitch + w*4] for y in range(h))
+            rgb = bytearray(w*h*3)
+            rgb[0::3], rgb[1::3], rgb[2::3] = raw[ro::4], raw[go::4], raw[bo::4]
+            yield frame, t, w, h, bytes(rgb)
+
+if __name__ == "__main__":
+    import pathlib, pygame
+    src, out = sys.argv[1], pathlib.Path(sys.argv[2])
+    out.mkdir(parents=True, exist_ok=True)
+    n = 0
+    for frame, t, w, h, rgb in read(src):
+        pygame.image.save(pygame.image.frombuffer(rgb, (w, h), "RGB"), str(out / f"{frame:06d}.png"))
+        n += 1
+    print("wrote", n, "frames to", out)
@@ -0,0 +1,96 @@
+"""
+Shared display pipeline: native-resolution render target, scaled output
+-----------------------------------------------------------------------
+Every game makes one Display(native_size) in place of set_mode(), draws to
+its `surface`, which is always the native size (900x600, 800x600, 960x720,
+512x448), and calls `present(rects)` once per frame instead of
+display.flip()/update(). How that reaches the screen is picked by
+VIBE_DISPLAY, a comma-separated list:
+
+    (unset)        plain set_mode window at native size; present() is flip/update
+    1080p, 2160p,  window (or screen, with fs) of that size; the native frame is
+    1440p, WxH     scaled up once per frame, centred, letterboxed in black
+    fs             fullscreen (at the desktop size unless a size is given)
+    int            integer factor only: pixel-perfect, and only the dirty rects
+                   are rescaled and pushed (fit mode always rescales the frame)
+    smooth         smoothscale instead of nearest (fit mode only)
+    scaled         hand it to SDL: set_mode(native, SCALED) and let the GPU
+                   renderer stretch it (no CPU scaling, no size control)
+
+    VIBE_DISPLAY=2160p,int python a.py
+    VIBE_DISPLAY=fs,scaled python mansion4k.py
+"""
+import os
+import pygame as pg
+
+NAMED = {"720p": (1280, 720), "1080p": (1920, 1080), "1440p": (2560, 1440), "2160p": (3840, 2160), "4k": (3840, 2160)}
+DIRTY_MAX  = 96         # native window: more rects than this and a flip is cheaper
+DIRTY_AREA = 0.5        # scaled: rects covering more of the frame than this -> rescale it all
+BARS = (0, 0, 0)
+
+def parse(spec):
+    """VIBE_DISPLAY string -> (output size or None, set of flags)."""
+    size, flags = None, set()
+    for tok in filter(None, (t.strip().lower() for t in (spec or "").split(","))):
+        if tok in NAMED: size = NAMED[tok]
+        elif "x" in tok and tok.replace("x", "", 1).isdigit():
+            size = tuple(int(v) for v in tok.split("x"))
+        elif tok in ("fs", "int", "smooth", "scaled"): flags.add(tok)
+        else: raise ValueError(f"VIBE_DISPLAY: unknown option {tok!r}")
+    return size, flags
+
+class Display:
+    def __init__(self, size, spec=None):
+        self.size = tuple(size)
+        out, self.flags = parse(os.environ.get("VIBE_DISPLAY", "") if spec is None else spec)
+        fs = pg.FULLSCREEN if "fs" in self.flags else 0
+        if "scaled" in self.flags or (out is None and not fs):
+            self.window = self.surface = pg.display.set_mode(self.size, fs | (pg.SCALED if "scaled" in self.flags else 0))
+            self.scale, self.view = 1, self.surface.get_rect()
+            return
+        if out is None: out = pg.display.get_desktop_sizes()[0]
+        self.window = pg.display.set_mode(out, fs)
+        self.surface = pg.Surface(self.size).convert(self.window)
+        w, h = self.size
+        f = min(out[0]/w, out[1]/h)
+        if "int" in self.flags: f = max(1, int(f))
+        self.scale = f
+        sw, sh = int(w*f), int(h*f)
+        self.view = pg.Rect((out[0]-sw)//2, (out[1]-sh)//2, sw, sh)
+        self.dest = self.window.subsurface(self.view)
+        self.window.fill(BARS)
+        self.bars = True                        # letterbox still to be pushed
+
+    @property
+    def native(self): return self.window is self.surface
+
+    def to_native(self, pos):
+        """Window pixel (e.g. a mouse position) -> surface pixel."""
+        if self.native: return pos
+        return (int((pos[0]-self.view.x)/self.scale), int((pos[1]-self.view.y)/self.scale))
+
+    def present(self, rects=None):
+        """Show the frame: all of it (rects=None) or just the listed rects."""
+        if self.native:
+            if rects is None or len(rects) > DIRTY_MAX: pg.display.flip()
+            else: pg.display.update(rects)
+            return
+        if (rects is None or "int" not in self.flags or self.bars
+                or sum(r[2]*r[3] for r in rects) > DIRTY_AREA*self.size[0]*self.size[1]):
+            if "smooth" in self.flags and "int" not in self.flags:
+                pg.transform.smoothscale(self.surface, self.view.size, self.dest)
+            else:
+                pg.transform.scale(self.surface, self.view.size, self.dest)
+            pg.display.flip()
+            self.bars = False
+            return
+        # integer factor: each native rect maps onto an exact block of output
+        f, ox, oy = self.scale, self.view.x, self.view.y
+        bounds, out = self.surface.get_rect(), []
+        for r in rects:
+            r = bounds.clip(r)
+            if not r.w or not r.h: continue
+            dst = pg.Rect(r.x*f, r.y*f, r.w*f, r.h*f)
+            pg.transform.scale(self.surface.subsurface(r), dst.size, self.dest.subsurface(dst))
+            out.append(dst.move(ox, oy))
+        pg.display.update(out)
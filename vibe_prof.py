@@ -0,0 +1,131 @@
+"""
+Shared per-frame profiler
+-------------------------
+Named timing scopes around the parts of a main loop, one frame() call per
+rendered frame. The last `window` frames feed rolling p50/p95/p99 figures
+for the frame time and each scope. They show up in a small overlay toggled
+with F3, and every frame is kept (up to max_frames) for a trace dump on
+exit. Set VIBE_PROF=trace.csv (or .json) to write the dump.
+
+    from vibe_prof import PROF
+    with PROF("update"): world.step()
+    with PROF("render"): draw(screen)
+    rect = PROF.draw(screen)            # None while the overlay is hidden
+    with PROF("flip"):   pg.display.flip()
+    PROF.frame()
+
+A scope costs two perf_counter() calls. Scopes may nest (collision inside
+update); each is timed on its own, so nested time is counted in both.
+"""
+import atexit, csv, json, os, time
+from array import array
+from collections import deque
+
+SCOPES = ("input", "update", "collision", "render", "audio", "flip", "capture")  # names the games use
+
+class _Scope:
+    __slots__ = ("prof", "name", "t0")
+    def __init__(self, prof, name):
+        self.prof, self.name, self.t0 = prof, name, 0.0
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+    def __exit__(self, *exc):
+        acc = self.prof.acc
+        acc[self.name] = acc.get(self.name, 0.0) + time.perf_counter() - self.t0
+
+def percentile(sorted_ms, q):
+    if not sorted_ms: return 0.0
+    return sorted_ms[min(len(sorted_ms)-1, int(q*len(sorted_ms)))]
+
+class Profiler:
+    def __init__(self, window=600, max_frames=1 << 18):
+        self.window, self.max_frames = window, max_frames
+        self.scopes = {}                    # name -> _Scope (reused every frame)
+        self.acc = {}                       # this frame's seconds per scope
+        self.recent = {}                    # name -> deque of ms, last `window` frames
+        self.trace = {}                     # name -> array('f') of ms, every frame
+        self.frames = 0
+        self.show = False
+        self.panel = self.font = None
+        self.lines = []
+        self.last = time.perf_counter()
+
+    def __call__(self, name):
+        s = self.scopes.get(name)
+        if s is None:
+            s = self.scopes[name] = _Scope(self, name)
+            # a scope first seen late still lines up with earlier frames
+            self.trace[name] = array("f", [0.0])*min(self.frames, self.max_frames)
+            self.recent[name] = deque(maxlen=self.window)
+        return s
+
+    def frame(self):
+        """Close the current frame: its wall time (since the previous call,
+        tick() waits included) and every scope's time go into the history."""
+        now = time.perf_counter()
+        self.acc["frame"] = now - self.last
+        self.last = now
+        if "frame" not in self.scopes: self("frame")
+        keep = self.frames < self.max_frames
+        for name, tr in self.trace.items():
+            ms = self.acc.get(name, 0.0)*1e3
+            self.recent[name].append(ms)
+            if keep: tr.append(ms)
+        self.acc.clear()
+        self.frames += 1
+
+    def percentiles(self, name="frame", qs=(.5, .95, .99)):
+        ms = sorted(self.recent.get(name, ()))
+        return tuple(percentile(ms, q) for q in qs)
+
+    def summary(self):
+        return {name: dict(zip(("p50", "p95", "p99"), self.percentiles(name)))
+                for name in self.recent}
+
+    # -- overlay ---------------------------------------------------------------
+    def toggle(self):
+        self.show = not self.show
+        self.lines = []
+
+    def draw(self, screen, font=None, pos=(8, 40), every=15):
+        """Draw the overlay (refreshed every `every` frames) and return its
+        rect for dirty-rect loops, or None when hidden."""
+        if not self.show: return None
+        import pygame as pg
+        from vibe_text import TEXT
+        if font is None:
+            font = self.font = self.font or pg.font.SysFont("consolas", 14)
+        if not self.lines or self.frames % every == 0:
+            names = ["frame"] + [n for n in self.recent if n != "frame"]
+            self.lines = ["%-9s p50 %6.2f  p95 %6.2f  p99 %6.2f ms" % ((n,) + self.percentiles(n))
+                          for n in names]
+            h = font.get_linesize()
+            w = max(font.size(l)[0] for l in self.lines) + 8
+            if self.panel is None or self.panel.get_size() != (w, h*len(self.lines)+6):
+                self.panel = pg.Surface((w, h*len(self.lines)+6))
+            self.panel.fill((0, 0, 0))
+            for i, l in enumerate(self.lines):
+                self.panel.blit(TEXT.render(font, l, True, (120, 255, 120), (0, 0, 0)), (4, 3+i*h))
+        return screen.blit(self.panel, pos)
+
+    # -- trace dump ------------------------------------------------------------
+    def dump(self, path):
+        """Per-frame trace (ms per scope) as CSV, or as JSON with a percentile
+        summary when path ends in .json."""
+        names = ["frame"] + [n for n in self.trace if n != "frame"]
+        n = min(self.frames, self.max_frames)
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"frames": self.frames, "summary": self.summary(),
+                           "trace": {k: [round(v, 4) for v in self.trace[k][:n]] for k in names}}, f)
+        else:
+            with open(path, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["frame"] + [k + "_ms" for k in names])
+                cols = [self.trace[k] for k in names]
+                for i in range(n):
+                    w.writerow([i] + ["%.4f" % c[i] for c in cols])
+
+PROF = Profiler()
+if os.environ.get("VIBE_PROF"):
+    atexit.register(lambda: PROF.frames and PROF.dump(os.environ["VIBE_PROF"]))
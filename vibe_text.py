@@ -0,0 +1,58 @@
+"""
+Shared text-render cache
+------------------------
+Font rasterization is one of the priciest calls per frame, yet most HUD
+strings repeat frame after frame. TextCache.render() has the same argument
+order as Font.render() (plus the font first) and returns the cached Surface
+for a (font, text, antialias, color, background) key, so constant labels
+rasterize once and counters only when their value changes. LRU-evicted by
+entry count and by total pixel bytes.
+
+    from vibe_text import TEXT
+    screen.blit(TEXT.render(font, f"Score: {score}", True, (255,255,255)), (8,8))
+"""
+from collections import OrderedDict
+
+class TextCache:
+    def __init__(self, max_entries=256, max_bytes=8 << 20):
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.bytes  = 0
+        self.hits   = self.misses = self.evictions = 0
+        self._lru   = OrderedDict()
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, bool(antialias), tuple(color),
+               None if background is None else tuple(background))
+        surf = self._lru.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._lru.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color, background)
+        self._lru[key] = surf
+        self.bytes += _size(surf)
+        while self._lru and (len(self._lru) > self.max_entries or self.bytes > self.max_bytes):
+            _, old = self._lru.popitem(last=False)
+            self.bytes -= _size(old)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._lru.clear(); self.bytes = 0
+
+    def __len__(self): return len(self._lru)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"entries": len(self._lru), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits/total if total else 0.0}
+
+def _size(surf):
+    w, h = surf.get_size()
+    return w * h * surf.get_bytesize()
+
+# one process-wide cache the games share
+TEXT = TextCache()